@@ -2,37 +2,88 @@
 Central configuration for Belief Engine pipeline.
 """
 import os
+import sys
+import bisect
+import functools
+import dataclasses
+from dataclasses import dataclass, field
+from datetime import datetime as _dt
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Tuple
+import fastjsonschema
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (skipped if a parent process already did it).
+# BELIEF_ENGINE_DOTENV_PATH avoids load_dotenv's directory-walking search.
+if not os.environ.get("BELIEF_ENGINE_ENV_LOADED"):
+    load_dotenv(os.environ.get("BELIEF_ENGINE_DOTENV_PATH"), override=False)
+    os.environ["BELIEF_ENGINE_ENV_LOADED"] = "1"
+
+# Bind the environment mapping once; all lookups below go through it
+_ENV = os.environ
 
 # ============================================================================
 # PATHS
 # ============================================================================
 
-PROJECT_ROOT = Path(__file__).parent
-DATA_DIR = PROJECT_ROOT / "data"
-INPUT_DIR = DATA_DIR / "input"
-OUTPUT_DIR = DATA_DIR / "output"
-REGISTRY_DIR = DATA_DIR / "registry"
-CLUSTERS_DIR = DATA_DIR / "clusters"
-CHECKPOINTS_DIR = DATA_DIR / "checkpoints"
-LOGS_DIR = PROJECT_ROOT / "logs"
+PROJECT_ROOT_STR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR_STR = os.path.join(PROJECT_ROOT_STR, "data")
+INPUT_DIR_STR = os.path.join(DATA_DIR_STR, "input")
+OUTPUT_DIR_STR = os.path.join(DATA_DIR_STR, "output")
+REGISTRY_DIR_STR = os.path.join(DATA_DIR_STR, "registry")
+CLUSTERS_DIR_STR = os.path.join(DATA_DIR_STR, "clusters")
+CHECKPOINTS_DIR_STR = os.path.join(DATA_DIR_STR, "checkpoints")
+LOGS_DIR_STR = os.path.join(PROJECT_ROOT_STR, "logs")
+
+# Path objects are built on first access (see __getattr__ below)
+_PATH_STRS: Dict[str, str] = {
+    "PROJECT_ROOT": PROJECT_ROOT_STR,
+    "DATA_DIR": DATA_DIR_STR,
+    "INPUT_DIR": INPUT_DIR_STR,
+    "OUTPUT_DIR": OUTPUT_DIR_STR,
+    "REGISTRY_DIR": REGISTRY_DIR_STR,
+    "CLUSTERS_DIR": CLUSTERS_DIR_STR,
+    "CHECKPOINTS_DIR": CHECKPOINTS_DIR_STR,
+    "LOGS_DIR": LOGS_DIR_STR,
+}
 
-# Create directories if they don't exist
-for dir_path in [DATA_DIR, INPUT_DIR, OUTPUT_DIR, REGISTRY_DIR, CLUSTERS_DIR, CHECKPOINTS_DIR, LOGS_DIR]:
-    dir_path.mkdir(parents=True, exist_ok=True)
+def __getattr__(name: str) -> Path:
+    """Lazily construct (and cache) the Path constants."""
+    try:
+        path_str = _PATH_STRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    path = globals()[name] = Path(path_str)
+    return path
+
+# Create directories if they don't exist (once per process). Ancestors are
+# created top-down and remembered, so shared parents are never re-stat'ed.
+if not getattr(sys.modules[__name__], "_DIRS_READY", False):
+    _seen = {PROJECT_ROOT_STR}  # Holds this file, so it exists
+    for dir_path in _PATH_STRS.values():
+        chain = []
+        while dir_path not in _seen:
+            chain.append(dir_path)
+            parent = os.path.dirname(dir_path)
+            if parent == dir_path:
+                break
+            dir_path = parent
+        for ancestor in reversed(chain):
+            try:
+                os.mkdir(ancestor)
+            except FileExistsError:
+                pass
+            _seen.add(ancestor)
+    del _seen
+    _DIRS_READY = True
 
 # ============================================================================
 # API CONFIGURATION
 # ============================================================================
 
 # OpenAI
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-OPENAI_ORG_ID = os.getenv("OPENAI_ORG_ID", None)
+OPENAI_API_KEY = _ENV.get("OPENAI_API_KEY", "")
+OPENAI_ORG_ID = _ENV.get("OPENAI_ORG_ID", None)
 OPENAI_MODEL = "gpt-4"
 OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
 OPENAI_MAX_TOKENS = 4000
@@ -47,6 +98,10 @@ MIN_CLUSTER_SIZE = 3  # Minimum beliefs per cluster to prevent micro-clusters
 CLUSTERING_DISTANCE_THRESHOLD = 0.3  # Cosine distance threshold for clustering
 CLUSTERING_METHOD = "hierarchical"  # "hierarchical" or "hdbscan"
 SIMILARITY_THRESHOLD_CANONICAL = 0.85  # Threshold for matching to existing canonical belief
+# Embedding-similarity canonicalization (off: one canonical belief per extracted belief)
+SIMILARITY_CANONICALIZATION = _ENV.get("SIMILARITY_CANONICALIZATION", "False").lower() == "true"
+# Registry embedding storage: "float32", "float16" or "int8" (per-vector scale)
+EMBEDDING_DTYPE = _ENV.get("EMBEDDING_DTYPE", "float32")
 
 # ============================================================================
 # CHECKPOINTING CONFIGURATION
@@ -54,6 +109,11 @@ SIMILARITY_THRESHOLD_CANONICAL = 0.85  # Threshold for matching to existing cano
 
 CHECKPOINT_ENABLED = True
 CHECKPOINT_CLEANUP_DAYS = 30  # Clean checkpoints older than N days
+CHECKPOINT_PRETTY = _ENV.get("CHECKPOINT_PRETTY", "False").lower() == "true"  # Indent checkpoint JSON (machine-read; off by default)
+CHECKPOINT_FORMAT = _ENV.get("CHECKPOINT_FORMAT", "json")  # "json" (pipeline appends checkpoints.ndjson), "msgpack" or "pickle" (one file per phase)
+CHECKPOINT_COMPRESSION = _ENV.get("CHECKPOINT_COMPRESSION", "none")  # "none" or "zstd" (one .zst file per phase; needs zstandard)
+# Belief registry: appended entries folded into the JSON snapshot once the log reaches this size
+REGISTRY_COMPACT_EVERY = int(_ENV.get("REGISTRY_COMPACT_EVERY", "50000"))
 
 # Checkpoint phases
 CHECKPOINT_PHASES = [
@@ -75,12 +135,67 @@ QUALITY_THRESHOLDS: Dict[str, int] = {
     # < 60 = F (Failing)
 }
 
+# Ascending thresholds and the grade reached at each, resolved once at import:
+# _GRADE_LETTERS[i] is the grade for a score that reaches exactly i thresholds
+_GRADE_SORTED: Tuple[Tuple[str, int], ...] = tuple(
+    sorted(QUALITY_THRESHOLDS.items(), key=lambda kv: kv[1])
+)
+_GRADE_THRESHOLDS: Tuple[int, ...] = tuple(threshold for _, threshold in _GRADE_SORTED)
+_GRADE_LETTERS: Tuple[str, ...] = ("F",) + tuple(grade for grade, _ in _GRADE_SORTED)
+
+def score_to_grade(score: float) -> str:
+    """
+    Map a quality score (0-100) to its grade (A, B, C, D, F).
+    
+    Args:
+        score: Quality score
+    
+    Returns:
+        Highest grade whose threshold the score reaches, else "F"
+    """
+    return _GRADE_LETTERS[bisect.bisect_right(_GRADE_THRESHOLDS, score)]
+
 # Quality score penalties
 QUALITY_PENALTY_ERROR = 2.0          # Points deducted per error
 QUALITY_PENALTY_RETRY = 0.5          # Points deducted per retry
 QUALITY_PENALTY_MALFORMED = 1.0      # Points deducted per malformed belief
 QUALITY_PENALTY_MISMATCH = 0.5       # Points deducted per registry mismatch
 
+@dataclass(slots=True)
+class QualityMetrics:
+    """
+    Per-episode quality counters (fields only).
+    
+    This is the layout contract for src.utils.quality_scorer.QualityMetrics,
+    which subclasses it to add the recording helpers. Slots keep instances
+    small and attribute updates off the instance dict.
+    """
+    
+    episode_id: str
+    
+    # Error counts
+    errors_count: int = 0
+    parsing_errors: List[str] = field(default_factory=list)
+    api_errors: List[str] = field(default_factory=list)
+    
+    # Retry counts
+    retries_count: int = 0
+    
+    # Malformed data counts
+    malformed_beliefs_count: int = 0
+    
+    # Registry issues
+    registry_mismatches_count: int = 0
+    
+    # Warnings
+    warnings: List[str] = field(default_factory=list)
+    
+    # Timing
+    execution_time_seconds: float = 0.0
+    
+    # Timestamp
+    timestamp: str = field(default_factory=lambda: _dt.now().isoformat())
+
 # ============================================================================
 # RETRY CONFIGURATION
 # ============================================================================
@@ -93,9 +208,10 @@ RETRY_MAX_WAIT = 60       # Maximum wait time in seconds
 # PARALLELIZATION CONFIGURATION
 # ============================================================================
 
-ENABLE_PARALLEL = os.getenv("ENABLE_PARALLEL", "True").lower() == "true"
-MAX_WORKERS = int(os.getenv("MAX_WORKERS", "5"))          # Parallel workers for belief extraction
-BATCH_SIZE = int(os.getenv("BATCH_SIZE", "10"))           # Utterances per batch for API calls
+ENABLE_PARALLEL = _ENV.get("ENABLE_PARALLEL", "True").lower() == "true"
+MAX_WORKERS = int(_ENV.get("MAX_WORKERS", "5"))          # Parallel workers for belief extraction
+BATCH_SIZE = int(_ENV.get("BATCH_SIZE", "10"))           # Utterances per batch for API calls
+MAX_CONCURRENCY = int(_ENV.get("MAX_CONCURRENCY", "20"))  # In-flight OpenAI requests (async extraction)
 EMBEDDING_WORKERS = 3                                      # Parallel workers for embeddings
 MULTI_EPISODE_WORKERS = 2                                  # Process multiple episodes in parallel
 
@@ -107,23 +223,23 @@ API_RATE_LIMIT_TPM = 90000  # Tokens per minute
 # WEIGHTS & BIASES CONFIGURATION
 # ============================================================================
 
-WANDB_ENABLED = os.getenv("WANDB_ENABLED", "True").lower() == "true"
-WANDB_PROJECT = os.getenv("WANDB_PROJECT", "belief-engine")
-WANDB_ENTITY = os.getenv("WANDB_ENTITY", None)  # Your username or team
+WANDB_ENABLED = _ENV.get("WANDB_ENABLED", "True").lower() == "true"
+WANDB_PROJECT = _ENV.get("WANDB_PROJECT", "belief-engine")
+WANDB_ENTITY = _ENV.get("WANDB_ENTITY", None)  # Your username or team
 WANDB_LOG_FREQUENCY = 10  # Log metrics every N beliefs
+# Matrix/ontology files at least this large are logged as file:// reference artifacts instead of being copied into W&B staging
+WANDB_REFERENCE_ARTIFACT_BYTES = int(_ENV.get("WANDB_REFERENCE_ARTIFACT_BYTES", str(16 * 1024 * 1024)))
 
 # W&B run naming
 def get_wandb_run_name(episode_id: str) -> str:
     """Generate W&B run name."""
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"episode_{episode_id}_{timestamp}"
+    return f"episode_{episode_id}_{_dt.now():%Y%m%d_%H%M%S}"
 
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
 
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")  # DEBUG, INFO, WARNING, ERROR, CRITICAL
+LOG_LEVEL = _ENV.get("LOG_LEVEL", "INFO")  # DEBUG, INFO, WARNING, ERROR, CRITICAL
 LOG_TO_FILE = True
 LOG_TO_CONSOLE = True
 LOG_ROTATION = "1 day"  # Rotate logs daily
@@ -155,6 +271,13 @@ TIER_ASSIGNMENT_RULES = {
     "surface": ["q23_surface_opinion", "q24_factual_claim", "q25_prediction", "q26_value_judgment"]
 }
 
+# Inverse index: flag -> tier. Use FLAG_TO_TIER[flag] instead of scanning the rules.
+FLAG_TO_TIER: Dict[str, str] = {
+    flag: tier
+    for tier, flags in TIER_ASSIGNMENT_RULES.items()
+    for flag in flags
+}
+
 # ============================================================================
 # DRIFT DETECTION CONFIGURATION
 # ============================================================================
@@ -180,28 +303,217 @@ AUDIO_BASE_URL = None  # Optional: Base URL for audio files (e.g., "s3://bucket/
 # VALIDATION
 # ============================================================================
 
-def validate_config():
-    """Validate configuration settings."""
+def validate_config() -> Tuple[str, ...]:
+    """
+    Validate configuration settings.
+    
+    Results are memoized on the values being checked, so repeated calls are O(1)
+    until one of them changes.
+    
+    Returns:
+        Tuple of error messages (empty if configuration is valid)
+    """
+    return _config_errors(
+        OPENAI_API_KEY,
+        SETTINGS.wandb_enabled,
+        _ENV.get("WANDB_API_KEY", ""),
+        SETTINGS.min_cluster_size,
+        SETTINGS.max_workers,
+        SETTINGS.batch_size
+    )
+
+# Schema for the validated settings; compiled once at import
+CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "OPENAI_API_KEY": {"type": "string", "minLength": 1},
+        "WANDB_ENABLED": {"type": "boolean"},
+        "WANDB_API_KEY": {"type": "string"},
+        "MIN_CLUSTER_SIZE": {"type": "integer", "minimum": 1},
+        "MAX_WORKERS": {"type": "integer", "minimum": 1},
+        "BATCH_SIZE": {"type": "integer", "minimum": 1},
+    },
+    "required": ["OPENAI_API_KEY"],
+    "if": {"properties": {"WANDB_ENABLED": {"const": True}}},
+    "then": {"properties": {"WANDB_API_KEY": {"minLength": 1}}},
+}
+
+def _property_validator(name: str):
+    """Compile the part of CONFIG_SCHEMA that constrains one property."""
+    schema = {"type": "object", "properties": {name: CONFIG_SCHEMA["properties"][name]}}
+    if name in CONFIG_SCHEMA["required"]:
+        schema["required"] = [name]
+    if name in CONFIG_SCHEMA["then"]["properties"]:
+        schema["if"] = CONFIG_SCHEMA["if"]
+        schema["then"] = CONFIG_SCHEMA["then"]
+    return fastjsonschema.compile(schema)
+
+# One validator per property: a compiled validator stops at its first
+# violation, so checking properties separately reports every problem
+_PROPERTY_VALIDATORS = tuple(
+    (name, _property_validator(name)) for name in CONFIG_SCHEMA["properties"]
+)
+
+# Human-readable message per failing property
+_CONFIG_ERROR_MESSAGES = {
+    "OPENAI_API_KEY": "OPENAI_API_KEY is not set in environment variables",
+    "WANDB_API_KEY": "WANDB_ENABLED is True but WANDB_API_KEY is not set",
+    "MIN_CLUSTER_SIZE": "MIN_CLUSTER_SIZE must be >= 1",
+    "MAX_WORKERS": "MAX_WORKERS must be >= 1",
+    "BATCH_SIZE": "BATCH_SIZE must be >= 1",
+}
+
+@functools.lru_cache(maxsize=1)
+def _config_errors(
+    openai_api_key: str,
+    wandb_enabled: bool,
+    wandb_api_key: str,
+    min_cluster_size: int,
+    max_workers: int,
+    batch_size: int
+) -> Tuple[str, ...]:
+    """Compute configuration errors for a given set of settings."""
+    values = {
+        "OPENAI_API_KEY": openai_api_key,
+        "WANDB_ENABLED": wandb_enabled,
+        "WANDB_API_KEY": wandb_api_key,
+        "MIN_CLUSTER_SIZE": min_cluster_size,
+        "MAX_WORKERS": max_workers,
+        "BATCH_SIZE": batch_size,
+    }
+    
     errors = []
+    for name, validate in _PROPERTY_VALIDATORS:
+        try:
+            validate(values)
+        except fastjsonschema.JsonSchemaException as e:
+            errors.append(_CONFIG_ERROR_MESSAGES.get(name, e.message))
     
-    if not OPENAI_API_KEY:
-        errors.append("OPENAI_API_KEY is not set in environment variables")
+    return tuple(errors)
+
+# ============================================================================
+# SETTINGS
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Immutable snapshot of the scalar settings above.
+    
+    The module-level constants are the import-time defaults. Runtime overrides
+    (e.g. CLI flags) replace the snapshot instead of mutating the module:
+    
+        config.SETTINGS = config.SETTINGS.replace(max_workers=10)
+    
+    Code that honours overrides reads from config.SETTINGS.
+    """
+    
+    # API
+    openai_model: str
+    openai_embedding_model: str
+    openai_max_tokens: int
+    openai_timeout: int
+    openai_temperature: float
+    
+    # Clustering
+    min_cluster_size: int
+    clustering_distance_threshold: float
+    clustering_method: str
+    similarity_threshold_canonical: float
+    similarity_canonicalization: bool
+    embedding_dtype: str
+    
+    # Checkpointing
+    checkpoint_enabled: bool
+    checkpoint_cleanup_days: int
+    checkpoint_pretty: bool
+    checkpoint_format: str
+    checkpoint_compression: str
+    
+    # Quality
+    quality_penalty_error: float
+    quality_penalty_retry: float
+    quality_penalty_malformed: float
+    quality_penalty_mismatch: float
+    
+    # Retry
+    max_retries: int
+    retry_backoff_factor: float
+    retry_max_wait: float
+    
+    # Parallelization
+    enable_parallel: bool
+    max_workers: int
+    batch_size: int
+    max_concurrency: int
+    embedding_workers: int
+    multi_episode_workers: int
+    api_rate_limit_rpm: int
+    api_rate_limit_tpm: int
     
-    if WANDB_ENABLED and not os.getenv("WANDB_API_KEY"):
-        errors.append("WANDB_ENABLED is True but WANDB_API_KEY is not set")
+    # W&B
+    wandb_enabled: bool
+    wandb_project: str
+    wandb_log_frequency: int
+    wandb_reference_artifact_bytes: int
     
-    if MIN_CLUSTER_SIZE < 1:
-        errors.append("MIN_CLUSTER_SIZE must be >= 1")
+    # Logging
+    log_level: str
     
-    if MAX_WORKERS < 1:
-        errors.append("MAX_WORKERS must be >= 1")
+    # Drift
+    drift_conviction_threshold: float
+    drift_frequency_threshold: int
     
-    if BATCH_SIZE < 1:
-        errors.append("BATCH_SIZE must be >= 1")
+    # Contrarian
+    opposition_score_threshold: float
+    contrarian_use_llm_verification: bool
     
-    if errors:
-        error_msg = "Configuration errors:\n" + "\n".join(f"  - {e}" for e in errors)
-        raise ValueError(error_msg)
+    def replace(self, **changes) -> "Settings":
+        """Return a copy with the given fields replaced."""
+        return dataclasses.replace(self, **changes)
+
+SETTINGS = Settings(
+    openai_model=OPENAI_MODEL,
+    openai_embedding_model=OPENAI_EMBEDDING_MODEL,
+    openai_max_tokens=OPENAI_MAX_TOKENS,
+    openai_timeout=OPENAI_TIMEOUT,
+    openai_temperature=OPENAI_TEMPERATURE,
+    min_cluster_size=MIN_CLUSTER_SIZE,
+    clustering_distance_threshold=CLUSTERING_DISTANCE_THRESHOLD,
+    clustering_method=CLUSTERING_METHOD,
+    similarity_threshold_canonical=SIMILARITY_THRESHOLD_CANONICAL,
+    similarity_canonicalization=SIMILARITY_CANONICALIZATION,
+    embedding_dtype=EMBEDDING_DTYPE,
+    checkpoint_enabled=CHECKPOINT_ENABLED,
+    checkpoint_cleanup_days=CHECKPOINT_CLEANUP_DAYS,
+    checkpoint_pretty=CHECKPOINT_PRETTY,
+    checkpoint_format=CHECKPOINT_FORMAT,
+    checkpoint_compression=CHECKPOINT_COMPRESSION,
+    quality_penalty_error=QUALITY_PENALTY_ERROR,
+    quality_penalty_retry=QUALITY_PENALTY_RETRY,
+    quality_penalty_malformed=QUALITY_PENALTY_MALFORMED,
+    quality_penalty_mismatch=QUALITY_PENALTY_MISMATCH,
+    max_retries=MAX_RETRIES,
+    retry_backoff_factor=RETRY_BACKOFF_FACTOR,
+    retry_max_wait=RETRY_MAX_WAIT,
+    enable_parallel=ENABLE_PARALLEL,
+    max_workers=MAX_WORKERS,
+    batch_size=BATCH_SIZE,
+    max_concurrency=MAX_CONCURRENCY,
+    embedding_workers=EMBEDDING_WORKERS,
+    multi_episode_workers=MULTI_EPISODE_WORKERS,
+    api_rate_limit_rpm=API_RATE_LIMIT_RPM,
+    api_rate_limit_tpm=API_RATE_LIMIT_TPM,
+    wandb_enabled=WANDB_ENABLED,
+    wandb_project=WANDB_PROJECT,
+    wandb_log_frequency=WANDB_LOG_FREQUENCY,
+    wandb_reference_artifact_bytes=WANDB_REFERENCE_ARTIFACT_BYTES,
+    log_level=LOG_LEVEL,
+    drift_conviction_threshold=DRIFT_CONVICTION_THRESHOLD,
+    drift_frequency_threshold=DRIFT_FREQUENCY_THRESHOLD,
+    opposition_score_threshold=OPPOSITION_SCORE_THRESHOLD,
+    contrarian_use_llm_verification=CONTRARIAN_USE_LLM_VERIFICATION,
+)
 
 # ============================================================================
 # EXPORT
@@ -211,6 +523,8 @@ __all__ = [
     # Paths
     "PROJECT_ROOT", "DATA_DIR", "INPUT_DIR", "OUTPUT_DIR", "REGISTRY_DIR",
     "CLUSTERS_DIR", "CHECKPOINTS_DIR", "LOGS_DIR",
+    "PROJECT_ROOT_STR", "DATA_DIR_STR", "INPUT_DIR_STR", "OUTPUT_DIR_STR",
+    "REGISTRY_DIR_STR", "CLUSTERS_DIR_STR", "CHECKPOINTS_DIR_STR", "LOGS_DIR_STR",
     
     # API
     "OPENAI_API_KEY", "OPENAI_MODEL", "OPENAI_EMBEDDING_MODEL",
@@ -218,32 +532,34 @@ __all__ = [
     
     # Clustering
     "MIN_CLUSTER_SIZE", "CLUSTERING_DISTANCE_THRESHOLD",
-    "SIMILARITY_THRESHOLD_CANONICAL",
+    "SIMILARITY_THRESHOLD_CANONICAL", "SIMILARITY_CANONICALIZATION", "EMBEDDING_DTYPE",
     
     # Checkpointing
-    "CHECKPOINT_ENABLED", "CHECKPOINT_PHASES", "CHECKPOINT_CLEANUP_DAYS",
+    "CHECKPOINT_ENABLED", "CHECKPOINT_PHASES", "CHECKPOINT_CLEANUP_DAYS", "CHECKPOINT_PRETTY",
+    "CHECKPOINT_FORMAT", "CHECKPOINT_COMPRESSION",
+    "REGISTRY_COMPACT_EVERY",
     
     # Quality
-    "QUALITY_THRESHOLDS", "QUALITY_PENALTY_ERROR", "QUALITY_PENALTY_RETRY",
-    "QUALITY_PENALTY_MALFORMED", "QUALITY_PENALTY_MISMATCH",
+    "QUALITY_THRESHOLDS", "score_to_grade", "QUALITY_PENALTY_ERROR", "QUALITY_PENALTY_RETRY",
+    "QUALITY_PENALTY_MALFORMED", "QUALITY_PENALTY_MISMATCH", "QualityMetrics",
     
     # Retry
     "MAX_RETRIES", "RETRY_BACKOFF_FACTOR", "RETRY_MAX_WAIT",
     
     # Parallelization
-    "ENABLE_PARALLEL", "MAX_WORKERS", "BATCH_SIZE", "EMBEDDING_WORKERS",
+    "ENABLE_PARALLEL", "MAX_WORKERS", "BATCH_SIZE", "MAX_CONCURRENCY", "EMBEDDING_WORKERS",
     "MULTI_EPISODE_WORKERS", "API_RATE_LIMIT_RPM", "API_RATE_LIMIT_TPM",
     
     # W&B
     "WANDB_ENABLED", "WANDB_PROJECT", "WANDB_ENTITY",
-    "WANDB_LOG_FREQUENCY", "get_wandb_run_name",
+    "WANDB_LOG_FREQUENCY", "WANDB_REFERENCE_ARTIFACT_BYTES", "get_wandb_run_name",
     
     # Logging
     "LOG_LEVEL", "LOG_TO_FILE", "LOG_TO_CONSOLE",
     "LOG_ROTATION", "LOG_RETENTION",
     
     # Extraction
-    "EXTRACTION_FLAGS", "TIER_ASSIGNMENT_RULES",
+    "EXTRACTION_FLAGS", "TIER_ASSIGNMENT_RULES", "FLAG_TO_TIER",
     
     # Drift
     "DRIFT_CONVICTION_THRESHOLD", "DRIFT_FREQUENCY_THRESHOLD",
@@ -255,6 +571,9 @@ __all__ = [
     "AUDIO_URI_FORMAT", "AUDIO_BASE_URL",
     
     # Validation
-    "validate_config"
+    "CONFIG_SCHEMA", "validate_config",
+    
+    # Settings
+    "Settings", "SETTINGS"
 ]
 
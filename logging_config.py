@@ -2,13 +2,12 @@
 Centralized logging configuration for Belief Engine.
 """
 import sys
+import functools
+from time import perf_counter
 from pathlib import Path
 from loguru import logger
 import config
 
-# Remove default logger
-logger.remove()
-
 # ============================================================================
 # FORMATTERS
 # ============================================================================
@@ -32,50 +31,88 @@ CONSOLE_FORMAT = (
 STRUCTURED_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level} | {name}:{function}:{line} | {message}"
 
 # ============================================================================
-# CONSOLE HANDLER
+# HANDLERS
 # ============================================================================
 
-if config.LOG_TO_CONSOLE:
-    logger.add(
-        sys.stdout,
-        format=CONSOLE_FORMAT,
-        level=config.LOG_LEVEL,
-        colorize=True,
-        backtrace=True,
-        diagnose=True
-    )
+# Handlers that follow config.LOG_LEVEL (console and per-module files):
+# handler id -> (sink, logger.add options other than level), so set_level()
+# can re-add them. Kept on the logger so re-imports share it.
+if not hasattr(logger, "_belief_engine_level_handlers"):
+    logger._belief_engine_level_handlers = {}
+_LEVEL_HANDLERS = logger._belief_engine_level_handlers
 
-# ============================================================================
-# FILE HANDLERS
-# ============================================================================
+def _add_level_handler(sink, level: str, **options) -> int:
+    """Add a handler that follows the global level and remember how to re-add it."""
+    handler_id = logger.add(sink, level=level, **options)
+    _LEVEL_HANDLERS[handler_id] = (sink, options)
+    return handler_id
 
-if config.LOG_TO_FILE:
-    # Master log (all logs combined)
-    logger.add(
-        config.LOGS_DIR / "master.log",
-        format=FILE_FORMAT,
-        level="DEBUG",  # Capture everything in master log
-        rotation=config.LOG_ROTATION,
-        retention=config.LOG_RETENTION,
-        compression="zip",
-        backtrace=True,
-        diagnose=True
-    )
+def _install_handlers(level: str = None):
+    """
+    Install the console and file handlers.
     
-    # Error log (errors and critical only)
-    logger.add(
-        config.LOGS_DIR / "errors.log",
-        format=FILE_FORMAT,
-        level="ERROR",
-        rotation=config.LOG_ROTATION,
-        retention=config.LOG_RETENTION,
-        compression="zip",
-        backtrace=True,
-        diagnose=True
-    )
+    Handlers are installed once; re-imports (and forked workers that inherit
+    the configured logger) skip the setup. With a level, only the handlers
+    that follow the global level are replaced at that level.
+    """
+    if level is not None:
+        handlers = list(_LEVEL_HANDLERS.items())
+        _LEVEL_HANDLERS.clear()
+        for handler_id, (sink, options) in handlers:
+            logger.remove(handler_id)
+            _add_level_handler(sink, level, **options)
+        return
+    
+    if getattr(logger, "_belief_engine_inited", False):
+        return
     
-    # Per-module logs (created dynamically as needed)
-    # These will be added by individual modules using add_module_logger()
+    # Remove default logger
+    logger.remove()
+    
+    # Console handler
+    if config.LOG_TO_CONSOLE:
+        _add_level_handler(
+            sys.stdout,
+            config.LOG_LEVEL,
+            format=CONSOLE_FORMAT,
+            colorize=sys.stdout.isatty(),  # Skip ANSI markup work when redirected
+            enqueue=config.MULTI_EPISODE_WORKERS > 1,  # Background writer only when needed
+            backtrace=True,
+            diagnose=True
+        )
+    
+    # File handlers
+    if config.LOG_TO_FILE:
+        # Master log (all logs combined)
+        logger.add(
+            config.LOGS_DIR / "master.log",
+            format=FILE_FORMAT,
+            level="DEBUG",  # Capture everything in master log
+            rotation=config.LOG_ROTATION,
+            retention=config.LOG_RETENTION,
+            compression="zip",
+            backtrace=True,
+            diagnose=True
+        )
+        
+        # Error log (errors and critical only)
+        logger.add(
+            config.LOGS_DIR / "errors.log",
+            format=FILE_FORMAT,
+            level="ERROR",
+            rotation=config.LOG_ROTATION,
+            retention=config.LOG_RETENTION,
+            compression="zip",
+            backtrace=True,
+            diagnose=True
+        )
+        
+        # Per-module logs (created dynamically as needed)
+        # These will be added by individual modules using add_module_logger()
+    
+    logger._belief_engine_inited = True
+
+_install_handlers()
 
 # ============================================================================
 # MODULE-SPECIFIC LOGGERS
@@ -86,7 +123,7 @@ def add_module_logger(module_name: str, level: str = None):
     Add a module-specific log file.
     
     Args:
-        module_name: Name of the module (e.g., "ingestion", "beliefs")
+        module_name: Name of the src package (e.g., "ingestion", "beliefs")
         level: Log level for this module (defaults to config.LOG_LEVEL)
     """
     if not config.LOG_TO_FILE:
@@ -95,43 +132,55 @@ def add_module_logger(module_name: str, level: str = None):
     log_level = level or config.LOG_LEVEL
     log_file = config.LOGS_DIR / f"{module_name}.log"
     
-    logger.add(
-        log_file,
+    # loguru matches string filters by module-name prefix without a Python callback
+    name_filter = module_name if module_name.startswith("src.") else f"src.{module_name}"
+    
+    options = dict(
         format=FILE_FORMAT,
-        level=log_level,
         rotation=config.LOG_ROTATION,
         retention=config.LOG_RETENTION,
         compression="zip",
-        filter=lambda record: module_name in record["name"],  # Only log from this module
+        filter=name_filter,  # Only log from this module
         backtrace=True,
         diagnose=True
     )
+    
+    # Only handlers that inherit the global level follow set_level()
+    if level is None:
+        _add_level_handler(log_file, log_level, **options)
+    else:
+        logger.add(log_file, level=log_level, **options)
+
+def set_level(level: str):
+    """
+    Change the level of the console and per-module handlers.
+    
+    Those handlers are removed and re-added at the new level with the same
+    sinks and formats; the master and error logs keep their fixed levels.
+    
+    Args:
+        level: Level name (e.g., "DEBUG", "INFO")
+    """
+    logger.level(level)  # Unknown level names raise before anything is removed
+    _install_handlers(level)
 
 # ============================================================================
 # CONTEXT MANAGER FOR EPISODE LOGGING
 # ============================================================================
 
-class EpisodeLogContext:
+def EpisodeLogContext(episode_id: str):
     """
     Context manager to add episode_id to all log messages.
     
+    Returns loguru's own contextualize manager directly, so entering and
+    exiting costs no extra Python-level dispatch.
+    
     Usage:
         with EpisodeLogContext(episode_id="episode_001"):
             logger.info("Processing episode")
             # Output: ... | episode_id=episode_001 | Processing episode
     """
-    def __init__(self, episode_id: str):
-        self.episode_id = episode_id
-        self.token = None
-    
-    def __enter__(self):
-        self.token = logger.contextualize(episode_id=self.episode_id)
-        self.token.__enter__()
-        return self
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.token:
-            self.token.__exit__(exc_type, exc_val, exc_tb)
+    return logger.contextualize(episode_id=episode_id)
 
 # ============================================================================
 # PERFORMANCE LOGGING
@@ -146,22 +195,25 @@ def log_performance(func):
         def my_function():
             ...
     """
-    import functools
-    import time
+    # Resolved once per decoration; the wrapper reads them as closure cells
+    # instead of global + attribute lookups on every call.
+    name = func.__name__
+    _pc = perf_counter
+    _log = logger
     
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
-        logger.debug(f"Starting {func.__name__}")
+        start_time = _pc()
+        _log.debug(f"Starting {name}")
         
         try:
             result = func(*args, **kwargs)
-            elapsed = time.time() - start_time
-            logger.info(f"Completed {func.__name__} in {elapsed:.2f}s")
+            elapsed = _pc() - start_time
+            _log.info(f"Completed {name} in {elapsed:.2f}s")
             return result
         except Exception as e:
-            elapsed = time.time() - start_time
-            logger.error(f"Failed {func.__name__} after {elapsed:.2f}s: {e}")
+            elapsed = _pc() - start_time
+            _log.error(f"Failed {name} after {elapsed:.2f}s: {e}")
             raise
     
     return wrapper
@@ -181,10 +233,10 @@ def log_api_call(endpoint: str, tokens: int, cost: float, latency: float, succes
         latency: Response time in seconds
         success: Whether call succeeded
     """
-    status = "SUCCESS" if success else "FAILED"
+    # Positional args: loguru formats only if a sink accepts the record
     logger.info(
-        f"API Call [{status}] | endpoint={endpoint} | "
-        f"tokens={tokens} | cost=${cost:.4f} | latency={latency:.2f}s"
+        "API Call [{}] | endpoint={} | tokens={} | cost=${:.4f} | latency={:.2f}s",
+        "SUCCESS" if success else "FAILED", endpoint, tokens, cost, latency
     )
 
 def log_checkpoint(phase: str, episode_id: str, count: int, path: Path):
@@ -198,8 +250,8 @@ def log_checkpoint(phase: str, episode_id: str, count: int, path: Path):
         path: Checkpoint file path
     """
     logger.info(
-        f"Checkpoint saved | phase={phase} | episode_id={episode_id} | "
-        f"count={count} | path={path}"
+        "Checkpoint saved | phase={} | episode_id={} | count={} | path={}",
+        phase, episode_id, count, path
     )
 
 def log_error_with_context(error: Exception, context: dict):
@@ -210,8 +262,13 @@ def log_error_with_context(error: Exception, context: dict):
         error: Exception that occurred
         context: Dictionary with contextual information
     """
-    context_str = " | ".join(f"{k}={v}" for k, v in context.items())
-    logger.error(f"Error: {type(error).__name__}: {error} | {context_str}")
+    # lazy=True defers building the context string until a sink accepts it
+    logger.opt(lazy=True).error(
+        "Error: {}: {} | {}",
+        lambda: type(error).__name__,
+        lambda: error,
+        lambda: " | ".join(f"{k}={v}" for k, v in context.items())
+    )
 
 # ============================================================================
 # INITIALIZATION
@@ -227,9 +284,6 @@ def initialize_logging():
     logger.info(f"File Logging: {config.LOG_TO_FILE}")
     logger.info("=" * 80)
 
-# Initialize on import
-initialize_logging()
-
 # ============================================================================
 # EXPORT
 # ============================================================================
@@ -237,6 +291,7 @@ initialize_logging()
 __all__ = [
     "logger",
     "add_module_logger",
+    "set_level",
     "EpisodeLogContext",
     "log_performance",
     "log_api_call",
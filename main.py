@@ -6,6 +6,7 @@ Usage:
     python main.py --episode matthew_lacroix.txt
     python main.py --episode matthew_lacroix.txt --resume
     python main.py --episode matthew_lacroix.txt --no-wandb --verbose
+    python main.py --episode matthew_lacroix.txt --dry-run
 """
 import sys
 import time
@@ -13,18 +14,12 @@ import argparse
 from pathlib import Path
 from loguru import logger
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add src to path (once; re-imports must not grow sys.path)
+_PROJECT_DIR = str(Path(__file__).parent)
+if _PROJECT_DIR not in sys.path:
+    sys.path.insert(0, _PROJECT_DIR)
 
 import config
-from logging_config import EpisodeLogContext
-import wandb_config
-from src.utils.quality_scorer import QualityScorer
-from src.utils.wandb_logger import WandBLogger
-from src.utils.checkpoint import CheckpointManager, cleanup_old_checkpoints
-from src.ingestion import TranscriptParser
-from src.utterance import UtteranceSplitter
-from src.beliefs import BeliefExtractor, BeliefRegistryManager
 
 def parse_args():
     """Parse command-line arguments."""
@@ -79,10 +74,27 @@ def parse_args():
         help=f"Batch size for processing (default: {config.BATCH_SIZE})"
     )
     
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Validate configuration and exit without running the pipeline"
+    )
+    
     return parser.parse_args()
 
 def run_pipeline(args):
     """Run the belief extraction pipeline."""
+    # Pipeline imports are deferred so --help, argument errors and --dry-run
+    # don't pay for loading the OpenAI SDK, W&B, etc.
+    from logging_config import EpisodeLogContext, set_level
+    import wandb_config
+    from src.utils.quality_scorer import QualityScorer
+    from src.utils.checkpoint import CheckpointManager
+    from src.utils.wandb_logger import WandBLogger
+    from src.ingestion import TranscriptParser
+    from src.utterance import UtteranceSplitter
+    from src.beliefs import BeliefExtractor, BeliefRegistryManager
+    from src.utils.retry import cancel_retries
     
     # Generate episode ID
     transcript_path = Path(args.episode)
@@ -95,17 +107,20 @@ def run_pipeline(args):
     logger.info("="*80)
     
     # Override config if specified
+    overrides = {}
     if args.workers:
-        config.MAX_WORKERS = args.workers
+        overrides["max_workers"] = args.workers
+        overrides["max_concurrency"] = args.workers
     if args.batch_size:
-        config.BATCH_SIZE = args.batch_size
+        overrides["batch_size"] = args.batch_size
     if args.no_checkpoint:
-        config.CHECKPOINT_ENABLED = False
+        overrides["checkpoint_enabled"] = False
     if args.no_wandb:
-        config.WANDB_ENABLED = False
+        overrides["wandb_enabled"] = False
+    if overrides:
+        config.SETTINGS = config.SETTINGS.replace(**overrides)
     if args.verbose:
-        logger.remove()
-        logger.add(sys.stdout, level="DEBUG")
+        set_level("DEBUG")
     
     # Start timer
     start_time = time.time()
@@ -118,7 +133,7 @@ def run_pipeline(args):
     wandb_run = None
     wandb_logger_obj = None
     
-    if config.WANDB_ENABLED:
+    if config.SETTINGS.wandb_enabled:
         wandb_run = wandb_config.initialize_wandb(
             episode_id=episode_id,
             tags=["pipeline-run"]
@@ -126,7 +141,7 @@ def run_pipeline(args):
         wandb_logger_obj = WandBLogger()
     
     try:
-        with EpisodeLogContext(episode_id=episode_id):
+        with EpisodeLogContext(episode_id=episode_id), checkpoint_manager.open_batch() as cp:
             
             # =================================================================
             # STAGE 1: INGESTION
@@ -151,39 +166,36 @@ def run_pipeline(args):
             atomic_utterances = splitter.split(utterances)
             
             # Checkpoint
-            if config.CHECKPOINT_ENABLED:
-                utterances_data = [u.dict() for u in atomic_utterances]
-                checkpoint_manager.save(
-                    "utterances",
-                    utterances_data,
-                    stats={"count": len(atomic_utterances)}
-                )
+            if config.SETTINGS.checkpoint_enabled:
+                cp.write_line({
+                    "phase": "utterances",
+                    "count": len(atomic_utterances),
+                    "data": [u.__dict__ for u in atomic_utterances]
+                })
             
             # =================================================================
             # STAGE 3: BELIEF EXTRACTION
             # =================================================================
             logger.info("STAGE 3: Belief Extraction")
             
-            extractor = BeliefExtractor(
-                quality_scorer=quality_scorer,
-                wandb_logger=wandb_logger_obj
-            )
-            
             # Extract beliefs from first 10 utterances for demo
             # In production, process all utterances
             sample_utterances = atomic_utterances[:10]
             logger.info(f"Processing {len(sample_utterances)} utterances (demo mode)")
             
-            beliefs = extractor.extract(sample_utterances)
+            with BeliefExtractor(
+                quality_scorer=quality_scorer,
+                wandb_logger=wandb_logger_obj
+            ) as extractor:
+                beliefs = extractor.extract(sample_utterances)
             
             # Checkpoint
-            if config.CHECKPOINT_ENABLED:
-                beliefs_data = [b.dict() for b in beliefs]
-                checkpoint_manager.save(
-                    "beliefs_raw",
-                    beliefs_data,
-                    stats={"count": len(beliefs)}
-                )
+            if config.SETTINGS.checkpoint_enabled:
+                cp.write_line({
+                    "phase": "beliefs_raw",
+                    "count": len(beliefs),
+                    "data": beliefs  # Slotted dataclasses; orjson serializes them natively
+                })
             
             # =================================================================
             # STAGE 4: CANONICALIZATION
@@ -196,18 +208,18 @@ def run_pipeline(args):
             canonical_beliefs = registry_manager.canonicalize(beliefs, episode_id)
             
             registry_manager.save()
+            registry_manager.close()
             
             if wandb_logger_obj:
                 wandb_logger_obj.log_canonical_beliefs_created(len(canonical_beliefs))
             
             # Checkpoint
-            if config.CHECKPOINT_ENABLED:
-                canonical_data = [c.dict() for c in canonical_beliefs]
-                checkpoint_manager.save(
-                    "canonical_beliefs",
-                    canonical_data,
-                    stats={"count": len(canonical_beliefs)}
-                )
+            if config.SETTINGS.checkpoint_enabled:
+                cp.write_line({
+                    "phase": "canonical_beliefs",
+                    "count": len(canonical_beliefs),
+                    "data": canonical_beliefs  # Slotted dataclasses; orjson serializes them natively
+                })
             
             # =================================================================
             # PIPELINE COMPLETE
@@ -246,7 +258,9 @@ def run_pipeline(args):
                     config.CHECKPOINTS_DIR / episode_id / "quality_report.json"
                 )
             
-            # Finish W&B
+            # Finish W&B (drain queued metrics first)
+            if wandb_logger_obj:
+                wandb_logger_obj.close()
             if wandb_run:
                 wandb_config.finish_wandb(exit_code=0)
             
@@ -254,12 +268,17 @@ def run_pipeline(args):
             
     except KeyboardInterrupt:
         logger.warning("Pipeline interrupted by user")
+        cancel_retries()
+        if wandb_logger_obj:
+            wandb_logger_obj.close()
         if wandb_run:
             wandb_config.finish_wandb(exit_code=1)
         return 1
         
     except Exception as e:
         logger.error(f"Pipeline failed: {e}", exc_info=True)
+        if wandb_logger_obj:
+            wandb_logger_obj.close()
         if wandb_run:
             wandb_config.log_alert(
                 title="Pipeline Failed",
@@ -272,17 +291,29 @@ def run_pipeline(args):
 def main():
     """Main entry point."""
     try:
-        # Validate configuration
-        config.validate_config()
-        
         # Parse arguments
         args = parse_args()
         
+        # Validate configuration
+        errors = config.validate_config()
+        if errors:
+            raise ValueError(
+                "Configuration errors:\n" + "\n".join(f"  - {e}" for e in errors)
+            )
+        
+        if args.dry_run:
+            logger.info("Dry run: configuration is valid")
+            sys.exit(0)
+        
+        from logging_config import initialize_logging
+        initialize_logging()
+        
         # Run pipeline
         exit_code = run_pipeline(args)
         
         # Cleanup old checkpoints
-        if config.CHECKPOINT_ENABLED:
+        if config.SETTINGS.checkpoint_enabled:
+            from src.utils.checkpoint import cleanup_old_checkpoints
             cleanup_old_checkpoints()
         
         sys.exit(exit_code)
@@ -1,8 +1,28 @@
 """
 Belief extraction module.
+
+Submodules are imported lazily on first attribute access (PEP 562) so that
+importing the package does not pull in the OpenAI SDK and friends.
 """
-from .extractor import BeliefExtractor
-from .registry import BeliefRegistryManager
+import importlib
 
-__all__ = ["BeliefExtractor", "BeliefRegistryManager"]
+_LAZY_ATTRS = {
+    "BeliefExtractor": (".extractor", "BeliefExtractor"),
+    "BeliefRegistryManager": (".registry", "BeliefRegistryManager"),
+}
+
+def __getattr__(name):
+    """Import and cache lazily exported attributes."""
+    try:
+        module_name, attr_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
+    value = getattr(importlib.import_module(module_name, __package__), attr_name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
+
+__all__ = ["BeliefExtractor", "BeliefRegistryManager"]
@@ -2,26 +2,323 @@
 Belief extraction using OpenAI API.
 """
 from typing import List, Dict, Any
-import json
-import uuid
+import asyncio
+import atexit
+import functools
+import itertools
+import os
+import re
+import secrets
+import orjson
 import time
 from loguru import logger
 import openai
 import config
-from src.models import Utterance, Belief
+from src.models import Utterance, Belief, flags_to_mask
 from src.utils.retry import retry_openai_call
-from src.utils.parallel import ParallelExecutor, RateLimiter, batch_items
+from src.utils.parallel import AsyncRateLimiter
 from src.utils.quality_scorer import QualityScorer
 from src.utils.wandb_logger import WandBLogger
 from src.utils.exceptions import BeliefExtractionError
 
+# Belief IDs: per-process random tag + counter (unique without uuid4/urandom per belief)
+_RUN_TAG = secrets.token_hex(4)
+_BELIEF_COUNTER = itertools.count()
+
+# Static extraction instructions. Sent as the system message so every request
+# shares an identical prefix; OpenAI caches prompt prefixes of 1024+ tokens,
+# hence the worked example and the detailed flag definitions.
+_SYSTEM_PROMPT = """You are an expert at extracting beliefs from text.
+
+Extract atomic, declarative beliefs from each utterance in the user message.
+Utterances are numbered [1], [2], ... and must be handled independently.
+
+For each belief, provide:
+1. belief_text: The atomic belief statement (declarative, concise)
+2. confidence: Confidence score 0.0-1.0
+3. original_quote: Direct quote from utterance
+4. extraction_flags: Boolean flags (at least one must be true)
+
+Guidelines:
+- Atomic: one claim per belief. Split compound statements ("X, and therefore Y")
+  into separate beliefs for X and for Y.
+- Declarative: restate the belief as a standalone statement that makes sense
+  without the surrounding conversation. Resolve pronouns where the utterance
+  makes the referent clear.
+- Faithful: do not add claims the speaker did not make, and do not soften or
+  strengthen what they said.
+- Attributed: only extract beliefs the speaker holds. A view the speaker
+  reports in order to reject it is not their belief (its rejection may be).
+- Confidence reflects how clearly the utterance expresses the belief: near 1.0
+  for explicit assertions, lower for hedged, implied or sarcastic statements.
+- original_quote must be copied verbatim from the utterance, not paraphrased.
+
+Extraction Flags:
+- q16_first_principles: Core belief (first principles) - foundational premises
+  the speaker reasons from rather than towards
+- q17_worldview: Worldview belief - how the speaker sees society, history,
+  institutions or people in general
+- q18_moral_framework: Moral/ethical framework - what is right, wrong, owed or
+  forbidden
+- q19_epistemology: How knowledge is acquired - which sources, methods or
+  authorities can be trusted and why
+- q20_ontology: Nature of reality - what exists, what is real, what categories
+  things fall into
+- q21_reasoning_pattern: Reasoning/logic pattern - a characteristic way of
+  drawing conclusions (analogies, inversions, appeals to incentives)
+- q22_assumption: Underlying assumption - something taken for granted rather
+  than argued for
+- q23_surface_opinion: Surface-level opinion - a preference or take on a
+  specific topic without deeper justification
+- q24_factual_claim: Factual claim - an assertion about the world that could,
+  in principle, be checked
+- q25_prediction: Future prediction - an expectation about what will happen
+- q26_value_judgment: Value judgment - an evaluation of something as good,
+  bad, important or worthless
+
+Several flags may be true for the same belief.
+
+Example input:
+[1] Speaker: SPEAKER_A
+Utterance: "Honestly, I think the universities stopped caring about truth. They chase grants now, and in ten years nobody will trust a peer-reviewed paper."
+[2] Speaker: SPEAKER_B
+Utterance: "Wait, so what do you think happens to the journals then? Go on."
+[3] Speaker: SPEAKER_A
+Utterance: "People say the data speaks for itself, but data never interprets itself; someone always chooses what to measure."
+
+Example output:
+{
+  "results": [
+    {
+      "utt_index": 1,
+      "beliefs": [
+        {
+          "belief_text": "Universities no longer prioritize the pursuit of truth",
+          "confidence": 0.85,
+          "original_quote": "I think the universities stopped caring about truth",
+          "extraction_flags": {"q17_worldview": true, "q26_value_judgment": true}
+        },
+        {
+          "belief_text": "Universities are primarily motivated by grant funding",
+          "confidence": 0.9,
+          "original_quote": "They chase grants now",
+          "extraction_flags": {"q21_reasoning_pattern": true, "q24_factual_claim": true}
+        },
+        {
+          "belief_text": "Within ten years the public will not trust peer-reviewed research",
+          "confidence": 0.9,
+          "original_quote": "in ten years nobody will trust a peer-reviewed paper",
+          "extraction_flags": {"q19_epistemology": true, "q25_prediction": true}
+        }
+      ]
+    },
+    {
+      "utt_index": 2,
+      "beliefs": []
+    },
+    {
+      "utt_index": 3,
+      "beliefs": [
+        {
+          "belief_text": "Data does not interpret itself",
+          "confidence": 0.95,
+          "original_quote": "data never interprets itself",
+          "extraction_flags": {"q19_epistemology": true, "q16_first_principles": true}
+        },
+        {
+          "belief_text": "Choosing what to measure always involves human judgment",
+          "confidence": 0.9,
+          "original_quote": "someone always chooses what to measure",
+          "extraction_flags": {"q19_epistemology": true, "q22_assumption": true}
+        }
+      ]
+    }
+  ]
+}
+
+Return JSON format:
+{
+  "results": [
+    {
+      "utt_index": <number of the utterance>,
+      "beliefs": [
+        {
+          "belief_text": "...",
+          "confidence": 0.0-1.0,
+          "original_quote": "...",
+          "extraction_flags": {
+            "q16_first_principles": true/false,
+            ...
+          }
+        }
+      ]
+    }
+  ]
+}
+
+Include one entry per utterance, in order. If an utterance contains no
+beliefs, give it an empty "beliefs" list.
+
+Only extract genuine beliefs, not questions or commands."""
+
+# Pre-filter for utterances that cannot carry a belief: backchannels,
+# questions and short fragments never reach the API
+_NON_BELIEF_RE = re.compile(r'^(yeah|uh huh|mm hmm|right|okay|sure)[.!?]?$', re.I)
+_MIN_BELIEF_WORDS = 5
+
+# Seconds between usage flushes to W&B during extraction
+_USAGE_FLUSH_INTERVAL = 5.0
+
+def _is_probably_non_belief(text: str) -> bool:
+    """Return True for utterances the extraction prompt would reject anyway."""
+    text = text.strip()
+    return (
+        len(text.split()) < _MIN_BELIEF_WORDS
+        or text.endswith('?')
+        or _NON_BELIEF_RE.match(text) is not None
+    )
+
+# Structural bytes the result scanner stops at (outside and inside strings)
+_STRUCTURAL = re.compile(rb'[{}"]')
+_STRING_END = re.compile(rb'["\\]')
+
+class _ResultStream:
+    """
+    Incrementally split a streamed {"results": [{...}, ...]} document.
+    
+    feed() returns each result object (depth-2 JSON object) as soon as its
+    closing brace arrives; consumed bytes are dropped from the buffer.
+    finish() parses whatever the scanner could not split (e.g. an
+    unexpected top-level shape) as one document. `truncated` tells whether
+    the stream stopped inside an object (e.g. cut off by max_tokens).
+    """
+    
+    def __init__(self):
+        self._buf = bytearray()
+        self._pos = 0          # Scan position in _buf
+        self._depth = 0        # Brace depth at _pos
+        self._in_string = False
+        self._start = -1       # Start of the current result object
+        self._emitted = False
+    
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        buf = self._buf
+        buf += text.encode("utf-8")
+        out = []
+        pos = self._pos
+        
+        while True:
+            if self._in_string:
+                m = _STRING_END.search(buf, pos)
+                if m is None:
+                    pos = len(buf)
+                    break
+                if m.group() == b"\\":
+                    if m.end() >= len(buf):
+                        pos = m.start()  # Escaped char not received yet
+                        break
+                    pos = m.end() + 1
+                    continue
+                self._in_string = False
+                pos = m.end()
+                continue
+            
+            m = _STRUCTURAL.search(buf, pos)
+            if m is None:
+                pos = len(buf)
+                break
+            ch = m.group()
+            pos = m.end()
+            if ch == b'"':
+                self._in_string = True
+            elif ch == b"{":
+                self._depth += 1
+                if self._depth == 2:
+                    self._start = m.start()
+            else:
+                self._depth -= 1
+                if self._depth == 1 and self._start >= 0:
+                    out.append(orjson.loads(buf[self._start:pos]))
+                    # Keep the buffer small: drop everything already consumed
+                    del buf[:pos]
+                    pos = 0
+                    self._start = -1
+                    self._emitted = True
+        
+        self._pos = pos
+        return out
+    
+    @property
+    def truncated(self) -> bool:
+        return self._start >= 0 or self._depth > 0
+    
+    def finish(self) -> List[Dict[str, Any]]:
+        # After emitted results, an unterminated tail is reported via `truncated`
+        if self._emitted or not self._buf.strip():
+            return []
+        data = orjson.loads(self._buf)
+        return data.get("results", []) if isinstance(data, dict) else []
+
+@functools.lru_cache(maxsize=1)
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop shared by every extractor in this process."""
+    return asyncio.new_event_loop()
+
+@functools.lru_cache(maxsize=1)
+def _get_client() -> openai.AsyncOpenAI:
+    """Return the process-wide async OpenAI client (aiohttp transport when available)."""
+    try:
+        import httpx  # Only for connection limits; not every openai release depends on it
+    except ImportError:
+        logger.debug("httpx not installed; using the OpenAI SDK's default transport")
+        return openai.AsyncOpenAI(api_key=config.OPENAI_API_KEY)
+    
+    limits = httpx.Limits(max_connections=config.SETTINGS.max_concurrency)
+    try:
+        http_client = openai.DefaultAioHttpClient(limits=limits)
+    except (AttributeError, RuntimeError):
+        # SDK predates the aiohttp transport, or the openai[aiohttp] extra is
+        # not installed; use httpx (a bare client on SDKs without the default one)
+        http_client = getattr(openai, "DefaultAsyncHttpxClient", httpx.AsyncClient)(limits=limits)
+    return openai.AsyncOpenAI(api_key=config.OPENAI_API_KEY, http_client=http_client)
+
+def _close_shared_client():
+    """Close the shared client and its event loop, if they were created."""
+    if _get_loop.cache_info().currsize == 0:
+        return
+    loop = _get_loop()
+    try:
+        if not loop.is_closed():
+            if _get_client.cache_info().currsize:
+                loop.run_until_complete(_get_client().close())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+    finally:
+        _get_client.cache_clear()
+        _get_loop.cache_clear()
+
+def _reset_after_fork():
+    """Drop the parent's client and loop in a forked child; both are rebuilt on demand."""
+    # Sockets and the loop's selector are shared with the parent, so they
+    # must not be reused (or closed) from the child.
+    _get_client.cache_clear()
+    _get_loop.cache_clear()
+
+atexit.register(_close_shared_client)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 class BeliefExtractor:
     """
     Extract beliefs from utterances using OpenAI GPT-4.
     
+    The async client, its connection pool and event loop are shared by all
+    extractors in the process (see _get_client) and closed at interpreter
+    exit; each extractor keeps its own rate limiter.
+    
     Usage:
-        extractor = BeliefExtractor(quality_scorer=scorer, wandb_logger=wb)
-        beliefs = extractor.extract(utterances)
+        with BeliefExtractor(quality_scorer=scorer, wandb_logger=wb) as extractor:
+            beliefs = extractor.extract(utterances)
     """
     
     def __init__(
@@ -38,11 +335,28 @@ class BeliefExtractor:
         """
         self.quality_scorer = quality_scorer
         self.wandb_logger = wandb_logger
-        self.client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
+        # Async connections are bound to the loop that opened them, so the
+        # shared client is always driven on the shared loop.
+        self._loop = _get_loop()
+        self.client = _get_client()
+        self.rate_limiter = AsyncRateLimiter()
+        self._limits_discovered = False
+        # API usage is accumulated per call and forwarded to W&B in bulk
+        self._usage_accumulator = self._empty_usage()
+    
+    def close(self):
+        """Release the extractor; the shared client stays open for other instances."""
+        self.client = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     def extract(self, utterances: List[Utterance]) -> List[Belief]:
         """
-        Extract beliefs from utterances (parallel).
+        Extract beliefs from utterances (concurrent async requests).
         
         Args:
             utterances: List of utterances
@@ -52,26 +366,7 @@ class BeliefExtractor:
         """
         logger.info(f"Extracting beliefs from {len(utterances)} utterances")
         
-        # Batch utterances
-        batches = batch_items(utterances, config.BATCH_SIZE)
-        logger.info(f"Created {len(batches)} batches of size {config.BATCH_SIZE}")
-        
-        # Process batches in parallel with rate limiting
-        rate_limiter = RateLimiter()
-        executor = ParallelExecutor(rate_limiter=rate_limiter)
-        
-        all_beliefs = []
-        
-        if config.ENABLE_PARALLEL:
-            batch_results = executor.map(self._extract_batch, batches)
-            for batch_result in batch_results:
-                if batch_result:
-                    all_beliefs.extend(batch_result)
-        else:
-            for batch in batches:
-                batch_result = self._extract_batch(batch)
-                if batch_result:
-                    all_beliefs.extend(batch_result)
+        all_beliefs = self._loop.run_until_complete(self._extract_all(utterances))
         
         logger.info(f"Extracted {len(all_beliefs)} beliefs total")
         
@@ -80,127 +375,239 @@ class BeliefExtractor:
         
         return all_beliefs
     
-    def _extract_batch(self, utterances: List[Utterance]) -> List[Belief]:
-        """Extract beliefs from a batch of utterances."""
-        beliefs = []
+    async def _extract_all(self, utterances: List[Utterance]) -> List[Belief]:
+        """Run one request per batch of candidate utterances, at most MAX_CONCURRENCY in flight."""
+        candidates = [u for u in utterances if not _is_probably_non_belief(u.text)]
+        skipped = len(utterances) - len(candidates)
+        if skipped:
+            logger.info(f"Skipped {skipped} non-belief utterances before extraction")
+        if self.wandb_logger:
+            self.wandb_logger.log_utterances_skipped(skipped)
+        utterances = candidates
         
-        for utterance in utterances:
-            try:
-                utt_beliefs = self._extract_from_utterance(utterance)
-                beliefs.extend(utt_beliefs)
-                
-            except Exception as e:
-                logger.error(f"Failed to extract from utterance {utterance.id}: {e}")
-                if self.quality_scorer:
-                    self.quality_scorer.metrics.add_api_error(str(e))
+        batch_size = config.SETTINGS.batch_size
+        batches = [utterances[i:i + batch_size] for i in range(0, len(utterances), batch_size)]
+        concurrency = config.SETTINGS.max_concurrency if config.ENABLE_PARALLEL else 1
+        semaphore = asyncio.Semaphore(concurrency)
+        logger.info(
+            f"Created {len(batches)} batches of size {batch_size} | max_concurrency={concurrency}"
+        )
         
-        return beliefs
+        async def run(batch: List[Utterance]) -> List[Belief]:
+            async with semaphore:
+                return await self._extract_batch(batch)
+        
+        if not self._limits_discovered:
+            await self._discover_rate_limits()
+        
+        flusher = asyncio.create_task(self._flush_usage_periodically(_USAGE_FLUSH_INTERVAL))
+        try:
+            tasks = [asyncio.create_task(run(batch)) for batch in batches]
+            results = await asyncio.gather(*tasks)
+        finally:
+            flusher.cancel()
+            self._flush_usage()
+        
+        all_beliefs = []
+        for batch_beliefs in results:
+            all_beliefs.extend(batch_beliefs)
+        return all_beliefs
+    
+    @staticmethod
+    def _empty_usage() -> Dict[str, Any]:
+        return {"tokens": 0, "cached_tokens": 0, "calls": 0, "errors": 0, "latency_sum": 0.0}
+    
+    def _flush_usage(self):
+        """Forward the usage accumulated since the last flush to W&B."""
+        usage = self._usage_accumulator
+        if not usage["calls"]:
+            return
+        self._usage_accumulator = self._empty_usage()
+        
+        if self.wandb_logger:
+            self.wandb_logger.log_api_usage(
+                calls=usage["calls"],
+                tokens=usage["tokens"],
+                cost=self._estimate_cost(usage["tokens"]),
+                latency_avg=usage["latency_sum"] / usage["calls"],
+                errors=usage["errors"],
+                cached_tokens=usage["cached_tokens"]
+            )
+    
+    async def _flush_usage_periodically(self, interval: float):
+        """Flush accumulated usage every `interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            self._flush_usage()
+    
+    async def _extract_batch(self, utterances: List[Utterance]) -> List[Belief]:
+        """
+        Extract beliefs from a batch of utterances in a single request.
+        
+        Batches whose packed prompt would exceed the OPENAI_MAX_TOKENS budget
+        are split in half (recursively). A failed request is recorded as an
+        API error and yields no beliefs.
+        """
+        prompt = self._build_extraction_prompt(utterances)
+        
+        if len(utterances) > 1 and self._estimate_tokens(prompt) > config.OPENAI_MAX_TOKENS:
+            mid = len(utterances) // 2
+            halves = await asyncio.gather(
+                self._extract_batch(utterances[:mid]),
+                self._extract_batch(utterances[mid:])
+            )
+            return halves[0] + halves[1]
+        
+        try:
+            return await self._extract_from_utterances(utterances, prompt)
+            
+        except Exception as e:
+            logger.error(
+                f"Failed to extract from utterances {utterances[0].id}..{utterances[-1].id}: {e}"
+            )
+            if self.quality_scorer:
+                self.quality_scorer.metrics.add_api_error(str(e))
+            return []
+    
+    async def _discover_rate_limits(self):
+        """
+        Seed the rate limiter with the account's real limits.
+        
+        Sends one 1-token request and reads the x-ratelimit-limit-* response
+        headers. Falls back to the configured limits if that fails.
+        """
+        self._limits_discovered = True
+        try:
+            raw = await self.client.chat.completions.with_raw_response.create(
+                model=config.OPENAI_MODEL,
+                messages=[{"role": "user", "content": "ping"}],
+                max_tokens=1
+            )
+            rpm = int(raw.headers.get("x-ratelimit-limit-requests", 0))
+            tpm = int(raw.headers.get("x-ratelimit-limit-tokens", 0))
+        except Exception as e:
+            logger.warning(f"Could not discover API rate limits, using configured values: {e}")
+            return
+        
+        self.rate_limiter.update_limits(rpm=rpm, tpm=tpm)
     
     @retry_openai_call(max_retries=3)
-    def _extract_from_utterance(self, utterance: Utterance) -> List[Belief]:
-        """Extract beliefs from a single utterance."""
-        start_time = time.time()
+    async def _extract_from_utterances(self, utterances: List[Utterance], prompt: str) -> List[Belief]:
+        """Extract beliefs from a packed batch of utterances (one streamed API call)."""
+        # Reserve capacity up front: prompt estimate plus the completion budget
+        await self.rate_limiter.acquire(
+            self._estimate_tokens(_SYSTEM_PROMPT) + self._estimate_tokens(prompt) + config.OPENAI_MAX_TOKENS
+        )
         
-        # Build prompt
-        prompt = self._build_extraction_prompt(utterance)
+        start_time = time.perf_counter()
         
         # Call OpenAI API
         try:
-            response = self.client.chat.completions.create(
+            stream = await self.client.chat.completions.create(
                 model=config.OPENAI_MODEL,
                 messages=[
-                    {"role": "system", "content": "You are an expert at extracting beliefs from text."},
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=config.OPENAI_TEMPERATURE,
                 max_tokens=config.OPENAI_MAX_TOKENS,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                stream=True,
+                stream_options={"include_usage": True}
             )
             
-            latency = time.time() - start_time
-            tokens_used = response.usage.total_tokens
-            cost = self._estimate_cost(tokens_used)
+            # Build beliefs for each result object as soon as it is complete
+            beliefs = []
+            results = _ResultStream()
+            usage = None
+            finish_reason = None
             
-            # Log API call
-            if self.wandb_logger:
-                self.wandb_logger.log_api_call(
-                    tokens=tokens_used,
-                    cost=cost,
-                    latency=latency,
-                    success=True
+            async for chunk in stream:
+                if chunk.usage is not None:
+                    usage = chunk.usage  # Final chunk (no choices)
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                finish_reason = choice.finish_reason or finish_reason
+                delta = choice.delta.content
+                if delta:
+                    for result in results.feed(delta):
+                        beliefs.extend(self._build_beliefs(result, utterances))
+            
+            for result in results.finish():
+                beliefs.extend(self._build_beliefs(result, utterances))
+            
+            if results.truncated or finish_reason == "length":
+                # Results already streamed are kept; the trailing ones are lost
+                error_msg = (
+                    f"Truncated extraction response (finish_reason={finish_reason}) for utterances "
+                    f"{utterances[0].id}..{utterances[-1].id}: trailing results lost"
                 )
+                logger.warning(error_msg)
+                if self.quality_scorer:
+                    self.quality_scorer.metrics.add_api_error(error_msg)
             
-            # Parse response
-            content = response.choices[0].message.content
-            data = json.loads(content)
+            latency = time.perf_counter() - start_time
             
-            # Create Belief objects
-            beliefs = []
-            for belief_data in data.get("beliefs", []):
-                try:
-                    belief = Belief(
-                        id=str(uuid.uuid4()),
-                        utterance_id=utterance.id,
-                        belief_text=belief_data["belief_text"],
-                        confidence=belief_data["confidence"],
-                        original_quote=belief_data.get("original_quote", utterance.text),
-                        extraction_flags=belief_data.get("extraction_flags", {})
-                    )
-                    beliefs.append(belief)
-                except Exception as e:
-                    logger.warning(f"Malformed belief in response: {e}")
-                    if self.quality_scorer:
-                        self.quality_scorer.metrics.add_malformed_belief()
+            # Prompt-prefix cache hits (absent on older models/SDKs)
+            details = getattr(usage, "prompt_tokens_details", None)
+            cached_tokens = (getattr(details, "cached_tokens", 0) or 0) if details else 0
+            
+            # Accumulate usage; _flush_usage forwards it to W&B off the request path
+            accumulator = self._usage_accumulator
+            accumulator["calls"] += 1
+            accumulator["tokens"] += usage.total_tokens if usage is not None else 0
+            accumulator["cached_tokens"] += cached_tokens
+            accumulator["latency_sum"] += latency
             
             return beliefs
             
         except Exception as e:
-            if self.wandb_logger:
-                self.wandb_logger.log_api_call(tokens=0, cost=0, latency=time.time() - start_time, success=False)
+            accumulator = self._usage_accumulator
+            accumulator["calls"] += 1
+            accumulator["errors"] += 1
+            accumulator["latency_sum"] += time.perf_counter() - start_time
             raise
     
-    def _build_extraction_prompt(self, utterance: Utterance) -> str:
-        """Build extraction prompt."""
-        return f"""Extract atomic, declarative beliefs from the following utterance.
-
-Speaker: {utterance.speaker}
-Utterance: "{utterance.text}"
-
-For each belief, provide:
-1. belief_text: The atomic belief statement (declarative, concise)
-2. confidence: Confidence score 0.0-1.0
-3. original_quote: Direct quote from utterance
-4. extraction_flags: Boolean flags (at least one must be true)
-
-Extraction Flags:
-- q16_first_principles: Core belief (first principles)
-- q17_worldview: Worldview belief
-- q18_moral_framework: Moral/ethical framework
-- q19_epistemology: How knowledge is acquired
-- q20_ontology: Nature of reality
-- q21_reasoning_pattern: Reasoning/logic pattern
-- q22_assumption: Underlying assumption
-- q23_surface_opinion: Surface-level opinion
-- q24_factual_claim: Factual claim
-- q25_prediction: Future prediction
-- q26_value_judgment: Value judgment
-
-Return JSON format:
-{{
-  "beliefs": [
-    {{
-      "belief_text": "...",
-      "confidence": 0.0-1.0,
-      "original_quote": "...",
-      "extraction_flags": {{
-        "q16_first_principles": true/false,
-        ...
-      }}
-    }}
-  ]
-}}
-
-Only extract genuine beliefs, not questions or commands."""
+    def _build_beliefs(self, result: Dict[str, Any], utterances: List[Utterance]) -> List[Belief]:
+        """Create Belief objects for one result, mapping utt_index (1-based) back to utterances."""
+        utt_index = result.get("utt_index")
+        if not isinstance(utt_index, int) or not 1 <= utt_index <= len(utterances):
+            logger.warning(f"Result with invalid utt_index in response: {utt_index!r}")
+            if self.quality_scorer:
+                self.quality_scorer.metrics.add_malformed_belief()
+            return []
+        
+        utterance = utterances[utt_index - 1]
+        beliefs = []
+        for belief_data in result.get("beliefs", []):
+            try:
+                belief = Belief(
+                    id=f"bel_{_RUN_TAG}_{next(_BELIEF_COUNTER):08x}",
+                    utterance_id=utterance.id,
+                    belief_text=belief_data["belief_text"],
+                    confidence=belief_data["confidence"],
+                    original_quote=belief_data.get("original_quote", utterance.text),
+                    flags_mask=flags_to_mask(belief_data.get("extraction_flags", {}))
+                )
+                beliefs.append(belief)
+            except Exception as e:
+                logger.warning(f"Malformed belief in response: {e}")
+                if self.quality_scorer:
+                    self.quality_scorer.metrics.add_malformed_belief()
+        
+        return beliefs
+    
+    def _build_extraction_prompt(self, utterances: List[Utterance]) -> str:
+        """Build the packed user message, one numbered entry per utterance."""
+        return "\n".join(
+            f'[{i}] Speaker: {utterance.speaker}\nUtterance: "{utterance.text}"'
+            for i, utterance in enumerate(utterances, 1)
+        )
+    
+    def _estimate_tokens(self, text: str) -> int:
+        """Estimate token count (rough approximation: ~4 characters per token)."""
+        return len(text) // 4
     
     def _estimate_cost(self, tokens: int) -> float:
         """Estimate API cost (rough approximation)."""
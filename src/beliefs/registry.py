@@ -1,59 +1,363 @@
 """
 Belief registry manager for deduplication.
 """
-from typing import List
-import json
+from typing import List, Dict, Any, Optional, Tuple
+import hashlib
+import os
+import numpy as np
+import openai
+import orjson
 from pathlib import Path
 from loguru import logger
 import config
 from src.models import Belief, CanonicalBelief, BeliefRegistry
-import uuid
+from src.utils.retry import retry_openai_call
+import itertools
+import secrets
+
+# Canonical IDs: per-process random tag + counter (unique without uuid4/urandom per belief)
+_RUN_TAG = secrets.token_hex(4)
+_CANONICAL_COUNTER = itertools.count()
+
+# Maximum inputs per embeddings request (API limit)
+_EMBEDDING_BATCH_SIZE = 2048
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding cache persisted as one float16 .npz file.
+    
+    Keys are 16-byte blake2b digests of the embedded text, so recurring
+    belief texts (re-runs, overlapping episodes) are embedded once. The
+    file records the embedding model and is ignored if the model changes.
+    
+    Usage:
+        cache = EmbeddingCache(config.REGISTRY_DIR / "embeddings_cache.npz")
+        cache.load()
+        hits, misses = cache.get_many(texts)
+        cache.put_many([texts[i] for i in misses], vectors)
+        cache.save()
+    """
+    
+    def __init__(self, path: Path, model: str = None):
+        """
+        Initialize embedding cache.
+        
+        Args:
+            path: .npz file backing the cache
+            model: Embedding model the vectors come from
+        """
+        self.path = path
+        self.model = model or config.OPENAI_EMBEDDING_MODEL
+        self._index: Dict[bytes, int] = {}
+        self._vectors = np.empty((0, 0), dtype=np.float16)
+        self._new_keys: List[bytes] = []
+        self._new_vectors: List[np.ndarray] = []
+    
+    @staticmethod
+    def key(text: str) -> bytes:
+        """Cache key for a text."""
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    def load(self):
+        """Load cached vectors from disk."""
+        if not self.path.exists():
+            return
+        try:
+            with np.load(self.path) as data:
+                if str(data["model"]) != self.model:
+                    logger.info(f"Embedding cache is for model {data['model']}; starting fresh")
+                    return
+                keys = data["keys"]
+                vectors = data["vectors"]
+        except Exception as e:
+            logger.warning(f"Failed to load embedding cache: {e}. Starting fresh.")
+            return
+        if keys.dtype.kind == "S":
+            # Older caches stored keys as S16, which drops trailing NULs;
+            # re-padding restores the digest
+            keys = [key.ljust(16, b"\0") for key in keys.tolist()]
+        else:
+            raw = keys.tobytes()
+            keys = [raw[i:i + 16] for i in range(0, len(raw), 16)]
+        
+        index: Dict[bytes, int] = {}
+        for i, key in enumerate(keys):
+            index.setdefault(key, i)
+        if len(index) < len(keys):
+            # Older caches re-saved truncated keys next to their full form
+            vectors = vectors[list(index.values())]
+            index = {key: i for i, key in enumerate(index)}
+        self._index = index
+        self._vectors = vectors
+        logger.info(f"Embedding cache loaded | vectors={len(self._index)}")
+    
+    def get_many(self, texts: List[str]) -> Tuple[Dict[int, np.ndarray], List[int]]:
+        """
+        Look up texts.
+        
+        Returns:
+            Tuple of (position → float32 vector for hits, positions of misses)
+        """
+        self._consolidate()
+        hits = {}
+        misses = []
+        for i, text in enumerate(texts):
+            row = self._index.get(self.key(text))
+            if row is None:
+                misses.append(i)
+            else:
+                hits[i] = self._vectors[row].astype(np.float32)
+        return hits, misses
+    
+    def put_many(self, texts: List[str], vectors: np.ndarray):
+        """Add vectors for texts (stored as float16)."""
+        for text, vector in zip(texts, vectors):
+            key = self.key(text)
+            if key in self._index:
+                continue
+            self._index[key] = len(self._index)
+            self._new_keys.append(key)
+            self._new_vectors.append(np.asarray(vector, dtype=np.float16))
+    
+    def _consolidate(self):
+        """Fold vectors added since the last lookup into the stacked array."""
+        if not self._new_vectors:
+            return
+        rows = np.stack(self._new_vectors)
+        self._vectors = rows if not len(self._vectors) else np.vstack([self._vectors, rows])
+        self._new_vectors = []
+    
+    def save(self):
+        """Write the cache to disk if vectors were added since it was loaded."""
+        if not self._new_keys:
+            return
+        self._consolidate()
+        keys = [None] * len(self._index)
+        for key, row in self._index.items():
+            keys[row] = key
+        
+        tmp_path = self.path.with_suffix(".npz.tmp")
+        with open(tmp_path, "wb") as f:
+            # One uint8 row per digest: the S dtype would strip trailing NUL bytes
+            key_rows = np.frombuffer(b"".join(keys), dtype=np.uint8).reshape(-1, 16)
+            np.savez(f, model=np.array(self.model), keys=key_rows, vectors=self._vectors)
+        os.replace(tmp_path, self.path)
+        self._new_keys = []
+        logger.info(f"Embedding cache saved | vectors={len(self._index)}")
 
 class BeliefRegistryManager:
     """
     Manage global belief registry.
     
+    Persistence is a JSON snapshot plus an append-only JSONL log: each
+    canonical belief is appended as it is created, and save() folds the
+    log into the snapshot once it reaches config.REGISTRY_COMPACT_EVERY
+    entries. Each compaction bumps a generation stored in the snapshot and
+    in the log's header line, so a log the snapshot already contains (a
+    crash between the two writes) is never replayed twice.
+    
     Usage:
         manager = BeliefRegistryManager()
         manager.load()
         canonical_beliefs = manager.canonicalize(beliefs, episode_id)
         manager.save()
+        manager.close()
     """
     
     def __init__(self):
         """Initialize registry manager."""
         self.registry = BeliefRegistry()
+        self.registry.set_embedding_dtype(config.SETTINGS.embedding_dtype)
         self.registry_path = config.REGISTRY_DIR / "belief_registry.json"
+        self.log_path = config.REGISTRY_DIR / "belief_registry.jsonl"
+        # Canonical-belief embedding matrix, saved beside the snapshot at compaction
+        self.embeddings_path = config.REGISTRY_DIR / "belief_registry_embeddings.npz"
+        # Unbuffered: every appended batch reaches the OS in a single write
+        self._jsonl_fh = open(self.log_path, "ab", buffering=0)
+        self._log_entries = 0
+        # Compactions folded into the snapshot; a log from an older one is stale
+        self._generation = 0
+        
+        self._client = None
+        self.embedding_cache = EmbeddingCache(config.REGISTRY_DIR / "embeddings_cache.npz")
     
     def load(self):
-        """Load registry from disk."""
+        """Load the registry snapshot from disk, then replay the append log."""
         if self.registry_path.exists():
             try:
-                with open(self.registry_path, "r") as f:
-                    data = json.load(f)
-                    self.registry = BeliefRegistry(**data)
-                logger.info(f"Registry loaded | beliefs={len(self.registry.canonical_beliefs)}")
+                data = orjson.loads(self.registry_path.read_bytes())
+                # Snapshots from before the embedding matrix kept vectors inline
+                legacy_embeddings = data.pop("embeddings_cache", None) or {}
+                self._generation = data.pop("log_generation", 0)
+                # Our own snapshot, validated when it was built: skip re-validation
+                self.registry = BeliefRegistry.model_construct(**data)
+                self.registry.set_embedding_dtype(config.SETTINGS.embedding_dtype)
+                self.registry.load_embeddings(list(legacy_embeddings), np.asarray(list(legacy_embeddings.values())))
+                self._load_embedding_matrix()
             except Exception as e:
                 logger.warning(f"Failed to load registry: {e}. Starting fresh.")
         else:
             logger.info("No existing registry found. Starting fresh.")
+        
+        self._log_entries = self._replay_log()
+        if config.SETTINGS.similarity_canonicalization:
+            self.embedding_cache.load()
+        logger.info(
+            f"Registry loaded | beliefs={len(self.registry.canonical_beliefs)} | "
+            f"replayed={self._log_entries}"
+        )
     
-    def save(self):
-        """Save registry to disk."""
+    def _replay_log(self) -> int:
+        """Apply entries appended since the last compaction; returns the count."""
+        replayed = 0
+        valid_end = 0
+        with open(self.log_path, "rb") as f:
+            for line in f:
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # Torn final write from an interrupted run
+                    logger.warning(f"Skipping malformed registry log entry in {self.log_path}")
+                    continue
+                if "log_generation" in entry:
+                    # Header line, written when the log was last truncated
+                    if entry["log_generation"] < self._generation:
+                        break
+                    valid_end = f.tell()
+                    continue
+                if self._generation and not valid_end:
+                    # No header: the log predates the snapshot's compaction
+                    break
+                self._apply_log_entry(entry)
+                replayed += 1
+                valid_end = f.tell()
+            else:
+                if self._generation and not valid_end:
+                    # Empty, or only a torn header: rewrite it before appending
+                    self._reset_log()
+                elif valid_end < self.log_path.stat().st_size:
+                    # Drop a torn tail so the next append starts on a fresh line
+                    self._jsonl_fh.truncate(valid_end)
+                return replayed
+        
+        # Crashed after swapping in the snapshot, before truncating the log:
+        # every entry is already in the snapshot
+        logger.warning(f"Registry log {self.log_path} is already compacted into the snapshot; discarding it")
+        self._reset_log()
+        return 0
+    
+    def _reset_log(self):
+        """Empty the log and start it with the current generation's header."""
+        self._jsonl_fh.truncate(0)
+        self._jsonl_fh.write(orjson.dumps({"log_generation": self._generation}) + b"\n")
+    
+    def _apply_log_entry(self, entry: Dict[str, Any]):
+        """Apply one log record: a merge into an existing canonical belief, or a new one."""
+        if "merge_into" in entry:
+            self.registry.merge_beliefs(
+                belief_id=entry["merge_into"],
+                raw_belief_ids=entry["raw_belief_ids"],
+                episode_id=entry["episode_id"]
+            )
+        else:
+            self.registry.add_canonical_belief(**entry)
+    
+    def _load_embedding_matrix(self):
+        """Load the canonical-belief embedding matrix saved at the last compaction."""
+        if not self.embeddings_path.exists():
+            return
+        with np.load(self.embeddings_path) as data:
+            scales = data["scales"] if "scales" in data.files else None
+            self.registry.load_embeddings(data["ids"].tolist(), data["matrix"], scales)
+    
+    def _save_embedding_matrix(self):
+        """Write the canonical-belief embedding matrix (atomic replace)."""
+        tmp_path = self.embeddings_path.with_suffix(".npz.tmp")
+        matrix, scales = self.registry.embedding_storage()
+        arrays = {"ids": np.array(self.registry.embedding_ids, dtype=str), "matrix": matrix}
+        if scales is not None:
+            arrays["scales"] = scales
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, self.embeddings_path)
+    
+    def append_canonical(self, canonical: CanonicalBelief):
+        """Add one canonical belief to the registry and append it to the log."""
+        entry = self._log_entry(canonical)
+        self.registry.add_canonical_belief(**entry)
+        self._append_entries([entry])
+    
+    @staticmethod
+    def _log_entry(canonical: CanonicalBelief) -> Dict[str, Any]:
+        """Log record for a canonical belief (add_canonical_belief keyword arguments)."""
+        return {
+            "belief_id": canonical.id,
+            "canonical_text": canonical.canonical_text,
+            "raw_belief_ids": list(canonical.belief_ids),
+            "episode_id": canonical.last_seen_episode
+        }
+    
+    def _append_entries(self, entries: List[Dict[str, Any]]):
+        """Append log records in one write."""
+        if entries:
+            self._jsonl_fh.write(b"".join(orjson.dumps(entry) + b"\n" for entry in entries))
+            self._log_entries += len(entries)
+    
+    def save(self, compact: bool = False):
+        """
+        Persist the registry.
+        
+        Appended entries are already on disk, so this only rewrites the
+        snapshot when the log is due for compaction (or compact=True).
+        
+        Args:
+            compact: Force a full snapshot rewrite
+        """
+        if not compact and self._log_entries < config.REGISTRY_COMPACT_EVERY:
+            logger.info(f"Registry saved | pending_log_entries={self._log_entries}")
+            return
+        
         try:
-            with open(self.registry_path, "w") as f:
-                json.dump(self.registry.dict(), f, indent=2)
-            logger.info("Registry saved")
+            # Write the snapshot beside the old one and swap it in, then
+            # truncate the log it now contains. The new generation marks the
+            # old log as stale if we crash before the truncate.
+            self._save_embedding_matrix()
+            generation = self._generation + 1
+            snapshot = self.registry.model_dump()
+            snapshot["log_generation"] = generation
+            tmp_path = self.registry_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(orjson.dumps(snapshot))
+            os.replace(tmp_path, self.registry_path)
+            self._generation = generation
+            self._reset_log()
+            self._log_entries = 0
+            logger.info("Registry saved | compacted")
+            self.embedding_cache.save()
         except Exception as e:
             logger.error(f"Failed to save registry: {e}")
     
+    def close(self):
+        """Close the append log and write any new cached embeddings."""
+        self._jsonl_fh.close()
+        try:
+            self.embedding_cache.save()
+        except Exception as e:
+            logger.error(f"Failed to save embedding cache: {e}")
+    
     def canonicalize(
         self,
         beliefs: List[Belief],
         episode_id: str
     ) -> List[CanonicalBelief]:
         """
-        Canonicalize beliefs (simplified version).
+        Canonicalize beliefs.
+        
+        With config.SIMILARITY_CANONICALIZATION enabled, beliefs are merged
+        into existing canonical beliefs by exact text or embedding
+        similarity; otherwise each belief becomes its own canonical belief.
         
         Args:
             beliefs: List of beliefs
@@ -64,14 +368,25 @@ class BeliefRegistryManager:
         """
         logger.info(f"Canonicalizing {len(beliefs)} beliefs")
         
-        canonical_beliefs = []
+        if config.SETTINGS.similarity_canonicalization and beliefs:
+            canonical_beliefs = self._canonicalize_by_similarity(beliefs, episode_id)
+        else:
+            canonical_beliefs = self._canonicalize_one_to_one(beliefs, episode_id)
         
-        for belief in beliefs:
-            # Simplified: create one canonical belief per belief
-            # In full version, this would do similarity matching
-            canonical_id = str(uuid.uuid4())
-            
-            canonical = CanonicalBelief(
+        logger.info(f"Created {len(canonical_beliefs)} canonical beliefs")
+        
+        return canonical_beliefs
+    
+    def _canonicalize_one_to_one(
+        self,
+        beliefs: List[Belief],
+        episode_id: str
+    ) -> List[CanonicalBelief]:
+        """Create one canonical belief per belief."""
+        ids = [f"can_{_RUN_TAG}_{next(_CANONICAL_COUNTER):08x}" for _ in beliefs]
+        
+        canonical_beliefs = [
+            CanonicalBelief(
                 id=canonical_id,
                 canonical_text=belief.belief_text,
                 belief_ids=[belief.id],
@@ -80,18 +395,156 @@ class BeliefRegistryManager:
                 first_seen_episode=episode_id,
                 last_seen_episode=episode_id
             )
+            for canonical_id, belief in zip(ids, beliefs)
+        ]
+        
+        # Add to registry in one pass and append to the log in one write
+        self.registry.bulk_add_canonical(
+            ids=ids,
+            texts=[belief.belief_text for belief in beliefs],
+            raw_belief_ids_list=[[belief.id] for belief in beliefs],
+            episode_id=episode_id
+        )
+        self._append_entries([self._log_entry(canonical) for canonical in canonical_beliefs])
+        
+        return canonical_beliefs
+    
+    def _canonicalize_by_similarity(
+        self,
+        beliefs: List[Belief],
+        episode_id: str
+    ) -> List[CanonicalBelief]:
+        """
+        Merge beliefs into canonical beliefs by exact text, then embedding similarity.
+        
+        Beliefs without an alias match are embedded in one batched request
+        and compared with every canonical embedding in a single matrix
+        product. Rows below the threshold become new canonical beliefs,
+        with near-duplicates inside the batch sharing one.
+        """
+        texts = [belief.belief_text for belief in beliefs]
+        threshold = config.SETTINGS.similarity_threshold_canonical
+        
+        # 1. Exact alias matches
+        assigned: List[Optional[str]] = [self.registry.find_by_text(text) for text in texts]
+        pending = [i for i, canonical_id in enumerate(assigned) if canonical_id is None]
+        
+        # 2. Similarity against the registry
+        embeddings = None
+        if pending:
+            try:
+                embeddings = self._embed([texts[i] for i in pending])
+            except Exception as e:
+                logger.error(f"Embedding failed, skipping similarity matching: {e}")
+        
+        if embeddings is not None and self.registry.embedding_dim == embeddings.shape[1]:
+            matches, scores = self.registry.similarity_search(embeddings, top_k=1)
+            for k in np.flatnonzero(scores[:, 0] >= threshold):
+                assigned[pending[k]] = matches[k][0]
+        
+        # 3. New canonical beliefs; near-duplicates within the batch follow their leader
+        rest = [k for k, i in enumerate(pending) if assigned[i] is None]
+        new_embeddings: Dict[str, np.ndarray] = {}
+        if rest:
+            leader_of = np.full(len(rest), -1)
+            if embeddings is not None:
+                sub = embeddings[rest]
+                close = (sub @ sub.T) >= threshold
+            for a in range(len(rest)):
+                if leader_of[a] >= 0:
+                    continue
+                if embeddings is not None:
+                    leader_of[np.flatnonzero(close[a] & (leader_of < 0))] = a
+                else:
+                    leader_of[a] = a
+                canonical_id = f"can_{_RUN_TAG}_{next(_CANONICAL_COUNTER):08x}"
+                if embeddings is not None:
+                    new_embeddings[canonical_id] = sub[a]
+                for b in np.flatnonzero(leader_of == a):
+                    assigned[pending[rest[b]]] = canonical_id
+        
+        # Group beliefs by canonical belief, in first-seen order
+        groups: Dict[str, List[Belief]] = {}
+        for belief, canonical_id in zip(beliefs, assigned):
+            groups.setdefault(canonical_id, []).append(belief)
+        
+        entries = []
+        canonical_beliefs = []
+        created = 0
+        for canonical_id, members in groups.items():
+            raw_belief_ids = [belief.id for belief in members]
+            if canonical_id in self.registry.canonical_beliefs:
+                entry = {
+                    "merge_into": canonical_id,
+                    "raw_belief_ids": raw_belief_ids,
+                    "episode_id": episode_id
+                }
+            else:
+                created += 1
+                embedding = new_embeddings.get(canonical_id)
+                entry = {
+                    "belief_id": canonical_id,
+                    "canonical_text": members[0].belief_text,
+                    "raw_belief_ids": list(raw_belief_ids),
+                    "episode_id": episode_id,
+                    "embedding": embedding.tolist() if embedding is not None else None
+                }
+            self._apply_log_entry(entry)
+            entries.append(entry)
             
-            canonical_beliefs.append(canonical)
-            
-            # Add to registry
-            self.registry.add_canonical_belief(
-                belief_id=canonical_id,
-                canonical_text=belief.belief_text,
-                raw_belief_ids=[belief.id],
-                episode_id=episode_id
-            )
+            canonical_beliefs.append(CanonicalBelief(
+                id=canonical_id,
+                canonical_text=self.registry.canonical_beliefs[canonical_id]["canonical_text"],
+                belief_ids=raw_belief_ids,
+                source_utterance_ids=[belief.utterance_id for belief in members],
+                example_quotes=[belief.original_quote for belief in members],
+                first_seen_episode=self.registry.episode_history[canonical_id][0],
+                last_seen_episode=episode_id
+            ))
         
-        logger.info(f"Created {len(canonical_beliefs)} canonical beliefs")
+        self._append_entries(entries)
+        
+        logger.info(
+            f"Similarity canonicalization | beliefs={len(beliefs)} | "
+            f"canonical={len(groups)} | new={created}"
+        )
         
         return canonical_beliefs
+    
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts, requesting only those missing from the embedding cache.
+        
+        Returns:
+            Unit-normalized float32 rows, one per text
+        """
+        hits, misses = self.embedding_cache.get_many(texts)
+        
+        vectors = []
+        miss_texts = [texts[i] for i in misses]
+        for start in range(0, len(miss_texts), _EMBEDDING_BATCH_SIZE):
+            response = self._create_embeddings(miss_texts[start:start + _EMBEDDING_BATCH_SIZE])
+            vectors.extend(item.embedding for item in response.data)
+        
+        if misses:
+            fetched = np.asarray(vectors, dtype=np.float32)
+            self.embedding_cache.put_many(miss_texts, fetched)
+            hits.update(zip(misses, fetched))
+        logger.debug(f"Embeddings | cached={len(texts) - len(misses)} | requested={len(misses)}")
+        
+        return _normalize_rows(np.stack([hits[i] for i in range(len(texts))]))
+    
+    @retry_openai_call(max_retries=3)
+    def _create_embeddings(self, texts: List[str]):
+        """One embeddings API call."""
+        if self._client is None:
+            self._client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
+        return self._client.embeddings.create(
+            input=texts,
+            model=config.OPENAI_EMBEDDING_MODEL
+        )
 
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length so dot products are cosine similarities."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
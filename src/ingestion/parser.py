@@ -1,8 +1,12 @@
 """
 Transcript parser for diarized transcript files.
 """
+import os
+import re
+import sys
+import mmap
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from loguru import logger
 from src.models import Episode, Utterance
 from src.utils.validators import validate_transcript_line, validate_episode_id
@@ -11,6 +15,18 @@ from src.utils.quality_scorer import QualityScorer
 import uuid
 from datetime import datetime
 
+# One well-formed transcript line: SPEAKER | HH:MM:SS | HH:MM:SS | text,
+# with in-range timestamps and non-empty speaker/text. Anything else (and
+# start >= end) is left to validate_transcript_line for the error message.
+_TIMESTAMP = rb"(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d"
+_LINE_RE = re.compile(
+    rb"(?m)^[ \t]*([^|\n]*[^|\s])[ \t]*\|[ \t]*(" + _TIMESTAMP + rb")[ \t]*\|"
+    rb"[ \t]*(" + _TIMESTAMP + rb")[ \t]*\|[ \t]*([^|\n]*[^|\s])[ \t\r]*$"
+)
+
+# A \r not followed by \n: a line break under universal newlines
+_LONE_CR_RE = re.compile(rb"\r(?!\n)")
+
 class TranscriptParser:
     """
     Parse diarized transcript files.
@@ -56,6 +72,10 @@ class TranscriptParser:
         # Validate episode ID
         validate_episode_id(episode_id)
         
+        # Every utterance shares one episode_id string and one string per speaker
+        episode_id = sys.intern(episode_id)
+        speaker_cache: Dict[bytes, str] = {}
+        
         # Check file exists
         path = Path(transcript_path)
         if not path.exists():
@@ -66,41 +86,59 @@ class TranscriptParser:
         line_num = 0
         
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line_num += 1
-                    line = line.strip()
+            with open(path, "rb") as f:
+                # mmap keeps memory flat regardless of file size. (Zero-length
+                # files cannot be mapped.)
+                size = os.fstat(f.fileno()).st_size
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+                
+                try:
+                    # Universal newlines, as the text-mode reader had: a lone \r
+                    # also ends a line. Only such files are copied and
+                    # normalized; \n and \r\n files are scanned in place.
+                    data = mm
+                    if _LONE_CR_RE.search(mm):
+                        data = _LONE_CR_RE.sub(b"\n", mm)
+                        size = len(data)
                     
-                    # Skip empty lines
-                    if not line:
-                        continue
-                    
-                    try:
-                        # Parse line
-                        speaker, start_time, end_time, text = validate_transcript_line(line)
+                    # Well-formed lines come straight from one regex sweep; the
+                    # lines between matches go through the validator so errors
+                    # are reported exactly as before.
+                    pos = 0
+                    for m in _LINE_RE.finditer(data):
+                        line_num = self._parse_unmatched(data[pos:m.start()], line_num, episode_id, utterances)
+                        line_num += 1
+                        pos = m.end() + 1
+                        
+                        raw_speaker, start_time, end_time, text = m.groups()
+                        if start_time >= end_time:
+                            # Zero-padded HH:MM:SS compares chronologically
+                            self._parse_line(m.group(0).decode("utf-8").strip(), line_num, episode_id, utterances)
+                            continue
+                        
+                        speaker = speaker_cache.get(raw_speaker)
+                        if speaker is None:
+                            speaker = speaker_cache[raw_speaker] = sys.intern(raw_speaker.decode("utf-8").strip())
+                        text = text.decode("utf-8").strip()
+                        if not speaker or not text:
+                            # str.strip() also drops non-ASCII whitespace the
+                            # byte pattern keeps; let the validator reject it
+                            self._parse_line(m.group(0).decode("utf-8").strip(), line_num, episode_id, utterances)
+                            continue
                         
-                        # Create utterance
-                        utterance = Utterance(
+                        utterances.append(Utterance(
                             id=str(uuid.uuid4()),
                             episode_id=episode_id,
                             speaker=speaker,
-                            timestamp_start=start_time,
-                            timestamp_end=end_time,
+                            timestamp_start=start_time.decode("ascii"),
+                            timestamp_end=end_time.decode("ascii"),
                             text=text
-                        )
-                        
-                        utterances.append(utterance)
-                        
-                    except Exception as e:
-                        # Log parsing error
-                        error_msg = f"Line {line_num}: {str(e)}"
-                        logger.warning(f"Parsing error | {error_msg}")
-                        
-                        if self.quality_scorer:
-                            self.quality_scorer.metrics.add_parsing_error(error_msg)
-                        
-                        # Continue parsing (graceful degradation)
-                        continue
+                        ))
+                    
+                    line_num = self._parse_unmatched(data[pos:size], line_num, episode_id, utterances)
+                finally:
+                    if isinstance(mm, mmap.mmap):
+                        mm.close()
         
         except Exception as e:
             raise IngestionError(f"Failed to read transcript file: {e}")
@@ -119,4 +157,61 @@ class TranscriptParser:
         )
         
         return episode, utterances
-
+    
+    def _parse_unmatched(
+        self,
+        chunk: bytes,
+        line_num: int,
+        episode_id: str,
+        utterances: List[Utterance]
+    ) -> int:
+        """Parse the lines of a chunk the line regex skipped; return the new line count."""
+        if not chunk:
+            return line_num
+        
+        lines = chunk.split(b"\n")
+        if chunk.endswith(b"\n"):
+            lines.pop()
+        
+        for raw in lines:
+            line_num += 1
+            line = raw.decode("utf-8").strip()
+            
+            # Skip empty lines
+            if line:
+                self._parse_line(line, line_num, episode_id, utterances)
+        
+        return line_num
+    
+    def _parse_line(
+        self,
+        line: str,
+        line_num: int,
+        episode_id: str,
+        utterances: List[Utterance]
+    ):
+        """Validate one line and append its utterance, recording parse errors."""
+        try:
+            # Parse line
+            speaker, start_time, end_time, text = validate_transcript_line(line)
+            speaker = sys.intern(speaker)
+            
+            # Create utterance
+            utterance = Utterance(
+                id=str(uuid.uuid4()),
+                episode_id=episode_id,
+                speaker=speaker,
+                timestamp_start=start_time,
+                timestamp_end=end_time,
+                text=text
+            )
+            
+            utterances.append(utterance)
+            
+        except Exception as e:
+            # Log parsing error
+            error_msg = f"Line {line_num}: {str(e)}"
+            logger.warning(f"Parsing error | {error_msg}")
+            
+            if self.quality_scorer:
+                self.quality_scorer.metrics.add_parsing_error(error_msg)
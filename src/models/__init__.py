@@ -1,26 +1,50 @@
 """
-Pydantic data models for Belief Engine.
+Data models for Belief Engine (pydantic models and slotted dataclasses).
 """
+import importlib
 
 from .episode import Episode
 from .utterance import Utterance
-from .belief import Belief
+from .belief import Belief, FLAG_BITS, flags_to_mask
 from .canonical_belief import CanonicalBelief
 from .cluster import Cluster
-from .matrix import BeliefMatrix, Weight
+from .matrix import BeliefMatrix, BeliefMatrixArray, Weight, WEIGHT_DTYPE
 from .contradiction import Contradiction
 from .drift import BeliefDrift, DriftType
 from .registry import BeliefRegistry
 from .quality_report import QualityReport
 
+# scipy is only imported when the sparse matrix is first used
+_LAZY_ATTRS = {
+    "SparseBeliefMatrix": ".sparse_matrix",
+    "compact_belief_matrix": ".sparse_matrix",
+}
+
+def __getattr__(name):
+    """Import and cache lazily exported attributes."""
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
 __all__ = [
     "Episode",
     "Utterance",
     "Belief",
+    "FLAG_BITS",
+    "flags_to_mask",
     "CanonicalBelief",
     "Cluster",
     "BeliefMatrix",
+    "BeliefMatrixArray",
+    "SparseBeliefMatrix",
+    "compact_belief_matrix",
     "Weight",
+    "WEIGHT_DTYPE",
     "Contradiction",
     "BeliefDrift",
     "DriftType",
@@ -1,10 +1,42 @@
 """
 Belief data model.
 """
-from typing import Optional, Dict
-from pydantic import BaseModel, Field, validator
+from typing import Any, ClassVar, Dict, Optional
+from dataclasses import dataclass
 
-class Belief(BaseModel):
+# Bit per extraction flag (q16-q26); Belief stores the set flags as one int
+FLAG_BITS: Dict[str, int] = {
+    "q16_first_principles": 1 << 0,
+    "q17_worldview": 1 << 1,
+    "q18_moral_framework": 1 << 2,
+    "q19_epistemology": 1 << 3,
+    "q20_ontology": 1 << 4,
+    "q21_reasoning_pattern": 1 << 5,
+    "q22_assumption": 1 << 6,
+    "q23_surface_opinion": 1 << 7,
+    "q24_factual_claim": 1 << 8,
+    "q25_prediction": 1 << 9,
+    "q26_value_judgment": 1 << 10,
+}
+
+def flags_to_mask(flags: Dict[str, bool]) -> int:
+    """
+    Convert an extraction-flag dict (e.g. from the LLM) to a bitmask.
+    
+    Args:
+        flags: Flag name -> bool; unknown names are ignored
+    
+    Returns:
+        Bitmask of the flags set to True
+    """
+    mask = 0
+    for name, value in flags.items():
+        if value:
+            mask |= FLAG_BITS.get(name, 0)
+    return mask
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Belief:
     """
     Belief model representing an atomic, declarative statement.
     
@@ -17,45 +49,44 @@ class Belief(BaseModel):
             belief_text="Science is the objective search for truth",
             confidence=0.95,
             original_quote="Science is the objective search for truth.",
-            extraction_flags={"q16_first_principles": True}
+            flags_mask=FLAG_BITS["q16_first_principles"]
         )
     """
     
-    id: str = Field(..., description="Unique belief identifier")
-    utterance_id: str = Field(..., description="REQUIRED: Foreign key to Utterance (source linkage)")
-    belief_text: str = Field(..., description="The extracted belief statement")
-    confidence: float = Field(..., description="Extraction confidence [0.0, 1.0]", ge=0.0, le=1.0)
-    original_quote: str = Field(..., description="Original quote from utterance")
-    context: Optional[str] = Field(None, description="Additional context")
-    extraction_flags: Dict[str, bool] = Field(..., description="Extraction flags (q16-q26)")
-    
-    @validator("belief_text", "original_quote")
-    def validate_not_empty(cls, v):
-        """Validate text fields are not empty."""
-        if not v or not v.strip():
-            raise ValueError("Text field cannot be empty")
-        return v.strip()
-    
-    @validator("extraction_flags")
-    def validate_extraction_flags(cls, v):
-        """Validate at least one extraction flag is set."""
-        if not any(v.values()):
+    id: str                             # Unique belief identifier
+    utterance_id: str                   # REQUIRED: Foreign key to Utterance (source linkage)
+    belief_text: str                    # The extracted belief statement
+    confidence: float                   # Extraction confidence [0.0, 1.0]
+    original_quote: str                 # Original quote from utterance
+    context: Optional[str] = None       # Additional context
+    flags_mask: int                     # Extraction flags (q16-q26) as FLAG_BITS bitmask
+    
+    EXAMPLE: ClassVar[Dict[str, Any]] = {
+        "id": "bel_001",
+        "utterance_id": "utt_001",
+        "belief_text": "Science is the objective search for truth",
+        "confidence": 0.95,
+        "original_quote": "Science is the objective search for truth.",
+        "context": "Discussion about academic methodology",
+        "flags_mask": FLAG_BITS["q16_first_principles"] | FLAG_BITS["q19_epistemology"]
+    }
+    
+    def __post_init__(self):
+        """Validate text fields, confidence range and extraction flags."""
+        for name in ("belief_text", "original_quote"):
+            value = getattr(self, name)
+            if not value or not value.strip():
+                raise ValueError("Text field cannot be empty")
+            object.__setattr__(self, name, value.strip())
+        
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError(f"confidence must be in [0.0, 1.0], got {self.confidence}")
+        
+        if self.flags_mask == 0:
             raise ValueError("At least one extraction flag must be True")
-        return v
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "id": "bel_001",
-                "utterance_id": "utt_001",
-                "belief_text": "Science is the objective search for truth",
-                "confidence": 0.95,
-                "original_quote": "Science is the objective search for truth.",
-                "context": "Discussion about academic methodology",
-                "extraction_flags": {
-                    "q16_first_principles": True,
-                    "q19_epistemology": True
-                }
-            }
-        }
-
+    
+    @property
+    def extraction_flags(self) -> Dict[str, bool]:
+        """Extraction flags as a dict (q16-q26 -> bool), for backward compatibility."""
+        mask = self.flags_mask
+        return {name: bool(mask & bit) for name, bit in FLAG_BITS.items()}
@@ -1,10 +1,11 @@
 """
 Contradiction data model.
 """
-from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from typing import Any, ClassVar, Dict, List, Optional
+from dataclasses import dataclass
 
-class Contradiction(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Contradiction:
     """
     Contradiction model representing opposing beliefs.
     
@@ -20,44 +21,35 @@ class Contradiction(BaseModel):
         )
     """
     
-    id: str = Field(..., description="Unique contradiction identifier")
-    belief_a_id: str = Field(..., description="First belief ID (CanonicalBelief)")
-    belief_b_id: str = Field(..., description="Second belief ID (CanonicalBelief)")
-    opposition_score: float = Field(..., description="Semantic opposition score [0.0, 1.0]", ge=0.0, le=1.0)
-    type: str = Field(..., description="within_speaker | cross_speaker")
-    episode_ids: List[str] = Field(..., description="Episodes where contradiction appears")
-    is_reversal: bool = Field(..., description="True if same speaker reversed position")
-    speaker_a: Optional[str] = Field(None, description="Speaker for belief_a")
-    speaker_b: Optional[str] = Field(None, description="Speaker for belief_b")
-    detected_at: Optional[str] = Field(None, description="ISO 8601 timestamp")
+    id: str                             # Unique contradiction identifier
+    belief_a_id: str                    # First belief ID (CanonicalBelief)
+    belief_b_id: str                    # Second belief ID (CanonicalBelief)
+    opposition_score: float             # Semantic opposition score [0.0, 1.0]
+    type: str                           # within_speaker | cross_speaker
+    episode_ids: List[str]              # Episodes where contradiction appears
+    is_reversal: bool                   # True if same speaker reversed position
+    speaker_a: Optional[str] = None     # Speaker for belief_a
+    speaker_b: Optional[str] = None     # Speaker for belief_b
+    detected_at: Optional[str] = None   # ISO 8601 timestamp
     
-    @validator("type")
-    def validate_type(cls, v):
-        """Validate contradiction type."""
-        if v not in ["within_speaker", "cross_speaker"]:
-            raise ValueError(f"type must be 'within_speaker' or 'cross_speaker', got {v}")
-        return v
+    EXAMPLE: ClassVar[Dict[str, Any]] = {
+        "id": "cont_001",
+        "belief_a_id": "can_001",
+        "belief_b_id": "can_002",
+        "opposition_score": 0.85,
+        "type": "within_speaker",
+        "episode_ids": ["episode_001", "episode_002"],
+        "is_reversal": True,
+        "speaker_a": "SPEAKER_A",
+        "speaker_b": "SPEAKER_A",
+        "detected_at": "2025-01-15T10:30:00Z"
+    }
     
-    @validator("is_reversal")
-    def validate_reversal(cls, v, values):
-        """Validate reversal logic."""
-        if v and values.get("type") != "within_speaker":
+    def __post_init__(self):
+        """Validate score range, contradiction type and reversal logic."""
+        if not 0.0 <= self.opposition_score <= 1.0:
+            raise ValueError(f"opposition_score must be in [0.0, 1.0], got {self.opposition_score}")
+        if self.type not in ("within_speaker", "cross_speaker"):
+            raise ValueError(f"type must be 'within_speaker' or 'cross_speaker', got {self.type}")
+        if self.is_reversal and self.type != "within_speaker":
             raise ValueError("is_reversal can only be True for within_speaker contradictions")
-        return v
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "id": "cont_001",
-                "belief_a_id": "can_001",
-                "belief_b_id": "can_002",
-                "opposition_score": 0.85,
-                "type": "within_speaker",
-                "episode_ids": ["episode_001", "episode_002"],
-                "is_reversal": True,
-                "speaker_a": "SPEAKER_A",
-                "speaker_b": "SPEAKER_A",
-                "detected_at": "2025-01-15T10:30:00Z"
-            }
-        }
-
@@ -1,9 +1,9 @@
 """
 Belief Drift data model.
 """
-from typing import List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
+from dataclasses import dataclass
 from enum import Enum
-from pydantic import BaseModel, Field, validator
 
 class DriftType(str, Enum):
     """Drift type enumeration."""
@@ -13,7 +13,8 @@ class DriftType(str, Enum):
     WEAKENING = "weakening"
     REVERSAL = "reversal"
 
-class BeliefDrift(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BeliefDrift:
     """
     Belief Drift model tracking how beliefs change over time.
     
@@ -27,35 +28,34 @@ class BeliefDrift(BaseModel):
         )
     """
     
-    id: str = Field(..., description="Unique drift identifier")
-    canonical_belief_id: str = Field(..., description="Foreign key to CanonicalBelief")
-    drift_type: DriftType = Field(..., description="new | dropped | strengthening | weakening | reversal")
-    magnitude: float = Field(..., description="Magnitude of change [0.0, 1.0]", ge=0.0, le=1.0)
-    episode_range: List[str] = Field(..., description="[start_episode_id, end_episode_id]")
-    conviction_before: Optional[float] = Field(None, description="Conviction before change")
-    conviction_after: Optional[float] = Field(None, description="Conviction after change")
-    frequency_before: Optional[int] = Field(None, description="Frequency before change")
-    frequency_after: Optional[int] = Field(None, description="Frequency after change")
+    id: str                                     # Unique drift identifier
+    canonical_belief_id: str                    # Foreign key to CanonicalBelief
+    drift_type: DriftType                       # new | dropped | strengthening | weakening | reversal
+    magnitude: float                            # Magnitude of change [0.0, 1.0]
+    episode_range: List[str]                    # [start_episode_id, end_episode_id]
+    conviction_before: Optional[float] = None   # Conviction before change
+    conviction_after: Optional[float] = None    # Conviction after change
+    frequency_before: Optional[int] = None      # Frequency before change
+    frequency_after: Optional[int] = None       # Frequency after change
     
-    @validator("episode_range")
-    def validate_episode_range(cls, v):
-        """Validate episode_range has exactly 2 elements."""
-        if len(v) != 2:
-            raise ValueError(f"episode_range must have exactly 2 elements, got {len(v)}")
-        return v
+    EXAMPLE: ClassVar[Dict[str, Any]] = {
+        "id": "drift_001",
+        "canonical_belief_id": "can_001",
+        "drift_type": "strengthening",
+        "magnitude": 0.25,
+        "episode_range": ["episode_001", "episode_003"],
+        "conviction_before": 0.75,
+        "conviction_after": 0.90,
+        "frequency_before": 2,
+        "frequency_after": 5
+    }
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "id": "drift_001",
-                "canonical_belief_id": "can_001",
-                "drift_type": "strengthening",
-                "magnitude": 0.25,
-                "episode_range": ["episode_001", "episode_003"],
-                "conviction_before": 0.75,
-                "conviction_after": 0.90,
-                "frequency_before": 2,
-                "frequency_after": 5
-            }
-        }
-
+    def __post_init__(self):
+        """Coerce drift_type and validate magnitude and episode_range."""
+        # Accept plain strings (e.g. from JSON) like the enum field used to
+        object.__setattr__(self, "drift_type", DriftType(self.drift_type))
+        
+        if not 0.0 <= self.magnitude <= 1.0:
+            raise ValueError(f"magnitude must be in [0.0, 1.0], got {self.magnitude}")
+        if len(self.episode_range) != 2:
+            raise ValueError(f"episode_range must have exactly 2 elements, got {len(self.episode_range)}")
@@ -1,9 +1,26 @@
 """
 Episode data model.
 """
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
-from datetime import datetime
+from typing import Annotated, Optional, Dict, Any
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, StringConstraints, field_validator
+from src.utils.exceptions import ValidationError
+from src.utils.validators import validate_iso_date
+
+def _check_iso_date(v: str) -> str:
+    """Reject out-of-range months and days (e.g. 2025-13-45, 2025-02-30)."""
+    try:
+        validate_iso_date(v)
+    except ValidationError as e:
+        raise ValueError(str(e)) from None
+    return v
+
+# YYYY-MM-DD: ASCII shape matched by pydantic-core ([0-9], since \d there
+# matches any Unicode digit), then the calendar range check
+IsoDate = Annotated[
+    str,
+    StringConstraints(pattern=r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$"),
+    AfterValidator(_check_iso_date)
+]
 
 class Episode(BaseModel):
     """
@@ -20,7 +37,7 @@ class Episode(BaseModel):
     
     id: str = Field(..., description="Unique episode identifier")
     title: str = Field(..., description="Episode title")
-    date: str = Field(..., description="ISO 8601 date (YYYY-MM-DD)")
+    date: IsoDate = Field(..., description="ISO 8601 date (YYYY-MM-DD)")
     transcript_path: str = Field(..., description="Path to diarized transcript file")
     audio_uri: Optional[str] = Field(None, description="URI to audio file")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
@@ -28,39 +45,31 @@ class Episode(BaseModel):
     quality_grade: Optional[str] = Field(None, description="Quality grade A-F")
     wandb_run_id: Optional[str] = Field(None, description="W&B run identifier")
     
-    @validator("date")
-    def validate_date(cls, v):
-        """Validate ISO 8601 date format."""
-        try:
-            datetime.fromisoformat(v)
-        except ValueError:
-            raise ValueError(f"Invalid ISO date format: {v}")
-        return v
-    
-    @validator("quality_score")
-    def validate_quality_score(cls, v):
+    @field_validator("quality_score")
+    @classmethod
+    def validate_quality_score(cls, v: Optional[float]) -> Optional[float]:
         """Validate quality score range."""
         if v is not None and (v < 0 or v > 100):
             raise ValueError(f"Quality score must be between 0 and 100, got {v}")
         return v
     
-    @validator("quality_grade")
-    def validate_quality_grade(cls, v):
+    @field_validator("quality_grade")
+    @classmethod
+    def validate_quality_grade(cls, v: Optional[str]) -> Optional[str]:
         """Validate quality grade."""
         if v is not None and v not in ["A", "B", "C", "D", "F"]:
             raise ValueError(f"Quality grade must be A, B, C, D, or F, got {v}")
         return v
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "id": "episode_001",
-                "title": "Matthew Lacroix Interview",
-                "date": "2025-01-15",
-                "transcript_path": "matthew_lacroix.txt",
-                "audio_uri": "s3://bucket/matthew_lacroix.mp3",
-                "quality_score": 92.5,
-                "quality_grade": "A"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "id": "episode_001",
+            "title": "Matthew Lacroix Interview",
+            "date": "2025-01-15",
+            "transcript_path": "matthew_lacroix.txt",
+            "audio_uri": "s3://bucket/matthew_lacroix.mp3",
+            "quality_score": 92.5,
+            "quality_grade": "A"
         }
+    })
 
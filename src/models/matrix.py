@@ -1,8 +1,31 @@
 """
 Belief Matrix data models.
 """
-from typing import Dict, List
-from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+import base64
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:
+    from .sparse_matrix import SparseBeliefMatrix
+
+# Packed (13-byte) record layout of one matrix cell, for bulk export and native aggregation
+WEIGHT_DTYPE = np.dtype([
+    ("conviction_avg", "f4"),
+    ("frequency", "i4"),
+    ("stability_score", "f4"),
+    ("presence_flag", "?"),
+])
+
+# Compact (checkpoint) form: assigned cells as flat little-endian arrays, base64-encoded
+_COMPACT_ARRAYS = (
+    ("rows", "<i4"),
+    ("cols", "<i4"),
+    ("conviction_avg", "<f4"),
+    ("frequency", "<i4"),
+    ("stability_score", "<f4"),
+    ("presence_flag", "?"),
+)
 
 class Weight(BaseModel):
     """
@@ -16,15 +39,63 @@ class Weight(BaseModel):
     stability_score: float = Field(..., description="Consistency within episode [0.0, 1.0]", ge=0.0, le=1.0)
     presence_flag: bool = Field(..., description="Boolean indicator (present/absent)")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "conviction_avg": 0.85,
-                "frequency": 3,
-                "stability_score": 0.92,
-                "presence_flag": True
-            }
+    @classmethod
+    def build(
+        cls,
+        conviction_avg: float,
+        frequency: int,
+        stability_score: float,
+        presence_flag: bool
+    ) -> "Weight":
+        """
+        Construct from trusted values without validation (matrix fill hot path).
+        
+        Sets the same instance state as model_construct, minus its per-call
+        field/default bookkeeping, which makes it slower than validating here.
+        """
+        weight = cls.__new__(cls)
+        _set = object.__setattr__
+        _set(weight, "__dict__", {
+            "conviction_avg": conviction_avg,
+            "frequency": frequency,
+            "stability_score": stability_score,
+            "presence_flag": presence_flag
+        })
+        _set(weight, "__pydantic_fields_set__", set(_WEIGHT_FIELDS))
+        _set(weight, "__pydantic_extra__", None)
+        _set(weight, "__pydantic_private__", None)
+        return weight
+    
+    @classmethod
+    def build_many(
+        cls,
+        conviction_avg: Sequence[float],
+        frequency: Sequence[int],
+        stability_score: Sequence[float],
+        presence_flag: Sequence[bool]
+    ) -> List["Weight"]:
+        """build() over parallel arrays (NumPy arrays are converted to Python scalars in bulk)."""
+        build = cls.build
+        return [
+            build(c, f, s, p)
+            for c, f, s, p in zip(
+                np.asarray(conviction_avg, dtype=np.float64).tolist(),
+                np.asarray(frequency, dtype=np.int64).tolist(),
+                np.asarray(stability_score, dtype=np.float64).tolist(),
+                np.asarray(presence_flag, dtype=np.bool_).tolist()
+            )
+        ]
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "conviction_avg": 0.85,
+            "frequency": 3,
+            "stability_score": 0.92,
+            "presence_flag": True
         }
+    })
+
+_WEIGHT_FIELDS = frozenset(Weight.model_fields)
 
 class BeliefMatrix(BaseModel):
     """
@@ -58,21 +129,285 @@ class BeliefMatrix(BaseModel):
             self.weights[episode_id] = {}
         self.weights[episode_id][belief_id] = weight
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "episodes": ["episode_001", "episode_002"],
-                "canonical_belief_ids": ["can_001", "can_002"],
-                "weights": {
-                    "episode_001": {
-                        "can_001": {
-                            "conviction_avg": 0.85,
-                            "frequency": 3,
-                            "stability_score": 0.92,
-                            "presence_flag": True
-                        }
+    def to_compact_dict(self) -> Dict[str, Any]:
+        """Checkpoint form: index lists plus flat per-field arrays (see BeliefMatrixArray.to_compact_dict)."""
+        return BeliefMatrixArray.from_model(self).to_compact_dict()
+    
+    @classmethod
+    def from_compact_dict(cls, data: Dict[str, Any]) -> "BeliefMatrix":
+        """Rebuild from to_compact_dict() output without per-Weight validation."""
+        return BeliefMatrixArray.from_compact_dict(data).to_model()
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "episodes": ["episode_001", "episode_002"],
+            "canonical_belief_ids": ["can_001", "can_002"],
+            "weights": {
+                "episode_001": {
+                    "can_001": {
+                        "conviction_avg": 0.85,
+                        "frequency": 3,
+                        "stability_score": 0.92,
+                        "presence_flag": True
                     }
                 }
             }
         }
+    })
 
+
+class BeliefMatrixArray:
+    """
+    Struct-of-arrays belief matrix for computation.
+    
+    Each Weight field is one (episodes × beliefs) NumPy plane, so row and
+    column reductions are vectorized (e.g. ``conviction_avg_plane().mean(axis=0)``).
+    BeliefMatrix remains the serialization view (see to_model/from_model).
+    
+    Example:
+        matrix = BeliefMatrixArray(episodes=["episode_001"], canonical_belief_ids=["can_001"])
+        matrix.set_weight("episode_001", "can_001", Weight(conviction_avg=0.85, frequency=3, ...))
+        per_belief_frequency = matrix.frequency_plane().sum(axis=0)
+    """
+    
+    __slots__ = (
+        "episode_index", "belief_index",
+        "_conviction_avg", "_frequency", "_stability_score", "_presence_flag", "_assigned"
+    )
+    
+    # Plane name → dtype
+    _PLANES = (
+        ("_conviction_avg", np.float32),
+        ("_frequency", np.int32),
+        ("_stability_score", np.float32),
+        ("_presence_flag", np.bool_),
+        ("_assigned", np.bool_),        # Cell has a Weight (absent cells read as None)
+    )
+    
+    def __init__(self, episodes: Sequence[str] = (), canonical_belief_ids: Sequence[str] = ()):
+        """
+        Initialize an empty matrix.
+        
+        Args:
+            episodes: Row IDs known up front
+            canonical_belief_ids: Column IDs known up front
+        """
+        self.episode_index: Dict[str, int] = {e: i for i, e in enumerate(episodes)}
+        self.belief_index: Dict[str, int] = {b: i for i, b in enumerate(canonical_belief_ids)}
+        shape = (max(len(self.episode_index), 1), max(len(self.belief_index), 1))
+        for name, dtype in self._PLANES:
+            setattr(self, name, np.zeros(shape, dtype=dtype))
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(episodes, canonical beliefs)."""
+        return len(self.episode_index), len(self.belief_index)
+    
+    @property
+    def episodes(self) -> List[str]:
+        """Row IDs in index order."""
+        return list(self.episode_index)
+    
+    @property
+    def canonical_belief_ids(self) -> List[str]:
+        """Column IDs in index order."""
+        return list(self.belief_index)
+    
+    def _grow(self, rows: int, cols: int):
+        """Ensure plane capacity for rows × cols, doubling along each short axis."""
+        cap_rows, cap_cols = self._assigned.shape
+        if rows <= cap_rows and cols <= cap_cols:
+            return
+        new_shape = (max(rows, cap_rows * 2 if rows > cap_rows else cap_rows),
+                     max(cols, cap_cols * 2 if cols > cap_cols else cap_cols))
+        for name, dtype in self._PLANES:
+            old = getattr(self, name)
+            plane = np.zeros(new_shape, dtype=dtype)
+            plane[:cap_rows, :cap_cols] = old
+            setattr(self, name, plane)
+    
+    def _indices(self, episode_id: str, belief_id: str) -> Tuple[int, int]:
+        """Row/column for a cell, adding the episode or belief if new."""
+        row = self.episode_index.setdefault(episode_id, len(self.episode_index))
+        col = self.belief_index.setdefault(belief_id, len(self.belief_index))
+        self._grow(row + 1, col + 1)
+        return row, col
+    
+    def get_weight(self, episode_id: str, belief_id: str) -> Optional[Weight]:
+        """Get weight for specific cell (None if unset)."""
+        row = self.episode_index.get(episode_id)
+        col = self.belief_index.get(belief_id)
+        if row is None or col is None or not self._assigned[row, col]:
+            return None
+        return Weight.build(
+            float(self._conviction_avg[row, col]),
+            int(self._frequency[row, col]),
+            float(self._stability_score[row, col]),
+            bool(self._presence_flag[row, col])
+        )
+    
+    def set_weight(self, episode_id: str, belief_id: str, weight: Weight):
+        """Set weight for specific cell."""
+        self.set_cell(
+            episode_id, belief_id,
+            weight.conviction_avg, weight.frequency, weight.stability_score, weight.presence_flag
+        )
+    
+    def set_cell(
+        self,
+        episode_id: str,
+        belief_id: str,
+        conviction_avg: float,
+        frequency: int,
+        stability_score: float,
+        presence_flag: bool
+    ):
+        """Set a cell from raw values (no Weight object; values are not validated)."""
+        row, col = self._indices(episode_id, belief_id)
+        self._conviction_avg[row, col] = conviction_avg
+        self._frequency[row, col] = frequency
+        self._stability_score[row, col] = stability_score
+        self._presence_flag[row, col] = presence_flag
+        self._assigned[row, col] = True
+    
+    def get_record(self, episode_id: str, belief_id: str) -> Optional[np.void]:
+        """Get a cell as a WEIGHT_DTYPE record (None if unset)."""
+        row = self.episode_index.get(episode_id)
+        col = self.belief_index.get(belief_id)
+        if row is None or col is None or not self._assigned[row, col]:
+            return None
+        return np.array((
+            self._conviction_avg[row, col],
+            self._frequency[row, col],
+            self._stability_score[row, col],
+            self._presence_flag[row, col]
+        ), dtype=WEIGHT_DTYPE)[()]
+    
+    # ========================================================================
+    # PLANES (views, shape = self.shape)
+    # ========================================================================
+    
+    def conviction_avg_plane(self) -> np.ndarray:
+        """Mean confidence per cell (float32)."""
+        return self._conviction_avg[:len(self.episode_index), :len(self.belief_index)]
+    
+    def frequency_plane(self) -> np.ndarray:
+        """Mention count per cell (int32)."""
+        return self._frequency[:len(self.episode_index), :len(self.belief_index)]
+    
+    def stability_score_plane(self) -> np.ndarray:
+        """Stability score per cell (float32)."""
+        return self._stability_score[:len(self.episode_index), :len(self.belief_index)]
+    
+    def presence_flag_plane(self) -> np.ndarray:
+        """Presence flag per cell (bool)."""
+        return self._presence_flag[:len(self.episode_index), :len(self.belief_index)]
+    
+    def assigned_plane(self) -> np.ndarray:
+        """True where a cell has a Weight (bool)."""
+        return self._assigned[:len(self.episode_index), :len(self.belief_index)]
+    
+    def records(self) -> np.ndarray:
+        """All cells as one (episodes × beliefs) WEIGHT_DTYPE array (unset cells are zero)."""
+        records = np.empty(self.shape, dtype=WEIGHT_DTYPE)
+        records["conviction_avg"] = self.conviction_avg_plane()
+        records["frequency"] = self.frequency_plane()
+        records["stability_score"] = self.stability_score_plane()
+        records["presence_flag"] = self.presence_flag_plane()
+        return records
+    
+    def density(self) -> float:
+        """Fraction of cells that have a Weight."""
+        rows, cols = self.shape
+        return float(self.assigned_plane().sum()) / (rows * cols) if rows and cols else 0.0
+    
+    def load_cells(
+        self,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        conviction_avg: np.ndarray,
+        frequency: np.ndarray,
+        stability_score: np.ndarray,
+        presence_flag: np.ndarray
+    ):
+        """Scatter many cells at once (row/column indices must already exist)."""
+        self._conviction_avg[rows, cols] = conviction_avg
+        self._frequency[rows, cols] = frequency
+        self._stability_score[rows, cols] = stability_score
+        self._presence_flag[rows, cols] = presence_flag
+        self._assigned[rows, cols] = True
+    
+    # ========================================================================
+    # CONVERSION
+    # ========================================================================
+    
+    def to_sparse(self) -> "SparseBeliefMatrix":
+        """Convert to a SparseBeliefMatrix (CSR planes; needs scipy)."""
+        from .sparse_matrix import SparseBeliefMatrix
+        return SparseBeliefMatrix.from_array(self)
+    
+    def to_model(self) -> BeliefMatrix:
+        """Build the BeliefMatrix serialization view (assigned cells only)."""
+        episodes = self.episodes
+        belief_ids = self.canonical_belief_ids
+        weights: Dict[str, Dict[str, Weight]] = {}
+        rows, cols = np.nonzero(self._assigned[:len(episodes), :len(belief_ids)])
+        cells = Weight.build_many(
+            self._conviction_avg[rows, cols],
+            self._frequency[rows, cols],
+            self._stability_score[rows, cols],
+            self._presence_flag[rows, cols]
+        )
+        for row, col, weight in zip(rows.tolist(), cols.tolist(), cells):
+            weights.setdefault(episodes[row], {})[belief_ids[col]] = weight
+        return BeliefMatrix.model_construct(
+            episodes=episodes,
+            canonical_belief_ids=belief_ids,
+            weights=weights
+        )
+    
+    def to_compact_dict(self) -> Dict[str, Any]:
+        """
+        Checkpoint form of the assigned cells.
+        
+        Returns:
+            Dict with episodes, canonical_belief_ids, nnz and one base64 string
+            per flat array (rows, cols and the four Weight fields)
+        """
+        rows, cols = np.nonzero(self.assigned_plane())
+        arrays = {
+            "rows": rows,
+            "cols": cols,
+            "conviction_avg": self._conviction_avg[rows, cols],
+            "frequency": self._frequency[rows, cols],
+            "stability_score": self._stability_score[rows, cols],
+            "presence_flag": self._presence_flag[rows, cols],
+        }
+        compact: Dict[str, Any] = {
+            "episodes": self.episodes,
+            "canonical_belief_ids": self.canonical_belief_ids,
+            "nnz": len(rows),
+        }
+        for name, dtype in _COMPACT_ARRAYS:
+            compact[name] = base64.b64encode(arrays[name].astype(dtype).tobytes()).decode("ascii")
+        return compact
+    
+    @classmethod
+    def from_compact_dict(cls, data: Dict[str, Any]) -> "BeliefMatrixArray":
+        """Rebuild from to_compact_dict() output with one vectorized scatter."""
+        array = cls(data["episodes"], data["canonical_belief_ids"])
+        arrays = {
+            name: np.frombuffer(base64.b64decode(data[name]), dtype=dtype, count=data["nnz"])
+            for name, dtype in _COMPACT_ARRAYS
+        }
+        array.load_cells(**arrays)
+        return array
+    
+    @classmethod
+    def from_model(cls, matrix: BeliefMatrix) -> "BeliefMatrixArray":
+        """Load planes from a BeliefMatrix."""
+        array = cls(matrix.episodes, matrix.canonical_belief_ids)
+        for episode_id, row in matrix.weights.items():
+            for belief_id, weight in row.items():
+                array.set_weight(episode_id, belief_id, weight)
+        return array
@@ -2,7 +2,7 @@
 Quality Report data model.
 """
 from typing import List
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 class QualityReport(BaseModel):
     """
@@ -32,28 +32,28 @@ class QualityReport(BaseModel):
     execution_time_seconds: float = Field(..., description="Execution time", ge=0.0)
     timestamp: str = Field(..., description="ISO 8601 timestamp")
     
-    @validator("quality_grade")
-    def validate_quality_grade(cls, v):
+    @field_validator("quality_grade")
+    @classmethod
+    def validate_quality_grade(cls, v: str) -> str:
         """Validate quality grade."""
         if v not in ["A", "B", "C", "D", "F"]:
             raise ValueError(f"quality_grade must be A, B, C, D, or F, got {v}")
         return v
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "episode_id": "episode_001",
-                "quality_score": 92.5,
-                "quality_grade": "A",
-                "errors_count": 2,
-                "retries_count": 3,
-                "malformed_beliefs_count": 1,
-                "registry_mismatches_count": 0,
-                "parsing_errors": ["Line 45: Invalid timestamp"],
-                "api_errors": ["Timeout on request 12"],
-                "warnings": ["Low confidence belief skipped"],
-                "execution_time_seconds": 145.5,
-                "timestamp": "2025-01-15T10:30:00Z"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "episode_id": "episode_001",
+            "quality_score": 92.5,
+            "quality_grade": "A",
+            "errors_count": 2,
+            "retries_count": 3,
+            "malformed_beliefs_count": 1,
+            "registry_mismatches_count": 0,
+            "parsing_errors": ["Line 45: Invalid timestamp"],
+            "api_errors": ["Timeout on request 12"],
+            "warnings": ["Low confidence belief skipped"],
+            "execution_time_seconds": 145.5,
+            "timestamp": "2025-01-15T10:30:00Z"
         }
+    })
 
@@ -1,8 +1,27 @@
 """
 Belief Registry data model.
 """
-from typing import Dict, List
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+import unicodedata
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+# Embedding storage dtype name → numpy dtype
+EMBEDDING_DTYPES = {"float32": np.float32, "float16": np.float16, "int8": np.int8}
+
+# Rows upcast to float32 per similarity block for float16/int8 storage
+_SIMILARITY_BLOCK_ROWS = 8192
+
+@lru_cache(maxsize=65536)
+def _norm(text: str) -> str:
+    """Alias key for a belief text (memoized: the same texts recur across lookups)."""
+    return text.lower()
+
+def _alias_variants(text: str) -> Set[str]:
+    """Alias keys stored for a canonical text: lowercased, stripped and NFKC-normalized."""
+    stripped = text.strip()
+    return {_norm(text), _norm(stripped), _norm(unicodedata.normalize("NFKC", stripped))}
 
 class BeliefRegistry(BaseModel):
     """
@@ -10,7 +29,9 @@ class BeliefRegistry(BaseModel):
     
     Maintains:
     - All canonical beliefs
-    - Embedding cache
+    - Embedding matrix (one row per canonical belief, stored as float32,
+      float16 or per-row-scaled int8; not part of the serialized model,
+      see embedding_matrix/load_embeddings)
     - Text aliases for fast lookup
     - Episode history
     
@@ -30,10 +51,6 @@ class BeliefRegistry(BaseModel):
         default_factory=dict,
         description="belief_id → {canonical_text, raw_belief_ids, episode_history}"
     )
-    embeddings_cache: Dict[str, List[float]] = Field(
-        default_factory=dict,
-        description="belief_id → embedding vector"
-    )
     aliases: Dict[str, str] = Field(
         default_factory=dict,
         description="raw_belief_text → canonical_id for fast lookup"
@@ -43,13 +60,20 @@ class BeliefRegistry(BaseModel):
         description="belief_id → list of episode_ids where it appeared"
     )
     
+    # Embeddings: rows [0, len(_embedding_id_to_row)) of a capacity-doubled matrix
+    _embedding_matrix: Optional[np.ndarray] = PrivateAttr(default=None)
+    _embedding_id_to_row: Dict[str, int] = PrivateAttr(default_factory=dict)
+    # Storage dtype; int8 rows carry a float32 scale (row ≈ int8 row * scale)
+    _embedding_dtype: str = PrivateAttr(default="float32")
+    _embedding_scales: Optional[np.ndarray] = PrivateAttr(default=None)
+    
     def add_canonical_belief(
         self,
         belief_id: str,
         canonical_text: str,
         raw_belief_ids: List[str],
         episode_id: str,
-        embedding: List[float] = None
+        embedding: Union[List[float], np.ndarray] = None
     ):
         """Add or update a canonical belief."""
         self.canonical_beliefs[belief_id] = {
@@ -58,11 +82,11 @@ class BeliefRegistry(BaseModel):
             "episode_history": [episode_id]
         }
         
-        if embedding:
-            self.embeddings_cache[belief_id] = embedding
+        if embedding is not None:
+            self.add_embedding(belief_id, embedding)
         
-        # Add alias for fast lookup
-        self.aliases[canonical_text.lower()] = belief_id
+        # Add aliases (common normalizations precomputed) for fast lookup
+        self.aliases.update(dict.fromkeys(_alias_variants(canonical_text), belief_id))
         
         # Update episode history
         if belief_id not in self.episode_history:
@@ -70,30 +94,245 @@ class BeliefRegistry(BaseModel):
         if episode_id not in self.episode_history[belief_id]:
             self.episode_history[belief_id].append(episode_id)
     
+    def bulk_add_canonical(
+        self,
+        ids: List[str],
+        texts: List[str],
+        raw_belief_ids_list: List[List[str]],
+        episode_id: str
+    ):
+        """Add many canonical beliefs from one episode (same effect as N add_canonical_belief calls)."""
+        self.canonical_beliefs.update(
+            (belief_id, {
+                "canonical_text": text,
+                "raw_belief_ids": raw_belief_ids,
+                "episode_history": [episode_id]
+            })
+            for belief_id, text, raw_belief_ids in zip(ids, texts, raw_belief_ids_list)
+        )
+        
+        # Add aliases for fast lookup
+        aliases = self.aliases
+        for text, belief_id in zip(texts, ids):
+            aliases.update(dict.fromkeys(_alias_variants(text), belief_id))
+        
+        # Update episode history
+        episode_history = self.episode_history
+        for belief_id in ids:
+            history = episode_history.setdefault(belief_id, [])
+            if episode_id not in history:
+                history.append(episode_id)
+    
+    def merge_beliefs(
+        self,
+        belief_id: str,
+        raw_belief_ids: List[str],
+        episode_id: str
+    ):
+        """Map more raw beliefs onto an existing canonical belief."""
+        entry = self.canonical_beliefs[belief_id]
+        entry["raw_belief_ids"].extend(raw_belief_ids)
+        if episode_id not in entry["episode_history"]:
+            entry["episode_history"].append(episode_id)
+        
+        history = self.episode_history.setdefault(belief_id, [])
+        if episode_id not in history:
+            history.append(episode_id)
+    
     def find_by_text(self, text: str) -> str:
         """Find canonical belief ID by text."""
-        return self.aliases.get(text.lower())
-    
-    def get_embedding(self, belief_id: str) -> List[float]:
-        """Get cached embedding for belief."""
-        return self.embeddings_cache.get(belief_id)
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "canonical_beliefs": {
-                    "can_001": {
-                        "canonical_text": "Science requires evidence",
-                        "raw_belief_ids": ["bel_001", "bel_002"],
-                        "episode_history": ["episode_001", "episode_002"]
-                    }
-                },
-                "aliases": {
-                    "science requires evidence": "can_001"
-                },
-                "episode_history": {
-                    "can_001": ["episode_001", "episode_002"]
+        return self.aliases.get(_norm(text))
+    
+    # ========================================================================
+    # EMBEDDINGS
+    # ========================================================================
+    
+    def set_embedding_dtype(self, dtype: str):
+        """
+        Choose how embedding rows are stored; existing rows are re-quantized.
+        
+        Args:
+            dtype: "float32", "float16" or "int8" (per-row scale max|v|/127)
+        """
+        if dtype not in EMBEDDING_DTYPES:
+            raise ValueError(f"Unknown embedding dtype {dtype!r}; expected one of {sorted(EMBEDDING_DTYPES)}")
+        if dtype == self._embedding_dtype:
+            return
+        ids, vectors = self.embedding_ids, self.embedding_matrix.copy()
+        self._embedding_dtype = dtype
+        self._embedding_matrix = None
+        self._embedding_scales = None
+        self._embedding_id_to_row = {}
+        self.load_embeddings(ids, vectors)
+    
+    def _quantize(self, vectors: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Convert float32 rows to the storage dtype; returns (rows, int8 scales or None)."""
+        if self._embedding_dtype != "int8":
+            return vectors.astype(EMBEDDING_DTYPES[self._embedding_dtype], copy=False), None
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        rows = np.rint(vectors / scales[:, None]).astype(np.int8)
+        return rows, scales.astype(np.float32)
+    
+    def _dequantize(self, start: int, stop: int) -> np.ndarray:
+        """Float32 copy (or view, for float32 storage) of rows [start, stop)."""
+        rows = self._embedding_matrix[start:stop]
+        if self._embedding_dtype == "float32":
+            return rows
+        rows = rows.astype(np.float32)
+        if self._embedding_scales is not None:
+            rows *= self._embedding_scales[start:stop, None]
+        return rows
+    
+    def add_embedding(self, belief_id: str, embedding: Union[List[float], np.ndarray]):
+        """Store (or replace) the embedding row for a canonical belief."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        row = self._embedding_id_to_row.get(belief_id)
+        if row is None:
+            row = len(self._embedding_id_to_row)
+            self._reserve_rows(row + 1, vector.shape[0])
+            self._embedding_id_to_row[belief_id] = row
+        rows, scales = self._quantize(vector[None, :])
+        self._embedding_matrix[row] = rows[0]
+        if scales is not None:
+            self._embedding_scales[row] = scales[0]
+    
+    def _reserve_rows(self, rows: int, dim: int):
+        """Grow the embedding matrix to hold `rows` rows (capacity doubling)."""
+        matrix = self._embedding_matrix
+        dtype = EMBEDDING_DTYPES[self._embedding_dtype]
+        with_scales = self._embedding_dtype == "int8"
+        if matrix is None:
+            self._embedding_matrix = np.empty((max(rows, 16), dim), dtype=dtype)
+            if with_scales:
+                self._embedding_scales = np.empty(max(rows, 16), dtype=np.float32)
+            return
+        if matrix.shape[1] != dim:
+            raise ValueError(f"Embedding dimension {dim} does not match registry dimension {matrix.shape[1]}")
+        if rows > matrix.shape[0]:
+            used = len(self._embedding_id_to_row)
+            capacity = max(rows, matrix.shape[0] * 2)
+            grown = np.empty((capacity, dim), dtype=dtype)
+            grown[:used] = matrix[:used]
+            self._embedding_matrix = grown
+            if with_scales:
+                scales = np.empty(capacity, dtype=np.float32)
+                scales[:used] = self._embedding_scales[:used]
+                self._embedding_scales = scales
+    
+    def load_embeddings(self, belief_ids: Sequence[str], matrix: np.ndarray, scales: Optional[np.ndarray] = None):
+        """
+        Bulk-load embedding rows (e.g. from a saved snapshot).
+        
+        Args:
+            belief_ids: Row IDs
+            matrix: (N, D) rows; float rows are quantized to the storage dtype
+            scales: Per-row scales when `matrix` holds int8 rows (see embedding_storage)
+        """
+        if not len(belief_ids):
+            return
+        matrix = np.asarray(matrix)
+        if scales is not None and self._embedding_dtype == "int8":
+            # Already quantized the way we store it
+            rows, row_scales = matrix.astype(np.int8, copy=False), np.asarray(scales, dtype=np.float32)
+        else:
+            if scales is not None:
+                matrix = matrix.astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+            rows, row_scales = self._quantize(matrix.astype(np.float32, copy=False))
+        start = len(self._embedding_id_to_row)
+        stop = start + len(belief_ids)
+        self._reserve_rows(stop, rows.shape[1])
+        self._embedding_matrix[start:stop] = rows
+        if row_scales is not None:
+            self._embedding_scales[start:stop] = row_scales
+        self._embedding_id_to_row.update(zip(belief_ids, range(start, stop)))
+    
+    def get_embedding(self, belief_id: str) -> Optional[np.ndarray]:
+        """Get cached embedding for belief (dequantized float32)."""
+        row = self._embedding_id_to_row.get(belief_id)
+        return None if row is None else self._dequantize(row, row + 1)[0]
+    
+    @property
+    def embedding_ids(self) -> List[str]:
+        """Belief IDs in embedding row order."""
+        return list(self._embedding_id_to_row)
+    
+    @property
+    def embedding_dim(self) -> int:
+        """Embedding dimension (0 before the first embedding)."""
+        return 0 if self._embedding_matrix is None else self._embedding_matrix.shape[1]
+    
+    @property
+    def embedding_matrix(self) -> np.ndarray:
+        """(N, D) float32 embeddings (a view for float32 storage, else dequantized)."""
+        if self._embedding_matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._dequantize(0, len(self._embedding_id_to_row))
+    
+    def embedding_storage(self) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Stored (N, D) rows in the storage dtype, plus per-row scales for int8."""
+        used = len(self._embedding_id_to_row)
+        if self._embedding_matrix is None:
+            return np.empty((0, 0), dtype=EMBEDDING_DTYPES[self._embedding_dtype]), None
+        scales = None if self._embedding_scales is None else self._embedding_scales[:used]
+        return self._embedding_matrix[:used], scales
+    
+    def similarity_search(self, query: np.ndarray, top_k: int = 1) -> Tuple[List, np.ndarray]:
+        """
+        Find the stored embeddings with the highest dot product to the query.
+        
+        Args:
+            query: (D,) vector or (Q, D) batch; with unit-normalized rows the
+                scores are cosine similarities
+            top_k: Number of matches per query
+        
+        Returns:
+            Tuple of (belief IDs, scores), best first. For a batch, a list of
+            ID lists and a (Q, k) score array.
+        """
+        n = len(self._embedding_id_to_row)
+        query = np.asarray(query, dtype=np.float32)
+        single = query.ndim == 1
+        queries = query[None, :] if single else query
+        if not n:
+            empty = np.empty((len(queries), 0), dtype=np.float32)
+            return ([] if single else [[] for _ in queries]), (empty[0] if single else empty)
+        
+        if self._embedding_dtype == "float32":
+            scores = queries @ self._embedding_matrix[:n].T
+        else:
+            # Upcast one block at a time so BLAS runs in float32 without a full float32 copy
+            scores = np.empty((len(queries), n), dtype=np.float32)
+            for start in range(0, n, _SIMILARITY_BLOCK_ROWS):
+                stop = min(start + _SIMILARITY_BLOCK_ROWS, n)
+                scores[:, start:stop] = queries @ self._dequantize(start, stop).T
+        k = min(top_k, scores.shape[1])
+        if k == 1:
+            top = scores.argmax(axis=1)[:, None]
+        else:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top = np.take_along_axis(top, np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1), axis=1)
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        
+        ids = self.embedding_ids
+        matches = [[ids[i] for i in row] for row in top.tolist()]
+        return (matches[0], top_scores[0]) if single else (matches, top_scores)
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "canonical_beliefs": {
+                "can_001": {
+                    "canonical_text": "Science requires evidence",
+                    "raw_belief_ids": ["bel_001", "bel_002"],
+                    "episode_history": ["episode_001", "episode_002"]
                 }
+            },
+            "aliases": {
+                "science requires evidence": "can_001"
+            },
+            "episode_history": {
+                "can_001": ["episode_001", "episode_002"]
             }
         }
+    })
 
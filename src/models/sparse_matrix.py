@@ -0,0 +1,236 @@
+"""
+Sparse belief matrix (CSR planes) for low-density episode × belief matrices.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import scipy.sparse as sp
+from .matrix import BeliefMatrix, BeliefMatrixArray, Weight
+
+# Below this fraction of filled cells, CSR storage beats dense planes
+SPARSE_DENSITY_THRESHOLD = 0.10
+
+class SparseBeliefMatrix:
+    """
+    Belief matrix stored as CSR planes that share one sparsity structure.
+    
+    The structure is the set of cells that have a Weight; conviction,
+    frequency, stability and presence are parallel data arrays over the
+    same indptr/indices, so storage is O(nnz) rather than O(E·B).
+    set_weight() buffers COO entries, which are merged into the CSR
+    arrays on the next read.
+    
+    Example:
+        matrix = SparseBeliefMatrix(episodes=["episode_001"], canonical_belief_ids=["can_001"])
+        matrix.set_weight("episode_001", "can_001", Weight(conviction_avg=0.85, frequency=3, ...))
+        per_belief_frequency = matrix.frequency_csr().sum(axis=0)
+    """
+    
+    __slots__ = (
+        "episode_index", "belief_index",
+        "_indptr", "_indices", "_data", "_pending"
+    )
+    
+    # Data array name → dtype (same dtypes as BeliefMatrixArray planes)
+    _FIELDS = (
+        ("conviction_avg", np.float32),
+        ("frequency", np.int32),
+        ("stability_score", np.float32),
+        ("presence_flag", np.bool_),
+    )
+    
+    def __init__(self, episodes: Sequence[str] = (), canonical_belief_ids: Sequence[str] = ()):
+        """
+        Initialize an empty matrix.
+        
+        Args:
+            episodes: Row IDs known up front
+            canonical_belief_ids: Column IDs known up front
+        """
+        self.episode_index: Dict[str, int] = {e: i for i, e in enumerate(episodes)}
+        self.belief_index: Dict[str, int] = {b: i for i, b in enumerate(canonical_belief_ids)}
+        self._indptr = np.zeros(len(self.episode_index) + 1, dtype=np.int64)
+        self._indices = np.empty(0, dtype=np.int32)
+        self._data = {name: np.empty(0, dtype=dtype) for name, dtype in self._FIELDS}
+        self._pending: Dict[Tuple[int, int], Weight] = {}
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(episodes, canonical beliefs)."""
+        return len(self.episode_index), len(self.belief_index)
+    
+    @property
+    def nnz(self) -> int:
+        """Number of cells with a Weight."""
+        self._build()
+        return len(self._indices)
+    
+    @property
+    def episodes(self) -> List[str]:
+        """Row IDs in index order."""
+        return list(self.episode_index)
+    
+    @property
+    def canonical_belief_ids(self) -> List[str]:
+        """Column IDs in index order."""
+        return list(self.belief_index)
+    
+    def set_weight(self, episode_id: str, belief_id: str, weight: Weight):
+        """Set weight for specific cell (buffered until the next read)."""
+        row = self.episode_index.setdefault(episode_id, len(self.episode_index))
+        col = self.belief_index.setdefault(belief_id, len(self.belief_index))
+        self._pending[row, col] = weight
+    
+    def _build(self):
+        """Merge buffered COO entries into the CSR arrays (later writes win)."""
+        n_rows = len(self.episode_index)
+        if not self._pending:
+            if len(self._indptr) < n_rows + 1:
+                pad = n_rows + 1 - len(self._indptr)
+                self._indptr = np.concatenate([self._indptr, np.full(pad, self._indptr[-1])])
+            return
+        
+        pending = self._pending
+        self._pending = {}
+        
+        # Existing cells first, then new ones, so a stable sort keeps new values last
+        old_rows = np.repeat(np.arange(len(self._indptr) - 1), np.diff(self._indptr))
+        rows = np.concatenate([old_rows, np.fromiter((r for r, _ in pending), dtype=np.int64, count=len(pending))])
+        cols = np.concatenate([self._indices, np.fromiter((c for _, c in pending), dtype=np.int64, count=len(pending))])
+        data = {
+            name: np.concatenate([
+                self._data[name],
+                np.fromiter((getattr(w, name) for w in pending.values()), dtype=dtype, count=len(pending))
+            ])
+            for name, dtype in self._FIELDS
+        }
+        
+        keys = rows * max(len(self.belief_index), 1) + cols
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        keep = order[np.r_[keys[1:] != keys[:-1], True]]
+        
+        self._indices = cols[keep].astype(np.int32)
+        self._indptr = np.concatenate([[0], np.cumsum(np.bincount(rows[keep], minlength=n_rows))])
+        self._data = {name: values[keep] for name, values in data.items()}
+    
+    def get_weight(self, episode_id: str, belief_id: str) -> Optional[Weight]:
+        """Get weight for specific cell (None if unset)."""
+        row = self.episode_index.get(episode_id)
+        col = self.belief_index.get(belief_id)
+        if row is None or col is None:
+            return None
+        self._build()
+        
+        # Binary search within the row's sorted column indices
+        start, end = self._indptr[row], self._indptr[row + 1]
+        pos = start + np.searchsorted(self._indices[start:end], col)
+        if pos >= end or self._indices[pos] != col:
+            return None
+        return Weight.build(
+            float(self._data["conviction_avg"][pos]),
+            int(self._data["frequency"][pos]),
+            float(self._data["stability_score"][pos]),
+            bool(self._data["presence_flag"][pos])
+        )
+    
+    def density(self) -> float:
+        """Fraction of cells that have a Weight."""
+        rows, cols = self.shape
+        return self.nnz / (rows * cols) if rows and cols else 0.0
+    
+    # ========================================================================
+    # PLANES (CSR matrices sharing indptr/indices)
+    # ========================================================================
+    
+    def _csr(self, name: str) -> sp.csr_matrix:
+        self._build()
+        return sp.csr_matrix((self._data[name], self._indices, self._indptr), shape=self.shape, copy=False)
+    
+    def conviction_avg_csr(self) -> sp.csr_matrix:
+        """Mean confidence per cell (float32)."""
+        return self._csr("conviction_avg")
+    
+    def frequency_csr(self) -> sp.csr_matrix:
+        """Mention count per cell (int32)."""
+        return self._csr("frequency")
+    
+    def stability_score_csr(self) -> sp.csr_matrix:
+        """Stability score per cell (float32)."""
+        return self._csr("stability_score")
+    
+    def presence_flag_csr(self) -> sp.csr_matrix:
+        """Presence flag per cell (bool)."""
+        return self._csr("presence_flag")
+    
+    # ========================================================================
+    # CONVERSION
+    # ========================================================================
+    
+    @classmethod
+    def from_array(cls, array: BeliefMatrixArray) -> "SparseBeliefMatrix":
+        """Build from the dense planes of a BeliefMatrixArray."""
+        matrix = cls(array.episodes, array.canonical_belief_ids)
+        rows, cols = np.nonzero(array.assigned_plane())
+        matrix._indices = cols.astype(np.int32)
+        matrix._indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=array.shape[0]))])
+        matrix._data = {
+            "conviction_avg": array.conviction_avg_plane()[rows, cols],
+            "frequency": array.frequency_plane()[rows, cols],
+            "stability_score": array.stability_score_plane()[rows, cols],
+            "presence_flag": array.presence_flag_plane()[rows, cols],
+        }
+        return matrix
+    
+    def to_dense(self) -> BeliefMatrixArray:
+        """Expand into a BeliefMatrixArray."""
+        array = BeliefMatrixArray(self.episodes, self.canonical_belief_ids)
+        self._build()
+        array.load_cells(
+            np.repeat(np.arange(self.shape[0]), np.diff(self._indptr)),
+            self._indices,
+            **self._data
+        )
+        return array
+    
+    def to_pydantic(self) -> BeliefMatrix:
+        """Build the BeliefMatrix serialization view."""
+        episodes = self.episodes
+        belief_ids = self.canonical_belief_ids
+        self._build()
+        cells = Weight.build_many(
+            self._data["conviction_avg"],
+            self._data["frequency"],
+            self._data["stability_score"],
+            self._data["presence_flag"]
+        )
+        indices = self._indices.tolist()
+        indptr = self._indptr.tolist()
+        weights: Dict[str, Dict[str, Weight]] = {}
+        for row, episode_id in enumerate(episodes):
+            start, end = indptr[row], indptr[row + 1]
+            if start == end:
+                continue
+            weights[episode_id] = {belief_ids[indices[pos]]: cells[pos] for pos in range(start, end)}
+        return BeliefMatrix.model_construct(
+            episodes=episodes,
+            canonical_belief_ids=belief_ids,
+            weights=weights
+        )
+
+def compact_belief_matrix(
+    array: BeliefMatrixArray,
+    threshold: float = SPARSE_DENSITY_THRESHOLD
+) -> Union[SparseBeliefMatrix, BeliefMatrixArray]:
+    """
+    Pick the cheaper representation for a matrix.
+    
+    Args:
+        array: Dense belief matrix
+        threshold: Density below which the sparse form is returned
+    
+    Returns:
+        SparseBeliefMatrix if density < threshold, else the array unchanged
+    """
+    if array.density() < threshold:
+        return SparseBeliefMatrix.from_array(array)
+    return array
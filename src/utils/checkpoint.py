@@ -1,11 +1,16 @@
 """
 Checkpoint save/load/recovery system for Belief Engine.
 """
-import json
+import os
+import pickle
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 from datetime import datetime
 from loguru import logger
+import orjson
 import config
 from .exceptions import CheckpointError
 
@@ -13,6 +18,244 @@ from .exceptions import CheckpointError
 # CHECKPOINT MANAGEMENT
 # ============================================================================
 
+# File suffix per checkpoint format (config.CHECKPOINT_FORMAT)
+CHECKPOINT_SUFFIXES = {"json": ".json", "msgpack": ".msgpack", "pickle": ".pkl"}
+_SUFFIX_FORMATS = {suffix: fmt for fmt, suffix in CHECKPOINT_SUFFIXES.items()}
+
+# Appended to the format suffix when config.CHECKPOINT_COMPRESSION = "zstd"
+_ZSTD_SUFFIX = ".zst"
+_ALL_SUFFIXES = (*CHECKPOINT_SUFFIXES.values(), *(s + _ZSTD_SUFFIX for s in CHECKPOINT_SUFFIXES.values()))
+
+# Sentinel: last-checkpoint cache not computed yet (None means "no checkpoints")
+_UNSET = object()
+
+def _to_jsonable(obj: Any) -> Any:
+    """Fallback encoder for checkpoint data the serializer can't handle natively."""
+    if hasattr(obj, "to_compact_dict"):
+        # Belief matrices: flat arrays instead of one nested dict per Weight
+        return obj.to_compact_dict()
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if hasattr(obj, "tolist"):
+        # numpy arrays and scalars
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+# orjson options shared by JSON checkpoints and NDJSON batch records
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _encode(checkpoint: Dict[str, Any], fmt: str) -> bytes:
+    """Serialize a checkpoint dict in the given format."""
+    if fmt == "json":
+        option = _JSON_OPTIONS
+        if config.SETTINGS.checkpoint_pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(checkpoint, default=_to_jsonable, option=option)
+    if fmt == "msgpack":
+        import msgpack  # Optional dependency, only needed for this format
+        return msgpack.packb(checkpoint, default=_to_jsonable, use_bin_type=True)
+    if fmt == "pickle":
+        # Protocol 5 keeps numpy buffers out-of-band friendly
+        return pickle.dumps(checkpoint, protocol=5)
+    raise ValueError(f"Unknown checkpoint format: {fmt!r}")
+
+def _decode(payload: bytes, fmt: str) -> Dict[str, Any]:
+    """Deserialize a checkpoint written by _encode."""
+    if fmt == "json":
+        return orjson.loads(payload)
+    if fmt == "msgpack":
+        import msgpack
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    if fmt == "pickle":
+        return pickle.loads(payload)
+    raise ValueError(f"Unknown checkpoint format: {fmt!r}")
+
+def _checkpoint_suffix(fmt: str) -> str:
+    """File suffix for new checkpoints in `fmt` under the configured compression."""
+    suffix = CHECKPOINT_SUFFIXES[fmt]
+    return suffix + _ZSTD_SUFFIX if config.SETTINGS.checkpoint_compression == "zstd" else suffix
+
+def _compress(payload: bytes) -> bytes:
+    """zstd-compress a checkpoint payload."""
+    import zstandard  # Optional dependency, only needed for CHECKPOINT_COMPRESSION=zstd
+    return zstandard.ZstdCompressor(level=3).compress(payload)
+
+def _read_checkpoint(path: Path) -> Dict[str, Any]:
+    """Read a per-phase checkpoint, detecting format and compression from the suffix."""
+    payload = path.read_bytes()
+    suffix = path.suffix
+    if suffix == _ZSTD_SUFFIX:
+        import zstandard
+        payload = zstandard.ZstdDecompressor().decompress(payload)
+        suffix = Path(path.stem).suffix
+    return _decode(payload, _SUFFIX_FORMATS[suffix])
+
+# Loaded checkpoints are shared between callers: treat returned data as read-only.
+# Keys include mtime/size, so a rewritten file is never served stale.
+@lru_cache(maxsize=64)
+def _cached_read(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """_read_checkpoint, memoized per file version."""
+    return _read_checkpoint(Path(path))
+
+@lru_cache(maxsize=64)
+def _cached_batch_records(path: str, mtime_ns: int, size: int) -> Dict[str, Dict[str, Any]]:
+    """Most recent NDJSON record per phase, memoized per file version."""
+    records = {}
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # Truncated trailing line from an interrupted write
+                continue
+            records[record.get("phase")] = record
+    return records
+
+def _clear_load_cache():
+    """Drop memoized checkpoint reads (after a save or delete)."""
+    _cached_read.cache_clear()
+    _cached_batch_records.cache_clear()
+
+@lru_cache(maxsize=1)
+def _get_io_executor() -> ThreadPoolExecutor:
+    """Process-wide pool for background checkpoint serialization and disk I/O."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="checkpoint-io")
+
+if hasattr(os, "register_at_fork"):
+    # Worker threads do not survive fork; children build their own pool
+    os.register_at_fork(after_in_child=_get_io_executor.cache_clear)
+
+def _atomic_write(path: Path, payload: bytes):
+    """
+    Durably replace `path` with `payload`.
+    
+    Writes a temp file, fsyncs it, then os.replace()s it over the target
+    (atomic, and overwrites on Windows too). On POSIX the directory is
+    fsynced as well so the rename survives a crash.
+    """
+    temp_file = path.with_suffix(".tmp")
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    
+    os.replace(temp_file, path)
+    
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+class CheckpointBatch:
+    """
+    Append-only NDJSON checkpoint writer for one episode.
+    
+    Keeps a single buffered handle open across pipeline stages instead of
+    creating, renaming and closing one file per phase. Each record is flushed
+    to the OS as it is written; the file is fsynced once on exit.
+    
+    NDJSON is JSON-only and uncompressed: when CHECKPOINT_FORMAT or
+    CHECKPOINT_COMPRESSION ask for something else, records are handed to
+    `save` and land in per-phase files instead.
+    
+    Usage:
+        with manager.open_batch() as cp:
+            cp.write_line({"phase": "utterances", "count": 10, "data": data})
+    """
+    
+    def __init__(
+        self,
+        episode_id: str,
+        path: Path,
+        on_write: Optional[Callable[[str], None]] = None,
+        save: Optional[Callable[[str, List[Any], Dict[str, Any]], Path]] = None
+    ):
+        """
+        Initialize batch writer.
+        
+        Args:
+            episode_id: Episode identifier
+            path: Path to the NDJSON checkpoint file
+            on_write: Called with the phase after each record is written
+            save: Per-phase writer (phase, data, stats) for non-NDJSON settings
+        """
+        self.episode_id = episode_id
+        self.path = path
+        self._fh = None
+        self._on_write = on_write
+        self._save = save
+    
+    def write_line(self, record: Dict[str, Any]):
+        """
+        Append one checkpoint record.
+        
+        Args:
+            record: Dict with at least "phase" and "data" (as for CheckpointManager.save)
+        
+        Raises:
+            CheckpointError: If write fails
+        """
+        phase = record.get("phase")
+        
+        if not config.SETTINGS.checkpoint_enabled:
+            logger.debug(f"Checkpointing disabled, skipping save for {phase}")
+            return
+        
+        if self._save is not None and (
+            config.SETTINGS.checkpoint_format != "json"
+            or config.SETTINGS.checkpoint_compression == "zstd"
+        ):
+            stats = {k: v for k, v in record.items() if k not in ("phase", "data")}
+            self._save(phase, record.get("data", []), stats)
+            return
+        
+        try:
+            if self._fh is None:
+                self._fh = open(self.path, "ab", buffering=1 << 20)
+            
+            record.setdefault("episode_id", self.episode_id)
+            record.setdefault("timestamp", datetime.now().isoformat())
+            # Same encoding as save(), minus indentation: one record per line
+            self._fh.write(orjson.dumps(record, default=_to_jsonable, option=_JSON_OPTIONS) + b"\n")
+            self._fh.flush()
+            if self._on_write is not None:
+                self._on_write(phase)
+            
+            logger.info(
+                f"Checkpoint saved | phase={phase} | episode_id={self.episode_id} | "
+                f"count={record.get('count', len(record.get('data', [])))} | path={self.path}"
+            )
+            
+        except Exception as e:
+            raise CheckpointError(f"Failed to save checkpoint for {phase}: {e}")
+    
+    def close(self):
+        """Fsync and close the underlying file."""
+        if self._fh is None:
+            return
+        try:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+        finally:
+            self._fh.close()
+            self._fh = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
 class CheckpointManager:
     """
     Manage checkpoints for an episode.
@@ -21,18 +264,77 @@ class CheckpointManager:
         manager = CheckpointManager(episode_id="episode_001")
         manager.save("beliefs_raw", beliefs, stats={"count": 150})
         beliefs = manager.load("beliefs_raw")
+        
+        # Overlap the write with downstream work; wait at the next barrier
+        future = manager.save_async("canonical_beliefs", canonical_beliefs)
+        future.result()
     """
     
-    def __init__(self, episode_id: str):
+    def __init__(self, episode_id: str, create_dir: bool = True):
         """
         Initialize checkpoint manager.
         
         Args:
             episode_id: Episode identifier
+            create_dir: Create the episode's checkpoint directory (False for read-only lookups)
         """
         self.episode_id = episode_id
         self.checkpoint_dir = config.CHECKPOINTS_DIR / episode_id
-        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        if create_dir:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self.batch_file = self.checkpoint_dir / "checkpoints.ndjson"
+        # Result of get_last_checkpoint, kept current by save/delete
+        self._last_checkpoint_cache = _UNSET
+    
+    def _phase_file(self, phase: str) -> Optional[Path]:
+        """Existing per-phase checkpoint file, preferring the configured format."""
+        fmt = config.SETTINGS.checkpoint_format
+        preferred = _checkpoint_suffix(fmt) if fmt in CHECKPOINT_SUFFIXES else ".json"
+        for suffix in (preferred, *_ALL_SUFFIXES):
+            checkpoint_file = self.checkpoint_dir / f"{phase}{suffix}"
+            if checkpoint_file.exists():
+                return checkpoint_file
+        return None
+    
+    def find_checkpoint_path(self, phase: str) -> Optional[Path]:
+        """
+        Locate the file holding a phase's checkpoint.
+        
+        Args:
+            phase: Pipeline phase name
+        
+        Returns:
+            The per-phase file (any format/compression), else the NDJSON batch
+            file if it has a record for the phase, else None
+        """
+        checkpoint_file = self._phase_file(phase)
+        if checkpoint_file is None and phase in self._batch_records():
+            return self.batch_file
+        return checkpoint_file
+    
+    def open_batch(self) -> CheckpointBatch:
+        """
+        Open an append-only NDJSON writer for this episode's checkpoints.
+        
+        With a non-JSON CHECKPOINT_FORMAT or zstd compression the writer
+        falls back to save(), one file per phase.
+        
+        Returns:
+            CheckpointBatch context manager
+        """
+        return CheckpointBatch(self.episode_id, self.batch_file, on_write=self._note_saved, save=self.save)
+    
+    def _load_from_batch(self, phase: str) -> Optional[Dict[str, Any]]:
+        """Return the most recent NDJSON record for a phase, if any."""
+        return self._batch_records().get(phase)
+    
+    def _batch_records(self) -> Dict[str, Dict[str, Any]]:
+        """Most recent NDJSON record per phase ({} if there is no batch file)."""
+        try:
+            stat = self.batch_file.stat()
+        except FileNotFoundError:
+            return {}
+        return _cached_batch_records(str(self.batch_file), stat.st_mtime_ns, stat.st_size)
     
     def save(
         self,
@@ -45,7 +347,7 @@ class CheckpointManager:
         
         Args:
             phase: Pipeline phase name (e.g., "beliefs_raw")
-            data: Data to checkpoint (must be JSON-serializable)
+            data: Data to checkpoint (JSON types, dataclasses, numpy values or pydantic models)
             stats: Optional statistics dictionary
         
         Returns:
@@ -54,12 +356,13 @@ class CheckpointManager:
         Raises:
             CheckpointError: If save fails
         """
-        if not config.CHECKPOINT_ENABLED:
+        if not config.SETTINGS.checkpoint_enabled:
             logger.debug(f"Checkpointing disabled, skipping save for {phase}")
             return None
         
         try:
-            checkpoint_file = self.checkpoint_dir / f"{phase}.json"
+            fmt = config.SETTINGS.checkpoint_format
+            checkpoint_file = self.checkpoint_dir / f"{phase}{_checkpoint_suffix(fmt)}"
             
             # Create checkpoint structure
             checkpoint = {
@@ -72,24 +375,56 @@ class CheckpointManager:
                 "data": data
             }
             
-            # Write to temporary file first (atomic write)
-            temp_file = checkpoint_file.with_suffix(".tmp")
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(checkpoint, f, indent=2, ensure_ascii=False)
-            
-            # Rename to final location (atomic operation)
-            temp_file.rename(checkpoint_file)
+            payload = _encode(checkpoint, fmt)
+            if checkpoint_file.suffix == _ZSTD_SUFFIX:
+                payload = _compress(payload)
+            _atomic_write(checkpoint_file, payload)
             
             logger.info(
                 f"Checkpoint saved | phase={phase} | episode_id={self.episode_id} | "
                 f"count={len(data)} | path={checkpoint_file}"
             )
             
+            self._note_saved(phase)
             return checkpoint_file
             
         except Exception as e:
             raise CheckpointError(f"Failed to save checkpoint for {phase}: {e}")
     
+    def save_async(
+        self,
+        phase: str,
+        data: List[Any],
+        stats: Optional[Dict[str, Any]] = None
+    ) -> Future:
+        """
+        Serialize and write a checkpoint on the background I/O pool.
+        
+        The caller must not mutate `data` until the future completes; wait on
+        it (``future.result()``) at the next pipeline barrier.
+        
+        Args:
+            phase: Pipeline phase name
+            data: Data to checkpoint (as for save)
+            stats: Optional statistics dictionary
+        
+        Returns:
+            Future resolving to the checkpoint path (raises CheckpointError on failure)
+        """
+        return _get_io_executor().submit(self.save, phase, data, stats)
+    
+    def load_async(self, phase: str) -> Future:
+        """
+        Start loading a checkpoint on the background I/O pool (prefetch).
+        
+        Args:
+            phase: Pipeline phase name
+        
+        Returns:
+            Future resolving to the checkpoint data, or None if not found
+        """
+        return _get_io_executor().submit(self.load, phase)
+    
     def load(self, phase: str) -> Optional[List[Any]]:
         """
         Load checkpoint for a pipeline phase.
@@ -98,20 +433,29 @@ class CheckpointManager:
             phase: Pipeline phase name
         
         Returns:
-            Checkpoint data or None if not found
+            Checkpoint data or None if not found. Repeated loads of an unchanged
+            file return the same cached object, so treat it as read-only.
         
         Raises:
             CheckpointError: If load fails
         """
         try:
-            checkpoint_file = self.checkpoint_dir / f"{phase}.json"
+            checkpoint_file = self._phase_file(phase)
             
-            if not checkpoint_file.exists():
-                logger.debug(f"No checkpoint found for {phase}")
-                return None
+            if checkpoint_file is None:
+                record = self._load_from_batch(phase)
+                if record is None:
+                    logger.debug(f"No checkpoint found for {phase}")
+                    return None
+                
+                logger.info(
+                    f"Checkpoint loaded | phase={phase} | episode_id={record.get('episode_id')} | "
+                    f"count={len(record['data'])} | timestamp={record.get('timestamp')}"
+                )
+                return record["data"]
             
-            with open(checkpoint_file, "r", encoding="utf-8") as f:
-                checkpoint = json.load(f)
+            stat = checkpoint_file.stat()
+            checkpoint = _cached_read(str(checkpoint_file), stat.st_mtime_ns, stat.st_size)
             
             # Validate checkpoint structure
             if "metadata" not in checkpoint or "data" not in checkpoint:
@@ -142,8 +486,7 @@ class CheckpointManager:
         Returns:
             True if checkpoint exists
         """
-        checkpoint_file = self.checkpoint_dir / f"{phase}.json"
-        return checkpoint_file.exists()
+        return self._phase_file(phase) is not None or self._load_from_batch(phase) is not None
     
     def get_last_checkpoint(self) -> Optional[str]:
         """
@@ -152,10 +495,34 @@ class CheckpointManager:
         Returns:
             Phase name or None if no checkpoints exist
         """
-        for phase in reversed(config.CHECKPOINT_PHASES):
-            if self.exists(phase):
-                return phase
-        return None
+        if self._last_checkpoint_cache is _UNSET:
+            completed = self._completed_phases()
+            self._last_checkpoint_cache = next(
+                (phase for phase in reversed(config.CHECKPOINT_PHASES) if phase in completed),
+                None
+            )
+        return self._last_checkpoint_cache
+    
+    def _completed_phases(self) -> Set[str]:
+        """Phases with a checkpoint: one directory scan plus one pass over the batch file."""
+        phases = set()
+        with os.scandir(self.checkpoint_dir) as entries:
+            for entry in entries:
+                for suffix in _ALL_SUFFIXES:
+                    if entry.name.endswith(suffix):
+                        phases.add(entry.name[:-len(suffix)])
+        
+        phases.update(self._batch_records())
+        return phases
+    
+    def _note_saved(self, phase: str):
+        """Advance the cached last checkpoint after a save."""
+        _clear_load_cache()
+        cached = self._last_checkpoint_cache
+        if cached is _UNSET or phase not in config.CHECKPOINT_PHASES:
+            return
+        if cached is None or config.CHECKPOINT_PHASES.index(phase) > config.CHECKPOINT_PHASES.index(cached):
+            self._last_checkpoint_cache = phase
     
     def delete(self, phase: str):
         """
@@ -164,15 +531,26 @@ class CheckpointManager:
         Args:
             phase: Pipeline phase name
         """
-        checkpoint_file = self.checkpoint_dir / f"{phase}.json"
-        if checkpoint_file.exists():
-            checkpoint_file.unlink()
+        deleted = False
+        for suffix in _ALL_SUFFIXES:
+            checkpoint_file = self.checkpoint_dir / f"{phase}{suffix}"
+            if checkpoint_file.exists():
+                checkpoint_file.unlink()
+                deleted = True
+        if deleted:
+            self._last_checkpoint_cache = _UNSET
+            _clear_load_cache()
             logger.info(f"Checkpoint deleted | phase={phase} | episode_id={self.episode_id}")
     
     def delete_all(self):
         """Delete all checkpoints for this episode."""
-        for checkpoint_file in self.checkpoint_dir.glob("*.json"):
-            checkpoint_file.unlink()
+        for suffix in _ALL_SUFFIXES:
+            for checkpoint_file in self.checkpoint_dir.glob(f"*{suffix}"):
+                checkpoint_file.unlink()
+        if self.batch_file.exists():
+            self.batch_file.unlink()
+        self._last_checkpoint_cache = None
+        _clear_load_cache()
         logger.info(f"All checkpoints deleted | episode_id={self.episode_id}")
 
 # ============================================================================
@@ -235,23 +613,42 @@ def cleanup_old_checkpoints(days: int = None):
     
     deleted_count = 0
     
-    for episode_dir in config.CHECKPOINTS_DIR.iterdir():
-        if not episode_dir.is_dir():
-            continue
+    cutoff = cutoff_date.timestamp()
+    checkpoint_suffixes = (*_ALL_SUFFIXES, ".ndjson")
+    
+    # DirEntry caches the type and stat from the directory scan
+    with os.scandir(config.CHECKPOINTS_DIR) as entries:
+        episode_dirs = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    
+    for episode_dir in episode_dirs:
+        with os.scandir(episode_dir.path) as entries:
+            files = [entry for entry in entries if entry.is_file(follow_symlinks=False)]
         
-        # Check the modification time of the directory
-        mtime = datetime.fromtimestamp(episode_dir.stat().st_mtime)
+        # Appends to checkpoints.ndjson and in-place report rewrites do not
+        # touch the directory mtime, so age is the newest file inside
+        newest = max(
+            (entry.stat(follow_symlinks=False).st_mtime for entry in files),
+            default=episode_dir.stat(follow_symlinks=False).st_mtime
+        )
+        if newest >= cutoff:
+            continue
         
-        if mtime < cutoff_date:
-            # Delete all checkpoints in this directory
-            for checkpoint_file in episode_dir.glob("*.json"):
-                checkpoint_file.unlink()
+        # Delete all checkpoints in this directory
+        for entry in files:
+            if entry.name.endswith(checkpoint_suffixes):
+                try:
+                    os.unlink(entry.path)
+                except OSError as e:
+                    logger.warning(f"Failed to delete old checkpoint {entry.path}: {e}")
+                    continue
                 deleted_count += 1
-            
-            # Remove the directory if empty
-            if not list(episode_dir.iterdir()):
-                episode_dir.rmdir()
-                logger.info(f"Deleted old checkpoint directory: {episode_dir.name}")
+        
+        # Remove the directory if empty
+        try:
+            os.rmdir(episode_dir.path)
+        except OSError:
+            continue
+        logger.info(f"Deleted old checkpoint directory: {episode_dir.name}")
     
     if deleted_count > 0:
         logger.info(f"Cleaned up {deleted_count} old checkpoint(s)")
@@ -261,6 +658,8 @@ def cleanup_old_checkpoints(days: int = None):
 # ============================================================================
 
 __all__ = [
+    "CHECKPOINT_SUFFIXES",
+    "CheckpointBatch",
     "CheckpointManager",
     "get_resume_point",
     "cleanup_old_checkpoints",
@@ -2,10 +2,11 @@
 Parallelization with rate limiting for Belief Engine.
 """
 import time
+import asyncio
+import itertools
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Callable, List, Any, Optional
-from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Awaitable, Callable, Iterator, List, Any, Optional
 from loguru import logger
 import config
 
@@ -13,11 +14,73 @@ import config
 # RATE LIMITER
 # ============================================================================
 
+class TokenBucket:
+    """
+    Thread-safe token bucket with a monotonic clock.
+    
+    The lock only covers refill-and-take; waiting callers sleep outside it,
+    so an unsaturated bucket costs one short critical section per call.
+    
+    Usage:
+        bucket = TokenBucket(capacity=3500, refill_rate=3500 / 60)
+        bucket.wait(1)
+    """
+    
+    __slots__ = ("capacity", "refill_rate", "tokens", "last_refill", "lock")
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            capacity: Maximum tokens held
+            refill_rate: Tokens added per second
+        """
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def try_acquire(self, cost: float) -> float:
+        """
+        Take `cost` tokens if available.
+        
+        Returns:
+            0.0 if taken, else seconds until enough tokens will have refilled
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+            if self.tokens >= cost:
+                self.tokens -= cost
+                return 0.0
+            return (cost - self.tokens) / self.refill_rate
+    
+    def wait(self, cost: float) -> float:
+        """
+        Block until `cost` tokens are taken (a cost above capacity waits for a full bucket).
+        
+        Returns:
+            Time waited in seconds
+        """
+        cost = min(cost, self.capacity)
+        waited = 0.0
+        while True:
+            wait_time = self.try_acquire(cost)
+            if wait_time == 0.0:
+                return waited
+            time.sleep(wait_time)
+            waited += wait_time
+
 class RateLimiter:
     """
     Token bucket rate limiter for API calls.
     
-    Tracks both requests per minute (RPM) and tokens per minute (TPM).
+    Tracks both requests per minute (RPM) and tokens per minute (TPM), each
+    as a TokenBucket refilling at limit/60 per second. Safe to share between
+    worker threads; waits never hold a lock.
     
     Usage:
         limiter = RateLimiter(rpm=3500, tpm=90000)
@@ -37,29 +100,11 @@ class RateLimiter:
         self.rpm = rpm or config.API_RATE_LIMIT_RPM
         self.tpm = tpm or config.API_RATE_LIMIT_TPM
         
-        # Request tracking
-        self.request_times = deque()
-        
-        # Token tracking
-        self.token_counts = deque()  # (timestamp, token_count) tuples
-        
-        # Lock for thread safety
-        self.lock = threading.Lock()
+        self._requests = TokenBucket(self.rpm, self.rpm / 60)
+        self._tokens = TokenBucket(self.tpm, self.tpm / 60)
         
         logger.info(f"Rate limiter initialized | RPM={self.rpm} | TPM={self.tpm}")
     
-    def _clean_old_entries(self, current_time: float):
-        """Remove entries older than 60 seconds."""
-        cutoff = current_time - 60
-        
-        # Clean request times
-        while self.request_times and self.request_times[0] < cutoff:
-            self.request_times.popleft()
-        
-        # Clean token counts
-        while self.token_counts and self.token_counts[0][0] < cutoff:
-            self.token_counts.popleft()
-    
     def wait_if_needed(self, tokens: int = 0) -> float:
         """
         Wait if rate limits would be exceeded.
@@ -70,41 +115,14 @@ class RateLimiter:
         Returns:
             Time waited in seconds
         """
-        with self.lock:
-            current_time = time.time()
-            self._clean_old_entries(current_time)
-            
-            wait_time = 0.0
-            
-            # Check RPM limit
-            if len(self.request_times) >= self.rpm:
-                # Calculate wait time until oldest request expires
-                oldest_request = self.request_times[0]
-                rpm_wait = 60 - (current_time - oldest_request) + 0.1  # Add buffer
-                wait_time = max(wait_time, rpm_wait)
-            
-            # Check TPM limit
-            if tokens > 0:
-                current_tokens = sum(count for _, count in self.token_counts)
-                if current_tokens + tokens > self.tpm:
-                    # Calculate wait time until enough tokens are available
-                    oldest_token_time = self.token_counts[0][0] if self.token_counts else current_time
-                    tpm_wait = 60 - (current_time - oldest_token_time) + 0.1  # Add buffer
-                    wait_time = max(wait_time, tpm_wait)
-            
-            # Wait if needed
-            if wait_time > 0:
-                logger.warning(f"Rate limit approaching, waiting {wait_time:.1f}s")
-                time.sleep(wait_time)
-                current_time = time.time()
-                self._clean_old_entries(current_time)
-            
-            # Record this request
-            self.request_times.append(current_time)
-            if tokens > 0:
-                self.token_counts.append((current_time, tokens))
-            
-            return wait_time
+        wait_time = self._requests.wait(1)
+        if tokens > 0:
+            wait_time += self._tokens.wait(tokens)
+        
+        if wait_time > 1.0:
+            logger.warning(f"Rate limit reached, waited {wait_time:.1f}s")
+        
+        return wait_time
     
     def __enter__(self):
         return self
@@ -112,17 +130,135 @@ class RateLimiter:
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
 
+class AsyncRateLimiter:
+    """
+    Proactive token bucket for async API calls (RPM and TPM).
+    
+    Modeled on openai-cookbook's api_request_parallel_processor: request and
+    token capacity refill continuously at limit/60 per second, and each call
+    waits until both buckets can cover it, so requests are paced before the
+    API would answer 429.
+    
+    Usage:
+        limiter = AsyncRateLimiter(rpm=3500, tpm=90000)
+        await limiter.acquire(tokens=1200)
+        # Make API call
+    """
+    
+    def __init__(self, rpm: int = None, tpm: int = None):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            rpm: Requests per minute limit
+            tpm: Tokens per minute limit
+        """
+        self.rpm = rpm or config.API_RATE_LIMIT_RPM
+        self.tpm = tpm or config.API_RATE_LIMIT_TPM
+        
+        # Buckets start full
+        self.available_request_capacity = float(self.rpm)
+        self.available_token_capacity = float(self.tpm)
+        self.last_update = time.monotonic()
+        
+        # asyncio.Lock is tied to a loop; recreated when the loop changes
+        self._lock = None
+        self._lock_loop = None
+        
+        logger.info(f"Async rate limiter initialized | RPM={self.rpm} | TPM={self.tpm}")
+    
+    def update_limits(self, rpm: int = None, tpm: int = None):
+        """
+        Replace the limits (e.g. with values reported by the API).
+        
+        Args:
+            rpm: Requests per minute limit
+            tpm: Tokens per minute limit
+        """
+        self._refill(time.monotonic())
+        if rpm:
+            self.rpm = rpm
+            self.available_request_capacity = min(self.available_request_capacity, float(rpm))
+        if tpm:
+            self.tpm = tpm
+            self.available_token_capacity = min(self.available_token_capacity, float(tpm))
+        
+        logger.info(f"Rate limits updated | RPM={self.rpm} | TPM={self.tpm}")
+    
+    def _refill(self, current_time: float):
+        """Add the capacity accrued since the last update."""
+        elapsed = current_time - self.last_update
+        self.available_request_capacity = min(
+            self.available_request_capacity + self.rpm * elapsed / 60, self.rpm
+        )
+        self.available_token_capacity = min(
+            self.available_token_capacity + self.tpm * elapsed / 60, self.tpm
+        )
+        self.last_update = current_time
+    
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+    
+    async def acquire(self, tokens: int = 0) -> float:
+        """
+        Wait until one request and `tokens` tokens are available, then take them.
+        
+        Waiters are served in arrival order.
+        
+        Args:
+            tokens: Estimated tokens for this request (prompt + max completion)
+        
+        Returns:
+            Time waited in seconds
+        """
+        # A request larger than the whole bucket waits for a full bucket
+        tokens = min(tokens, self.tpm)
+        waited = 0.0
+        
+        async with self._get_lock():
+            while True:
+                self._refill(time.monotonic())
+                
+                if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                    self.available_request_capacity -= 1
+                    self.available_token_capacity -= tokens
+                    break
+                
+                # Sleep until the scarcer bucket has refilled enough
+                request_wait = max(0.0, 1 - self.available_request_capacity) * 60 / self.rpm
+                token_wait = max(0.0, tokens - self.available_token_capacity) * 60 / self.tpm
+                wait_time = max(request_wait, token_wait)
+                
+                await asyncio.sleep(wait_time)
+                waited += wait_time
+        
+        if waited > 1.0:
+            logger.debug(f"Throttled API call for {waited:.1f}s | tokens={tokens}")
+        
+        return waited
+
 # ============================================================================
 # PARALLEL EXECUTOR
 # ============================================================================
 
+# In-flight futures per worker in map(); bounds queue depth for large inputs
+_MAP_WINDOW_PER_WORKER = 4
+
 class ParallelExecutor:
     """
     Execute tasks in parallel with rate limiting.
     
     Usage:
-        executor = ParallelExecutor(max_workers=5)
-        results = executor.map(process_func, items)
+        with ParallelExecutor(max_workers=5) as executor:
+            results = executor.map(process_func, items)
+            more_results = executor.map(process_func, more_items)  # same worker threads
+        
+        # I/O-bound coroutines: one event loop instead of a thread per worker
+        results = executor.run_async_map(async_process_func, items)
     """
     
     def __init__(
@@ -137,11 +273,32 @@ class ParallelExecutor:
             max_workers: Maximum parallel workers
             rate_limiter: Optional rate limiter
         """
-        self.max_workers = max_workers or config.MAX_WORKERS
+        self.max_workers = max_workers or config.SETTINGS.max_workers
         self.rate_limiter = rate_limiter
         
+        # Worker pool, created on first parallel map() and reused until close()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
         logger.info(f"Parallel executor initialized | max_workers={self.max_workers}")
     
+    def _pool(self) -> ThreadPoolExecutor:
+        """Return the shared worker pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pe")
+        return self._executor
+    
+    def close(self):
+        """Shut down the worker pool (a later map() starts a new one)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
     def map(
         self,
         func: Callable,
@@ -165,27 +322,38 @@ class ParallelExecutor:
         
         results = [None] * len(items)
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_index = {
-                executor.submit(func, item): i
-                for i, item in enumerate(items)
-            }
-            
-            # Collect results as they complete
-            completed = 0
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                try:
-                    results[index] = future.result()
-                    completed += 1
-                    
-                    if show_progress and completed % 10 == 0:
-                        logger.info(f"Progress: {completed}/{len(items)} completed")
-                        
-                except Exception as e:
-                    logger.error(f"Task {index} failed: {e}")
-                    results[index] = None
+        def run_one(index: int, item: Any):
+            # Tasks report their own index, so no Future → index map is needed
+            try:
+                return index, func(item)
+            except Exception as e:
+                logger.error(f"Task {index} failed: {e}")
+                return index, None
+        
+        executor = self._pool()
+        
+        # Rolling window: keep at most max_workers * _MAP_WINDOW_PER_WORKER
+        # futures in flight, submitting the next item as each one completes
+        pending = enumerate(items)
+        in_flight = {
+            executor.submit(run_one, i, item)
+            for i, item in itertools.islice(pending, self.max_workers * _MAP_WINDOW_PER_WORKER)
+        }
+        
+        # Collect results as they complete
+        completed = 0
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, results[index] = future.result()
+                completed += 1
+                
+                if show_progress and completed % 10 == 0:
+                    logger.info(f"Progress: {completed}/{len(items)} completed")
+                
+                next_task = next(pending, None)
+                if next_task is not None:
+                    in_flight.add(executor.submit(run_one, *next_task))
         
         logger.info(f"Parallel execution completed | total={len(items)}")
         
@@ -224,26 +392,78 @@ class ParallelExecutor:
             return func(item)
         
         return self.map(wrapped_func, items, show_progress)
+    
+    async def async_map(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: List[Any],
+        show_progress: bool = True,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        token_estimator: Optional[Callable[[Any], int]] = None
+    ) -> List[Any]:
+        """
+        Await a coroutine function over items, at most max_workers at a time.
+        
+        Args:
+            func: Coroutine function to apply to each item
+            items: List of items to process
+            show_progress: Whether to show progress
+            rate_limiter: Optional async rate limiter acquired before each call
+            token_estimator: Optional function to estimate tokens for an item
+        
+        Returns:
+            List of results in item order (None for failed items, as in map)
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        completed = 0
+        
+        async def run_one(index: int, item: Any) -> Any:
+            nonlocal completed
+            async with semaphore:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire(token_estimator(item) if token_estimator else 0)
+                try:
+                    result = await func(item)
+                except Exception as e:
+                    logger.error(f"Task {index} failed: {e}")
+                    return None
+            completed += 1
+            if show_progress and completed % 10 == 0:
+                logger.info(f"Progress: {completed}/{len(items)} completed")
+            return result
+        
+        # gather preserves order, so no index map or result lock is needed
+        results = await asyncio.gather(*(run_one(i, item) for i, item in enumerate(items)))
+        
+        logger.info(f"Async execution completed | total={len(items)}")
+        
+        return results
+    
+    def run_async_map(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: List[Any],
+        **kwargs
+    ) -> List[Any]:
+        """Synchronous wrapper: run async_map on a fresh event loop (see async_map for arguments)."""
+        return asyncio.run(self.async_map(func, items, **kwargs))
 
 # ============================================================================
 # BATCH PROCESSOR
 # ============================================================================
 
-def batch_items(items: List[Any], batch_size: int) -> List[List[Any]]:
+def batch_items(items: List[Any], batch_size: int) -> Iterator[List[Any]]:
     """
-    Split items into batches.
+    Split items into batches lazily.
     
     Args:
         items: List of items
         batch_size: Size of each batch
     
     Returns:
-        List of batches
+        Generator of batch slices (wrap in list() if a list is needed)
     """
-    batches = []
-    for i in range(0, len(items), batch_size):
-        batches.append(items[i:i + batch_size])
-    return batches
+    return (items[i:i + batch_size] for i in range(0, len(items), batch_size))
 
 def process_in_batches(
     func: Callable,
@@ -257,30 +477,71 @@ def process_in_batches(
     Args:
         func: Function to apply to each batch
         items: List of items
-        batch_size: Size of each batch (default: config.BATCH_SIZE)
+        batch_size: Size of each batch (default: config.SETTINGS.batch_size)
         parallel: Whether to process batches in parallel
     
     Returns:
         Flattened list of results
     """
-    batch_size = batch_size or config.BATCH_SIZE
+    batch_size = batch_size or config.SETTINGS.batch_size
     batches = batch_items(items, batch_size)
     
-    logger.info(f"Processing {len(items)} items in {len(batches)} batches")
+    n_batches = -(-len(items) // batch_size)
+    
+    logger.info(f"Processing {len(items)} items in {n_batches} batches")
     
     if parallel and config.ENABLE_PARALLEL:
-        executor = ParallelExecutor()
-        batch_results = executor.map(func, batches)
+        with ParallelExecutor() as executor:
+            batch_results = executor.map(func, list(batches))
     else:
-        batch_results = [func(batch) for batch in batches]
+        batch_results = map(func, batches)
+    
+    # Flatten in one pass, skipping empty/failed batches
+    return list(itertools.chain.from_iterable(r for r in batch_results if r))
+
+def process_in_batches_iter(
+    func: Callable,
+    items: List[Any],
+    batch_size: int = None,
+    parallel: bool = True
+) -> Iterator[Any]:
+    """
+    Process items in batches, yielding results as each batch finishes.
+    
+    Unlike process_in_batches, results are not held until every batch is
+    done, so a streaming consumer only keeps finished-but-unread batches in
+    memory. In parallel mode batches are yielded in completion order, not
+    input order.
+    
+    Args:
+        func: Function to apply to each batch
+        items: List of items
+        batch_size: Size of each batch (default: config.SETTINGS.batch_size)
+        parallel: Whether to process batches in parallel
+    
+    Yields:
+        Individual results from each batch (failed batches are logged and skipped)
+    """
+    batch_size = batch_size or config.SETTINGS.batch_size
+    batches = batch_items(items, batch_size)
     
-    # Flatten results
-    results = []
-    for batch_result in batch_results:
-        if batch_result:
-            results.extend(batch_result)
+    if not (parallel and config.ENABLE_PARALLEL):
+        for batch in batches:
+            batch_result = func(batch)
+            if batch_result:
+                yield from batch_result
+        return
     
-    return results
+    with ThreadPoolExecutor(max_workers=config.SETTINGS.max_workers) as executor:
+        futures = [executor.submit(func, batch) for batch in batches]
+        for future in as_completed(futures):
+            try:
+                batch_result = future.result()
+            except Exception as e:
+                logger.error(f"Batch failed: {e}")
+                continue
+            if batch_result:
+                yield from batch_result
 
 # ============================================================================
 # WORKER UTILIZATION TRACKER
@@ -304,9 +565,20 @@ class WorkerUtilizationTracker:
         Args:
             max_workers: Maximum workers
         """
-        self.max_workers = max_workers or config.MAX_WORKERS
-        self.active_workers = 0
-        self.lock = threading.Lock()
+        self.max_workers = max_workers or config.SETTINGS.max_workers
+        
+        # Lock-free: next() on itertools.count is atomic under the GIL. Each
+        # enter/exit stores its ticket; a racing store can lag by one task
+        # until the next enter/exit, which metrics tolerate.
+        self._started = itertools.count(1)
+        self._finished = itertools.count(1)
+        self._started_total = 0
+        self._finished_total = 0
+    
+    @property
+    def active_workers(self) -> int:
+        """Tasks currently inside task()."""
+        return max(0, self._started_total - self._finished_total)
     
     def task(self):
         """Context manager for tracking a task."""
@@ -317,12 +589,12 @@ class WorkerUtilizationTracker:
             self.tracker = tracker
         
         def __enter__(self):
-            with self.tracker.lock:
-                self.tracker.active_workers += 1
+            tracker = self.tracker
+            tracker._started_total = next(tracker._started)
         
         def __exit__(self, exc_type, exc_val, exc_tb):
-            with self.tracker.lock:
-                self.tracker.active_workers -= 1
+            tracker = self.tracker
+            tracker._finished_total = next(tracker._finished)
     
     def get_utilization(self) -> float:
         """
@@ -331,18 +603,20 @@ class WorkerUtilizationTracker:
         Returns:
             Utilization ratio
         """
-        with self.lock:
-            return self.active_workers / self.max_workers
+        return self.active_workers / self.max_workers
 
 # ============================================================================
 # EXPORT
 # ============================================================================
 
 __all__ = [
+    "TokenBucket",
     "RateLimiter",
+    "AsyncRateLimiter",
     "ParallelExecutor",
     "batch_items",
     "process_in_batches",
+    "process_in_batches_iter",
     "WorkerUtilizationTracker",
 ]
 
@@ -1,9 +1,11 @@
 """
 Quality scoring system for episode processing runs.
 """
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, List
-from dataclasses import dataclass, field
-from datetime import datetime
+import orjson
 from loguru import logger
 import config
 
@@ -11,46 +13,25 @@ import config
 # QUALITY METRICS
 # ============================================================================
 
-@dataclass
-class QualityMetrics:
+class QualityMetrics(config.QualityMetrics):
     """Track quality metrics during pipeline execution."""
     
-    episode_id: str
-    
-    # Error counts
-    errors_count: int = 0
-    parsing_errors: List[str] = field(default_factory=list)
-    api_errors: List[str] = field(default_factory=list)
-    
-    # Retry counts
-    retries_count: int = 0
-    
-    # Malformed data counts
-    malformed_beliefs_count: int = 0
-    
-    # Registry issues
-    registry_mismatches_count: int = 0
-    
-    # Warnings
-    warnings: List[str] = field(default_factory=list)
-    
-    # Timing
-    execution_time_seconds: float = 0.0
-    
-    # Timestamp
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Fields and slots come from config.QualityMetrics. Callers already log
+    # each failure where it happens, so recording stays at DEBUG and the
+    # totals are logged once by QualityScorer.generate_report().
+    __slots__ = ()
     
     def add_parsing_error(self, error: str):
         """Add a parsing error."""
         self.parsing_errors.append(error)
         self.errors_count += 1
-        logger.warning(f"Parsing error recorded: {error}")
+        logger.debug("Parsing error recorded: {}", error)
     
     def add_api_error(self, error: str):
         """Add an API error."""
         self.api_errors.append(error)
         self.errors_count += 1
-        logger.warning(f"API error recorded: {error}")
+        logger.debug("API error recorded: {}", error)
     
     def add_retry(self):
         """Increment retry count."""
@@ -67,12 +48,18 @@ class QualityMetrics:
     def add_warning(self, warning: str):
         """Add a warning."""
         self.warnings.append(warning)
-        logger.info(f"Warning recorded: {warning}")
+        logger.debug("Warning recorded: {}", warning)
 
 # ============================================================================
 # QUALITY SCORER
 # ============================================================================
 
+# Penalty weights bound once at import (points deducted per occurrence)
+_PENALTY_ERROR = config.QUALITY_PENALTY_ERROR
+_PENALTY_RETRY = config.QUALITY_PENALTY_RETRY
+_PENALTY_MALFORMED = config.QUALITY_PENALTY_MALFORMED
+_PENALTY_MISMATCH = config.QUALITY_PENALTY_MISMATCH
+
 class QualityScorer:
     """
     Calculate quality score for an episode.
@@ -85,6 +72,8 @@ class QualityScorer:
         print(f"Quality: {report['quality_grade']}")
     """
     
+    __slots__ = ("metrics",)
+    
     def __init__(self, episode_id: str):
         """
         Initialize quality scorer.
@@ -106,27 +95,21 @@ class QualityScorer:
         Returns:
             Quality score (0-100)
         """
-        score = 100.0
-        
-        # Deduct for errors
-        score -= self.metrics.errors_count * config.QUALITY_PENALTY_ERROR
-        
-        # Deduct for retries
-        score -= self.metrics.retries_count * config.QUALITY_PENALTY_RETRY
-        
-        # Deduct for malformed beliefs
-        score -= self.metrics.malformed_beliefs_count * config.QUALITY_PENALTY_MALFORMED
-        
-        # Deduct for registry mismatches
-        score -= self.metrics.registry_mismatches_count * config.QUALITY_PENALTY_MISMATCH
+        m = self.metrics
+        deductions = (
+            m.errors_count * _PENALTY_ERROR
+            + m.retries_count * _PENALTY_RETRY
+            + m.malformed_beliefs_count * _PENALTY_MALFORMED
+            + m.registry_mismatches_count * _PENALTY_MISMATCH
+        )
         
-        # Ensure score is not negative
-        score = max(0.0, score)
+        # Score is never negative
+        score = max(0.0, 100.0 - deductions)
         
         logger.info(
-            f"Quality score calculated | episode_id={self.metrics.episode_id} | "
-            f"score={score:.1f} | errors={self.metrics.errors_count} | "
-            f"retries={self.metrics.retries_count}"
+            f"Quality score calculated | episode_id={m.episode_id} | "
+            f"score={score:.1f} | errors={m.errors_count} | "
+            f"retries={m.retries_count}"
         )
         
         return score
@@ -141,16 +124,7 @@ class QualityScorer:
         Returns:
             Quality grade (A, B, C, D, F)
         """
-        if score >= config.QUALITY_THRESHOLDS["A"]:
-            return "A"
-        elif score >= config.QUALITY_THRESHOLDS["B"]:
-            return "B"
-        elif score >= config.QUALITY_THRESHOLDS["C"]:
-            return "C"
-        elif score >= config.QUALITY_THRESHOLDS["D"]:
-            return "D"
-        else:
-            return "F"
+        return config.score_to_grade(score)
     
     def generate_report(self) -> Dict:
         """
@@ -181,6 +155,12 @@ class QualityScorer:
             f"Quality report generated | episode_id={self.metrics.episode_id} | "
             f"grade={grade} | score={score:.1f}"
         )
+        if self.metrics.parsing_errors or self.metrics.api_errors or self.metrics.warnings:
+            logger.warning(
+                f"Quality issues recorded | episode_id={self.metrics.episode_id} | "
+                f"parsing_errors={len(self.metrics.parsing_errors)} | "
+                f"api_errors={len(self.metrics.api_errors)} | warnings={len(self.metrics.warnings)}"
+            )
         
         return report
     
@@ -191,9 +171,6 @@ class QualityScorer:
         Args:
             output_path: Optional custom output path
         """
-        import json
-        from pathlib import Path
-        
         if output_path is None:
             checkpoint_dir = config.CHECKPOINTS_DIR / self.metrics.episode_id
             checkpoint_dir.mkdir(parents=True, exist_ok=True)
@@ -201,8 +178,7 @@ class QualityScorer:
         
         report = self.generate_report()
         
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        Path(output_path).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         logger.info(f"Quality report saved | path={output_path}")
 
@@ -210,6 +186,9 @@ class QualityScorer:
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Report loads are small independent reads; overlap them to hide disk latency
+_REPORT_LOAD_WORKERS = 32
+
 def load_quality_report(episode_id: str) -> Dict:
     """
     Load quality report for an episode.
@@ -220,16 +199,13 @@ def load_quality_report(episode_id: str) -> Dict:
     Returns:
         Quality report dictionary or None if not found
     """
-    import json
-    
     report_path = config.CHECKPOINTS_DIR / episode_id / "quality_report.json"
     
     if not report_path.exists():
         logger.warning(f"Quality report not found for episode: {episode_id}")
         return None
     
-    with open(report_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(report_path.read_bytes())
 
 def get_quality_summary(episode_ids: List[str]) -> Dict:
     """
@@ -241,26 +217,36 @@ def get_quality_summary(episode_ids: List[str]) -> Dict:
     Returns:
         Summary statistics
     """
-    reports = [load_quality_report(ep_id) for ep_id in episode_ids]
-    reports = [r for r in reports if r is not None]
+    if len(episode_ids) > 1:
+        with ThreadPoolExecutor(max_workers=min(_REPORT_LOAD_WORKERS, len(episode_ids))) as executor:
+            reports = list(executor.map(load_quality_report, episode_ids))
+    else:
+        reports = [load_quality_report(ep_id) for ep_id in episode_ids]
     
-    if not reports:
-        return {}
-    
-    total_episodes = len(reports)
-    avg_score = sum(r["quality_score"] for r in reports) / total_episodes
-    
-    grade_counts = {}
+    # Single pass over the reports for every statistic
+    total_episodes = 0
+    total_score = 0.0
+    total_errors = 0
+    total_retries = 0
+    grade_counts = Counter()
     for report in reports:
-        grade = report["quality_grade"]
-        grade_counts[grade] = grade_counts.get(grade, 0) + 1
+        if report is None:
+            continue
+        total_episodes += 1
+        total_score += report["quality_score"]
+        total_errors += report["errors_count"]
+        total_retries += report["retries_count"]
+        grade_counts[report["quality_grade"]] += 1
+    
+    if not total_episodes:
+        return {}
     
     return {
         "total_episodes": total_episodes,
-        "average_score": avg_score,
-        "grade_distribution": grade_counts,
-        "total_errors": sum(r["errors_count"] for r in reports),
-        "total_retries": sum(r["retries_count"] for r in reports),
+        "average_score": total_score / total_episodes,
+        "grade_distribution": dict(grade_counts),
+        "total_errors": total_errors,
+        "total_retries": total_retries,
     }
 
 # ============================================================================
@@ -1,13 +1,49 @@
 """
 Retry logic with exponential backoff for API calls.
 """
-import time
+import asyncio
+import inspect
 import functools
+import threading
 from typing import Callable, Type, Tuple, Optional
+import openai
 from loguru import logger
 import config
 from .exceptions import RateLimitError
 
+# ============================================================================
+# CANCELLATION
+# ============================================================================
+
+# Set during shutdown so every thread sleeping between retries wakes up at once
+_cancel_event = threading.Event()
+
+def cancel_retries():
+    """Interrupt pending backoff waits; retrying calls re-raise their last error."""
+    _cancel_event.set()
+
+def resume_retries():
+    """Re-enable retries after cancel_retries()."""
+    _cancel_event.clear()
+
+# Longest an async backoff sleeps before rechecking _cancel_event
+_CANCEL_POLL_SECONDS = 0.25
+
+async def _async_cancellable_wait(wait_time: float) -> bool:
+    """asyncio counterpart of _cancel_event.wait: True if cancel_retries() was called."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait_time
+    while not _cancel_event.is_set():
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(_CANCEL_POLL_SECONDS, remaining))
+    return True
+
+def _backoff_waits(backoff_factor: float, max_wait: float, max_retries: int, multiplier: float = 1) -> Tuple[float, ...]:
+    """Wait before each retry, indexed by retry number - 1."""
+    return tuple(min(backoff_factor ** i * multiplier, max_wait) for i in range(1, max_retries + 1))
+
 # ============================================================================
 # RETRY DECORATOR
 # ============================================================================
@@ -37,6 +73,7 @@ def retry_with_backoff(
     max_retries = max_retries if max_retries is not None else config.MAX_RETRIES
     backoff_factor = backoff_factor if backoff_factor is not None else config.RETRY_BACKOFF_FACTOR
     max_wait = max_wait if max_wait is not None else config.RETRY_MAX_WAIT
+    waits = _backoff_waits(backoff_factor, max_wait, max_retries)
     
     def decorator(func):
         @functools.wraps(func)
@@ -56,8 +93,8 @@ def retry_with_backoff(
                         )
                         raise
                     
-                    # Calculate wait time with exponential backoff
-                    wait_time = min(backoff_factor ** retries, max_wait)
+                    # Exponential backoff, precomputed per retry
+                    wait_time = waits[retries - 1]
                     
                     logger.warning(
                         f"Retry {retries}/{max_retries} for {func.__name__} "
@@ -68,7 +105,9 @@ def retry_with_backoff(
                     if on_retry:
                         on_retry(retries, e)
                     
-                    time.sleep(wait_time)
+                    # Event.wait returns early (True) once cancel_retries() is called
+                    if _cancel_event.wait(wait_time):
+                        raise
             
             # Should never reach here
             raise RuntimeError(f"Unexpected retry logic error in {func.__name__}")
@@ -84,7 +123,11 @@ def retry_openai_call(max_retries: int = None):
     """
     Decorator specifically for OpenAI API calls.
     
-    Handles rate limits (429), timeouts, and other OpenAI-specific errors.
+    Retries openai.RateLimitError (429), connection/timeout errors and
+    InternalServerError (5xx); any other exception is raised immediately.
+    Coroutine functions are wrapped with an async wrapper that waits with
+    asyncio.sleep, so retries never block the event loop. Both wrappers stop
+    retrying once cancel_retries() is called.
     
     Args:
         max_retries: Maximum number of retries
@@ -96,8 +139,59 @@ def retry_openai_call(max_retries: int = None):
             return response
     """
     max_retries = max_retries if max_retries is not None else config.MAX_RETRIES
+    waits = _backoff_waits(config.RETRY_BACKOFF_FACTOR, config.RETRY_MAX_WAIT, max_retries)
+    rate_limit_waits = _backoff_waits(config.RETRY_BACKOFF_FACTOR, config.RETRY_MAX_WAIT, max_retries, multiplier=2)
     
     def decorator(func):
+        def backoff(retries: int, e: Exception) -> float:
+            """Return the wait before attempt `retries`, or raise if not retryable."""
+            # The SDK types every retryable failure, so classify by class, not message text
+            if isinstance(e, openai.RateLimitError):
+                error_label, step_waits = "Rate limit", rate_limit_waits  # longer waits
+            elif isinstance(e, openai.APIConnectionError):
+                # Includes APITimeoutError
+                error_label, step_waits = "Timeout", waits
+            elif isinstance(e, openai.InternalServerError):
+                error_label, step_waits = "Server error", waits
+            else:
+                logger.error(f"Non-retryable error in {func.__name__}: {type(e).__name__}: {e}")
+                raise e
+            
+            if retries > max_retries:
+                logger.error(
+                    f"Max retries ({max_retries}) exceeded for {func.__name__}: {type(e).__name__}: {e}"
+                )
+                if isinstance(e, openai.RateLimitError):
+                    raise RateLimitError(f"Rate limit exceeded after {max_retries} retries") from e
+                raise e
+            
+            wait_time = step_waits[retries - 1]
+            
+            logger.warning(
+                f"{error_label} - Retry {retries}/{max_retries} for {func.__name__} "
+                f"after {wait_time:.1f}s"
+            )
+            
+            return wait_time
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                retries = 0
+                
+                while retries <= max_retries:
+                    try:
+                        return await func(*args, **kwargs)
+                    
+                    except Exception as e:
+                        retries += 1
+                        if await _async_cancellable_wait(backoff(retries, e)):
+                            raise
+                
+                raise RuntimeError(f"Unexpected retry logic error in {func.__name__}")
+            
+            return async_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             retries = 0
@@ -107,50 +201,9 @@ def retry_openai_call(max_retries: int = None):
                     return func(*args, **kwargs)
                     
                 except Exception as e:
-                    error_type = type(e).__name__
-                    error_msg = str(e)
-                    
-                    # Check for rate limit (429)
-                    is_rate_limit = "429" in error_msg or "rate_limit" in error_msg.lower()
-                    
-                    # Check for timeout
-                    is_timeout = "timeout" in error_msg.lower() or "timed out" in error_msg.lower()
-                    
-                    # Check for server error (5xx)
-                    is_server_error = any(code in error_msg for code in ["500", "502", "503", "504"])
-                    
-                    # Only retry on specific errors
-                    if not (is_rate_limit or is_timeout or is_server_error):
-                        logger.error(f"Non-retryable error in {func.__name__}: {error_type}: {error_msg}")
-                        raise
-                    
                     retries += 1
-                    
-                    if retries > max_retries:
-                        logger.error(
-                            f"Max retries ({max_retries}) exceeded for {func.__name__}: {error_type}: {error_msg}"
-                        )
-                        if is_rate_limit:
-                            raise RateLimitError(f"Rate limit exceeded after {max_retries} retries")
+                    if _cancel_event.wait(backoff(retries, e)):
                         raise
-                    
-                    # Calculate wait time (longer for rate limits)
-                    if is_rate_limit:
-                        wait_time = min(config.RETRY_BACKOFF_FACTOR ** retries * 2, config.RETRY_MAX_WAIT)
-                        error_label = "Rate limit"
-                    elif is_timeout:
-                        wait_time = min(config.RETRY_BACKOFF_FACTOR ** retries, config.RETRY_MAX_WAIT)
-                        error_label = "Timeout"
-                    else:
-                        wait_time = min(config.RETRY_BACKOFF_FACTOR ** retries, config.RETRY_MAX_WAIT)
-                        error_label = "Server error"
-                    
-                    logger.warning(
-                        f"{error_label} - Retry {retries}/{max_retries} for {func.__name__} "
-                        f"after {wait_time:.1f}s"
-                    )
-                    
-                    time.sleep(wait_time)
             
             raise RuntimeError(f"Unexpected retry logic error in {func.__name__}")
         
@@ -194,6 +247,8 @@ class RetryCounter:
 __all__ = [
     "retry_with_backoff",
     "retry_openai_call",
+    "cancel_retries",
+    "resume_retries",
     "RetryCounter",
 ]
 
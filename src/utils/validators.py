@@ -1,11 +1,24 @@
 """
 Input validation functions for Belief Engine.
 """
+import os
 import re
-from datetime import datetime
 from typing import Tuple, Optional
 from .exceptions import ValidationError
 
+# Compiled once: these run per transcript line and per belief
+_EP_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+_URI_TIME_RE = re.compile(r"^\d+(?:,\d+)?$")
+
+# ASCII digits, deleted by bytes.translate to check a timestamp has nothing else but its colons
+_DIGITS = b"0123456789"
+# ord("0") * 11: subtracted once per two-digit field, (10a + b) - 528 == 10(a-48) + (b-48)
+_TWO_DIGIT_BIAS = 528
+# Zero-padded two-digit fields, concatenated by seconds_to_timestamp instead of formatted
+_PAD2 = tuple(f"{i:02d}" for i in range(100))
+# Days per month (index 0 unused); February gets +1 in leap years
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 # ============================================================================
 # TIMESTAMP VALIDATION
 # ============================================================================
@@ -23,13 +36,24 @@ def validate_timestamp(timestamp: str) -> bool:
     Raises:
         ValidationError: If timestamp is invalid
     """
-    pattern = r"^\d{2}:\d{2}:\d{2}$"
-    if not re.match(pattern, timestamp):
+    _parse_timestamp(timestamp)
+    return True
+
+def _parse_timestamp(timestamp: str) -> Tuple[int, int, int]:
+    """Validate an HH:MM:SS timestamp and return (hours, minutes, seconds)."""
+    # Fixed-offset byte checks instead of a regex: 8 bytes, ':' at 2 and 5, digits elsewhere
+    try:
+        raw = timestamp.encode("ascii")
+    except UnicodeEncodeError:
+        raw = b""
+    if len(raw) != 8 or raw[2] != 0x3A or raw[5] != 0x3A or raw.translate(None, _DIGITS) != b"::":
         raise ValidationError(f"Invalid timestamp format: {timestamp}. Expected HH:MM:SS")
     
     # Validate ranges
-    parts = timestamp.split(":")
-    hours, minutes, seconds = int(parts[0]), int(parts[1]), int(parts[2])
+    h1, h2, _, m1, m2, _, s1, s2 = raw
+    hours = h1 * 10 + h2 - _TWO_DIGIT_BIAS
+    minutes = m1 * 10 + m2 - _TWO_DIGIT_BIAS
+    seconds = s1 * 10 + s2 - _TWO_DIGIT_BIAS
     
     if hours < 0 or hours > 23:
         raise ValidationError(f"Invalid hours in timestamp: {hours}")
@@ -38,7 +62,7 @@ def validate_timestamp(timestamp: str) -> bool:
     if seconds < 0 or seconds > 59:
         raise ValidationError(f"Invalid seconds in timestamp: {seconds}")
     
-    return True
+    return hours, minutes, seconds
 
 def timestamp_to_seconds(timestamp: str) -> int:
     """
@@ -50,9 +74,7 @@ def timestamp_to_seconds(timestamp: str) -> int:
     Returns:
         Total seconds
     """
-    validate_timestamp(timestamp)
-    parts = timestamp.split(":")
-    hours, minutes, seconds = int(parts[0]), int(parts[1]), int(parts[2])
+    hours, minutes, seconds = _parse_timestamp(timestamp)
     return hours * 3600 + minutes * 60 + seconds
 
 def seconds_to_timestamp(seconds: int) -> str:
@@ -65,9 +87,10 @@ def seconds_to_timestamp(seconds: int) -> str:
     Returns:
         Timestamp string
     """
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if 0 <= hours < 100:
+        return _PAD2[hours] + ":" + _PAD2[minutes] + ":" + _PAD2[secs]
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 # ============================================================================
@@ -104,14 +127,12 @@ def validate_transcript_line(line: str) -> Tuple[str, str, str, str]:
     if not speaker:
         raise ValidationError("Speaker cannot be empty")
     
-    # Validate timestamps
-    validate_timestamp(start_time)
-    validate_timestamp(end_time)
-    
-    # Validate start < end
+    # Validate timestamps (each parsed once)
     start_seconds = timestamp_to_seconds(start_time)
     end_seconds = timestamp_to_seconds(end_time)
     
+    # Validate start < end
+    
     if start_seconds >= end_seconds:
         raise ValidationError(f"Start time {start_time} must be before end time {end_time}")
     
@@ -142,8 +163,7 @@ def validate_episode_id(episode_id: str) -> bool:
         raise ValidationError("Episode ID cannot be empty")
     
     # Allow alphanumeric, underscores, hyphens
-    pattern = r"^[a-zA-Z0-9_-]+$"
-    if not re.match(pattern, episode_id):
+    if not _EP_RE.match(episode_id):
         raise ValidationError(
             f"Invalid episode ID: {episode_id}. "
             "Only alphanumeric characters, underscores, and hyphens allowed"
@@ -216,8 +236,7 @@ def validate_audio_uri(uri: str) -> bool:
         raise ValidationError("Audio filename cannot be empty")
     
     # Validate time part (either single number or start,end)
-    time_pattern = r"^\d+$|^\d+,\d+$"
-    if not re.match(time_pattern, time_part):
+    if not _URI_TIME_RE.match(time_part):
         raise ValidationError(
             f"Invalid audio URI time part: {time_part}. "
             "Expected single timestamp or start,end"
@@ -242,11 +261,23 @@ def validate_iso_date(date_str: str) -> bool:
     Raises:
         ValidationError: If date is invalid
     """
+    # Fixed-offset checks instead of building a datetime: 10 bytes, '-' at 4 and 7
     try:
-        datetime.fromisoformat(date_str)
-        return True
-    except ValueError as e:
-        raise ValidationError(f"Invalid ISO date: {date_str}. Error: {e}")
+        raw = date_str.encode("ascii")
+    except UnicodeEncodeError:
+        raw = b""
+    if len(raw) != 10 or raw[4] != 0x2D or raw[7] != 0x2D or raw.translate(None, _DIGITS) != b"--":
+        raise ValidationError(f"Invalid ISO date: {date_str}. Expected YYYY-MM-DD")
+    
+    year, month, day = int(raw[0:4]), int(raw[5:7]), int(raw[8:10])
+    if year < 1 or not 1 <= month <= 12:
+        raise ValidationError(f"Invalid ISO date: {date_str}. Year or month out of range")
+    
+    leap_day = month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    if not 1 <= day <= _MONTH_DAYS[month] + leap_day:
+        raise ValidationError(f"Invalid ISO date: {date_str}. Day is out of range for month")
+    
+    return True
 
 # ============================================================================
 # PATH VALIDATION
@@ -266,15 +297,15 @@ def validate_file_path(path: str, must_exist: bool = False) -> bool:
     Raises:
         ValidationError: If path is invalid
     """
-    from pathlib import Path
-    
     if not path:
         raise ValidationError("File path cannot be empty")
     
-    path_obj = Path(path)
-    
-    if must_exist and not path_obj.exists():
-        raise ValidationError(f"File does not exist: {path}")
+    if must_exist:
+        # One stat call, no Path wrapper
+        try:
+            os.stat(path)
+        except (FileNotFoundError, NotADirectoryError, ValueError):
+            raise ValidationError(f"File does not exist: {path}") from None
     
     return True
 
@@ -1,17 +1,42 @@
 """
 W&B logging helper utilities for Belief Engine.
 """
+import time
+import queue
+import threading
+from functools import lru_cache, partial
 from typing import Dict, Any, List, Optional
 from pathlib import Path
-import wandb
 from loguru import logger
 import config
-from wandb_config import MetricNames, ArtifactTypes, log_metrics, log_table, log_artifact, update_summary
+from wandb_config import (
+    MetricNames, METRIC_INDEX, METRIC_COUNT, ArtifactTypes, is_active, log_metrics_batch, log_table, log_artifact, log_artifact_bundle,
+    update_summary
+)
+from .checkpoint import CheckpointManager
 
 # ============================================================================
 # WANDB LOGGER
 # ============================================================================
 
+# Metric events buffered for the background writer; further events are dropped when full
+_QUEUE_SIZE = 4096
+# Seconds the writer coalesces step-less events before one wandb.log call
+_DRAIN_INTERVAL = 1.0
+# Queue sentinel: drain what is left, then stop the writer
+_STOP = object()
+# Accumulator slot for the throttled belief count
+_BELIEFS_EXTRACTED_SLOT = METRIC_INDEX[MetricNames.BELIEFS_EXTRACTED]
+
+@lru_cache(maxsize=1024)
+def _scoped(prefix: str, suffix: str) -> str:
+    """Metric key for a per-phase/per-tier series (built once per pair)."""
+    return f"{prefix}_{suffix}"
+
+def _noop(*args, **kwargs):
+    """Stand-in for every log_*/upload_* method when logging is disabled."""
+    return None
+
 class WandBLogger:
     """
     Centralized W&B logging for pipeline.
@@ -20,20 +45,173 @@ class WandBLogger:
         wb_logger = WandBLogger()
         wb_logger.log_utterances_parsed(count=150)
         wb_logger.log_api_call(tokens=200, cost=0.01, latency=1.5)
+        
+        # Several helpers, one wandb.log call
+        with wb_logger.batch(step=3):
+            wb_logger.log_api_retry()
+            wb_logger.log_phase_duration("extraction", 12.5)
+        
+        wb_logger.close()  # before wandb.finish()
+    
+    Metric helpers only enqueue; a daemon thread calls wandb.log, merging
+    step-less events that arrive within _DRAIN_INTERVAL of each other as long
+    as their keys do not collide. Tables go through the same writer; summaries
+    and artifacts are still sent synchronously.
     """
     
     def __init__(self):
         """Initialize W&B logger."""
-        self.enabled = config.WANDB_ENABLED and wandb.run is not None
+        self.enabled = is_active()
+        # Incremental samples since the last window boundary; latest value per
+        # MetricNames slot (None = nothing held)
         self.log_counter = 0
+        self._held: List[Any] = [None] * METRIC_COUNT
+        
+        # Metric dicts accumulated inside batch()/with blocks, merged and logged by flush()
+        self._pending: List[Dict[str, Any]] = []
+        self._batch_depth = 0
+        self._batch_step: Optional[int] = None
+        
+        # Background writer (only for live runs)
+        self._queue: Optional["queue.Queue[Any]"] = None
+        self._writer: Optional[threading.Thread] = None
+        self._dropped = 0
         
         if not self.enabled:
             logger.info("W&B logging disabled or run not initialized")
+            # Shadow the helpers on the instance so disabled calls skip
+            # building metric dicts and the per-call enabled check
+            for name in dir(type(self)):
+                if name.startswith(("log_", "upload_")):
+                    setattr(self, name, _noop)
+            return
+        
+        self._queue = queue.Queue(maxsize=_QUEUE_SIZE)
+        self._writer = threading.Thread(target=self._drain, name="wandb-writer", daemon=True)
+        self._writer.start()
+    
+    def _log(self, metrics: Dict[str, Any]):
+        """Enqueue now, or accumulate while a batch is open."""
+        if self._batch_depth:
+            self._pending.append(metrics)
+        else:
+            self._enqueue([metrics], None)
+    
+    def _enqueue(self, metrics_list: List[Dict[str, Any]], step: Optional[int]):
+        """Hand metrics to the writer thread without blocking (drop on full)."""
+        if self._queue is None:
+            log_metrics_batch(metrics_list, step=step)
+            return
+        try:
+            self._queue.put_nowait((metrics_list, step))
+        except queue.Full:
+            self._dropped += 1
+            if self._dropped == 1:
+                logger.warning("W&B log queue full; dropping metric events")
+    
+    def _enqueue_call(self, func, *args):
+        """Run a synchronous wandb_config helper on the writer thread (drop on full)."""
+        if self._queue is None:
+            func(*args)
+            return
+        try:
+            self._queue.put_nowait(partial(func, *args))
+        except queue.Full:
+            self._dropped += 1
+            if self._dropped == 1:
+                logger.warning("W&B log queue full; dropping metric events")
+    
+    def _drain(self):
+        """Writer thread: coalesce queued events and forward them to wandb.log."""
+        batch: List[Dict[str, Any]] = []
+        keys = set()
+        deadline = None
+        
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            
+            if item is None or item is _STOP:
+                if batch:
+                    log_metrics_batch(batch)
+                    batch, keys, deadline = [], set(), None
+                if item is _STOP:
+                    return
+                continue
+            
+            if callable(item):
+                # Tables etc.: keep ordering with the metrics queued before them
+                if batch:
+                    log_metrics_batch(batch)
+                    batch, keys, deadline = [], set(), None
+                item()
+                continue
+            
+            metrics_list, step = item
+            new_keys = {key for metrics in metrics_list for key in metrics}
+            
+            # Flush first if the event has its own step or would overwrite a pending key
+            if batch and (step is not None or not keys.isdisjoint(new_keys)):
+                log_metrics_batch(batch)
+                batch, keys, deadline = [], set(), None
+            
+            if step is not None:
+                log_metrics_batch(metrics_list, step=step)
+                continue
+            
+            batch.extend(metrics_list)
+            keys |= new_keys
+            if deadline is None:
+                deadline = time.monotonic() + _DRAIN_INTERVAL
+    
+    def _take_held(self) -> Dict[str, Any]:
+        """Return held values keyed by metric name and clear the slots."""
+        held, self._held = self._held, [None] * METRIC_COUNT
+        return {name: held[index] for name, index in METRIC_INDEX.items() if held[index] is not None}
+    
+    def flush(self, step: Optional[int] = None):
+        """Log accumulated metrics as one wandb.log call (later keys win)."""
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self._enqueue(pending, step)
+    
+    def close(self):
+        """Send everything still queued and stop the writer thread."""
+        held = self._take_held()
+        if held:
+            self._log(held)
+        self.flush(self._batch_step)
+        if self._writer is None:
+            return
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._writer = None
+        self._queue = None
+        if self._dropped:
+            logger.warning(f"W&B log queue dropped {self._dropped} metric events")
+    
+    def batch(self, step: Optional[int] = None) -> "WandBLogger":
+        """
+        Accumulate metrics until the with block exits.
+        
+        Args:
+            step: Optional step number for the combined log call
+        """
+        self._batch_step = step
+        return self
     
-    def _should_log(self) -> bool:
-        """Check if should log (based on frequency)."""
-        self.log_counter += 1
-        return self.log_counter % config.WANDB_LOG_FREQUENCY == 0
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            step, self._batch_step = self._batch_step, None
+            self.flush(step)
     
     # ========================================================================
     # PIPELINE PROGRESS
@@ -41,28 +219,41 @@ class WandBLogger:
     
     def log_utterances_parsed(self, count: int):
         """Log utterances parsed count."""
-        if self.enabled:
-            log_metrics({MetricNames.UTTERANCES_PARSED: count})
+        self._log({MetricNames.UTTERANCES_PARSED: count})
+    
+    def log_utterances_skipped(self, count: int):
+        """Log utterances skipped by the non-belief pre-filter."""
+        self._log({MetricNames.UTTERANCES_SKIPPED: count})
     
     def log_beliefs_extracted(self, count: int, incremental: bool = False):
-        """Log beliefs extracted count."""
-        if self.enabled and (incremental is False or self._should_log()):
-            log_metrics({MetricNames.BELIEFS_EXTRACTED: count})
+        """
+        Log beliefs extracted count.
+        
+        Incremental samples are held and sent once every wandb_log_frequency
+        calls (latest value wins), and any held value is sent by close(), so
+        throttling never loses the final count.
+        """
+        if not incremental:
+            self._held[_BELIEFS_EXTRACTED_SLOT] = None
+            self._log({MetricNames.BELIEFS_EXTRACTED: count})
+            return
+        
+        self.log_counter += 1
+        self._held[_BELIEFS_EXTRACTED_SLOT] = count
+        if self.log_counter % config.SETTINGS.wandb_log_frequency == 0:
+            self._log(self._take_held())
     
     def log_canonical_beliefs_created(self, count: int):
         """Log canonical beliefs created count."""
-        if self.enabled:
-            log_metrics({MetricNames.CANONICAL_BELIEFS_CREATED: count})
+        self._log({MetricNames.CANONICAL_BELIEFS_CREATED: count})
     
     def log_clusters_created(self, count: int):
         """Log clusters created count."""
-        if self.enabled:
-            log_metrics({MetricNames.CLUSTERS_CREATED: count})
+        self._log({MetricNames.CLUSTERS_CREATED: count})
     
     def log_contradictions_detected(self, count: int):
         """Log contradictions detected count."""
-        if self.enabled:
-            log_metrics({MetricNames.CONTRADICTIONS_DETECTED: count})
+        self._log({MetricNames.CONTRADICTIONS_DETECTED: count})
     
     # ========================================================================
     # API METRICS
@@ -73,7 +264,8 @@ class WandBLogger:
         tokens: int = 0,
         cost: float = 0.0,
         latency: float = 0.0,
-        success: bool = True
+        success: bool = True,
+        cached_tokens: int = 0
     ):
         """
         Log API call metrics.
@@ -83,32 +275,65 @@ class WandBLogger:
             cost: Cost in USD
             latency: Response time in seconds
             success: Whether call succeeded
-        """
-        if not self.enabled:
-            return
+            cached_tokens: Prompt tokens served from OpenAI's prompt cache
         
-        metrics = {
-            MetricNames.API_CALLS_TOTAL: 1,
-            MetricNames.API_TOKENS_USED: tokens,
-            MetricNames.API_COST_USD: cost,
-            MetricNames.API_LATENCY_AVG: latency
-        }
+        Zero-valued fields are left out of the event rather than logged as 0.
+        """
+        metrics = {MetricNames.API_CALLS_TOTAL: 1}
+        if tokens:
+            metrics[MetricNames.API_TOKENS_USED] = tokens
+        if cached_tokens:
+            metrics[MetricNames.API_CACHED_TOKENS] = cached_tokens
+        if cost:
+            metrics[MetricNames.API_COST_USD] = cost
+        if latency:
+            metrics[MetricNames.API_LATENCY_AVG] = latency
         
         if not success:
             metrics[MetricNames.API_ERRORS] = 1
         
-        log_metrics(metrics)
+        self._log(metrics)
+    
+    def log_api_usage(
+        self,
+        calls: int,
+        tokens: int = 0,
+        cost: float = 0.0,
+        latency_avg: float = 0.0,
+        errors: int = 0,
+        cached_tokens: int = 0
+    ):
+        """
+        Log aggregated metrics for several API calls.
+        
+        Args:
+            calls: Number of calls aggregated
+            tokens: Total tokens used
+            cost: Total cost in USD
+            latency_avg: Mean response time in seconds
+            errors: Number of failed calls
+            cached_tokens: Total prompt tokens served from OpenAI's prompt cache
+        """
+        if not calls:
+            return
+        
+        self._log({
+            MetricNames.API_CALLS_TOTAL: calls,
+            MetricNames.API_TOKENS_USED: tokens,
+            MetricNames.API_CACHED_TOKENS: cached_tokens,
+            MetricNames.API_COST_USD: cost,
+            MetricNames.API_LATENCY_AVG: latency_avg,
+            MetricNames.API_ERRORS: errors
+        })
     
     def log_api_retry(self):
         """Log API retry."""
-        if self.enabled:
-            log_metrics({MetricNames.API_RETRIES: 1})
+        self._log({MetricNames.API_RETRIES: 1})
     
     def log_rate_limit_hit(self):
         """Log rate limit hit."""
-        if self.enabled:
-            log_metrics({MetricNames.RATE_LIMIT_HITS: 1})
-            logger.warning("Rate limit hit logged to W&B")
+        self._log({MetricNames.RATE_LIMIT_HITS: 1})
+        logger.warning("Rate limit hit logged to W&B")
     
     # ========================================================================
     # QUALITY METRICS
@@ -123,18 +348,17 @@ class WandBLogger:
         registry_mismatches: int
     ):
         """Log quality metrics."""
-        if self.enabled:
-            log_metrics({
-                MetricNames.QUALITY_SCORE: score,
-                MetricNames.QUALITY_GRADE: grade,
-                MetricNames.ERRORS_COUNT: errors_count,
-                MetricNames.MALFORMED_BELIEFS: malformed_beliefs,
-                MetricNames.REGISTRY_MISMATCHES: registry_mismatches
-            })
-            
-            # Also update summary
-            update_summary("quality_score", score)
-            update_summary("quality_grade", grade)
+        self._log({
+            MetricNames.QUALITY_SCORE: score,
+            MetricNames.QUALITY_GRADE: grade,
+            MetricNames.ERRORS_COUNT: errors_count,
+            MetricNames.MALFORMED_BELIEFS: malformed_beliefs,
+            MetricNames.REGISTRY_MISMATCHES: registry_mismatches
+        })
+        
+        # Also update summary
+        update_summary("quality_score", score)
+        update_summary("quality_grade", grade)
     
     # ========================================================================
     # PERFORMANCE METRICS
@@ -142,18 +366,15 @@ class WandBLogger:
     
     def log_phase_duration(self, phase: str, duration: float):
         """Log phase duration."""
-        if self.enabled:
-            log_metrics({f"{MetricNames.PHASE_DURATION}_{phase}": duration})
+        self._log({_scoped(MetricNames.PHASE_DURATION, phase): duration})
     
     def log_throughput(self, beliefs_per_minute: float):
         """Log throughput."""
-        if self.enabled:
-            log_metrics({MetricNames.THROUGHPUT: beliefs_per_minute})
+        self._log({MetricNames.THROUGHPUT: beliefs_per_minute})
     
     def log_worker_utilization(self, utilization: float):
         """Log worker utilization."""
-        if self.enabled:
-            log_metrics({MetricNames.WORKER_UTILIZATION: utilization})
+        self._log({MetricNames.WORKER_UTILIZATION: utilization})
     
     # ========================================================================
     # CLUSTERING METRICS
@@ -166,12 +387,11 @@ class WandBLogger:
         micro_clusters_filtered: int
     ):
         """Log clustering metrics."""
-        if self.enabled:
-            log_metrics({
-                MetricNames.CLUSTERS_TOTAL: clusters_total,
-                MetricNames.AVG_CLUSTER_SIZE: avg_cluster_size,
-                MetricNames.MICRO_CLUSTERS_FILTERED: micro_clusters_filtered
-            })
+        self._log({
+            MetricNames.CLUSTERS_TOTAL: clusters_total,
+            MetricNames.AVG_CLUSTER_SIZE: avg_cluster_size,
+            MetricNames.MICRO_CLUSTERS_FILTERED: micro_clusters_filtered
+        })
     
     def log_ontology_tiers(self, tier_counts: Dict[str, int]):
         """
@@ -180,10 +400,7 @@ class WandBLogger:
         Args:
             tier_counts: Dictionary of tier -> count
         """
-        if self.enabled:
-            # Log as individual metrics
-            for tier, count in tier_counts.items():
-                log_metrics({f"ontology_tier_{tier}": count})
+        self._log({_scoped("ontology_tier", tier): count for tier, count in tier_counts.items()})
     
     # ========================================================================
     # TIMELINE METRICS
@@ -198,14 +415,13 @@ class WandBLogger:
         reversal: int = 0
     ):
         """Log drift detection metrics."""
-        if self.enabled:
-            log_metrics({
-                MetricNames.DRIFT_NEW: new,
-                MetricNames.DRIFT_DROPPED: dropped,
-                MetricNames.DRIFT_STRENGTHENING: strengthening,
-                MetricNames.DRIFT_WEAKENING: weakening,
-                MetricNames.DRIFT_REVERSAL: reversal
-            })
+        self._log({
+            MetricNames.DRIFT_NEW: new,
+            MetricNames.DRIFT_DROPPED: dropped,
+            MetricNames.DRIFT_STRENGTHENING: strengthening,
+            MetricNames.DRIFT_WEAKENING: weakening,
+            MetricNames.DRIFT_REVERSAL: reversal
+        })
     
     # ========================================================================
     # TABLES
@@ -218,7 +434,7 @@ class WandBLogger:
         Args:
             beliefs: List of belief dictionaries
         """
-        if not self.enabled or not beliefs:
+        if not beliefs:
             return
         
         columns = ["id", "belief_text", "confidence", "speaker", "episode_id"]
@@ -233,7 +449,8 @@ class WandBLogger:
             for b in beliefs[:100]  # Limit to 100 for performance
         ]
         
-        log_table("beliefs", columns, data)
+        # Rows are snapshotted here; wandb.Table type inference runs on the writer
+        self._enqueue_call(log_table, "beliefs", columns, data)
     
     def log_contradictions_table(self, contradictions: List[Dict[str, Any]]):
         """
@@ -242,7 +459,7 @@ class WandBLogger:
         Args:
             contradictions: List of contradiction dictionaries
         """
-        if not self.enabled or not contradictions:
+        if not contradictions:
             return
         
         columns = ["belief_a", "belief_b", "opposition_score", "type", "is_reversal"]
@@ -257,7 +474,7 @@ class WandBLogger:
             for c in contradictions[:50]  # Limit for performance
         ]
         
-        log_table("contradictions", columns, data)
+        self._enqueue_call(log_table, "contradictions", columns, data)
     
     # ========================================================================
     # ARTIFACTS
@@ -271,57 +488,75 @@ class WandBLogger:
             episode_id: Episode identifier
             phase: Pipeline phase
         """
-        if not self.enabled:
+        path = CheckpointManager(episode_id, create_dir=False).find_checkpoint_path(phase)
+        if path is None:
+            logger.warning(f"No checkpoint to upload for {episode_id} at phase {phase}")
+            return
+        
+        log_artifact(
+            name=f"checkpoint_{episode_id}_{phase}",
+            artifact_type=ArtifactTypes.CHECKPOINT,
+            path=path,
+            description=f"Checkpoint for {episode_id} at phase {phase}"
+        )
+    
+    def upload_phase_bundle(self, phase: str, paths: Dict[str, Path], episode_id: Optional[str] = None):
+        """
+        Upload several phase outputs as one artifact version (one commit instead of one per file).
+        
+        Args:
+            phase: Pipeline phase
+            paths: Entry name within the artifact → local path (missing paths are skipped)
+            episode_id: Optional episode identifier for the artifact name
+        """
+        if not paths:
             return
         
-        checkpoint_file = config.CHECKPOINTS_DIR / episode_id / f"{phase}.json"
-        if checkpoint_file.exists():
-            log_artifact(
-                name=f"checkpoint_{episode_id}_{phase}",
-                artifact_type=ArtifactTypes.CHECKPOINT,
-                path=checkpoint_file,
-                description=f"Checkpoint for {episode_id} at phase {phase}"
-            )
+        name = f"phase_{episode_id}_{phase}" if episode_id else f"phase_{phase}"
+        log_artifact_bundle(
+            name=name,
+            artifact_type=ArtifactTypes.BUNDLE,
+            paths=paths,
+            description=f"Outputs of phase {phase}" + (f" for {episode_id}" if episode_id else "")
+        )
     
     def upload_matrix(self, matrix_path: Path):
-        """Upload belief matrix as artifact."""
-        if self.enabled and matrix_path.exists():
-            log_artifact(
-                name="belief_matrix",
-                artifact_type=ArtifactTypes.MATRIX,
-                path=matrix_path,
-                description="Weighted episode × belief matrix"
-            )
+        """Upload belief matrix as artifact (by reference if large; do not rewrite the file afterwards)."""
+        log_artifact(
+            name="belief_matrix",
+            artifact_type=ArtifactTypes.MATRIX,
+            path=matrix_path,
+            description="Weighted episode × belief matrix",
+            by_reference=True
+        )
     
     def upload_ontology(self, ontology_path: Path):
-        """Upload ontology as artifact."""
-        if self.enabled and ontology_path.exists():
-            log_artifact(
-                name="ontology",
-                artifact_type=ArtifactTypes.ONTOLOGY,
-                path=ontology_path,
-                description="Hierarchical belief ontology"
-            )
+        """Upload ontology as artifact (by reference if large; do not rewrite the file afterwards)."""
+        log_artifact(
+            name="ontology",
+            artifact_type=ArtifactTypes.ONTOLOGY,
+            path=ontology_path,
+            description="Hierarchical belief ontology",
+            by_reference=True
+        )
     
     def upload_quality_report(self, report_path: Path):
         """Upload quality report as artifact."""
-        if self.enabled and report_path.exists():
-            log_artifact(
-                name="quality_report",
-                artifact_type=ArtifactTypes.REPORT,
-                path=report_path,
-                description="Episode quality report"
-            )
+        log_artifact(
+            name="quality_report",
+            artifact_type=ArtifactTypes.REPORT,
+            path=report_path,
+            description="Episode quality report"
+        )
     
     def upload_logs(self, log_dir: Path):
         """Upload logs as artifact."""
-        if self.enabled and log_dir.exists():
-            log_artifact(
-                name="logs",
-                artifact_type=ArtifactTypes.LOG,
-                path=log_dir,
-                description="Pipeline execution logs"
-            )
+        log_artifact(
+            name="logs",
+            artifact_type=ArtifactTypes.LOG,
+            path=log_dir,
+            description="Pipeline execution logs"
+        )
 
 # ============================================================================
 # EXPORT
@@ -1,12 +1,79 @@
 """
 Utterance splitter for atomic statement extraction.
 """
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Tuple
+import os
 import re
-import uuid
 from loguru import logger
+import config
 from src.models import Utterance
 
+# Sentence boundary: . ! or ? followed by whitespace. Leading with the
+# punctuation class lets re skip straight to candidates instead of trying a
+# lookbehind at every character.
+_SENT_END_RE = re.compile(r'[.!?]\s+')
+
+# Sentence terminators; text without any of them is atomic without a regex scan
+_TERMS = frozenset(".!?")
+
+# Below this many utterances, process pool start-up costs more than the split
+_PARALLEL_SPLIT_MIN = 4096
+# Texts per pickled task sent to a split worker
+_SPLIT_CHUNKSIZE = 1024
+
+# Memoized split results (repeated intros, ads, canned phrases); longer texts
+# are rarely repeated and are split uncached so they do not pin memory
+_SPLIT_CACHE_SIZE = 65536
+_SPLIT_CACHE_MAX_CHARS = 2048
+
+# RFC 4122 variant nibble for each value of the two low random bits
+_UUID_VARIANT = "89ab"
+
+def _uuid4_batch(n: int) -> List[str]:
+    """
+    Generate n random (version 4) UUID strings from one os.urandom call.
+    
+    Same format and randomness as str(uuid.uuid4()), without one urandom
+    read and UUID object per id.
+    """
+    raw = os.urandom(16 * n).hex()
+    variant = _UUID_VARIANT
+    return [
+        f"{raw[i:i + 8]}-{raw[i + 8:i + 12]}-4{raw[i + 13:i + 16]}-"
+        f"{variant[int(raw[i + 16], 16) & 3]}{raw[i + 17:i + 20]}-{raw[i + 20:i + 32]}"
+        for i in range(0, 32 * n, 32)
+    ]
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into stripped, non-empty sentences."""
+    # Simple sentence splitting on . ! ? in one forward scan
+    # Could be enhanced with more sophisticated NLP
+    sentences = []
+    start = 0
+    for match in _SENT_END_RE.finditer(text):
+        sentence = text[start:match.start() + 1].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+    sentence = text[start:].strip()
+    if sentence:
+        sentences.append(sentence)
+    return sentences
+
+@lru_cache(maxsize=_SPLIT_CACHE_SIZE)
+def _split_text_cached(text: str) -> Tuple[str, ...]:
+    return tuple(_split_sentences(text))
+
+def _split_text(text: str) -> Tuple[str, ...]:
+    """Sentences of one utterance text; empty when it has no terminator (module-level so it pickles)."""
+    if _TERMS.isdisjoint(text):
+        return ()
+    if len(text) > _SPLIT_CACHE_MAX_CHARS:
+        return tuple(_split_sentences(text))
+    return _split_text_cached(text)
+
 class UtteranceSplitter:
     """
     Split long utterances into atomic statements.
@@ -26,40 +93,50 @@ class UtteranceSplitter:
         Returns:
             List of atomic utterances
         """
-        logger.info(f"Splitting {len(utterances)} utterances")
+        logger.opt(lazy=True).info("Splitting {} utterances", lambda: len(utterances))
+        
+        # Only the texts cross the process boundary; Utterances are built here
+        texts = [utterance.text for utterance in utterances]
+        workers = config.SETTINGS.max_workers
+        if config.ENABLE_PARALLEL and workers > 1 and len(texts) >= _PARALLEL_SPLIT_MIN:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                splits = list(zip(utterances, executor.map(_split_text, texts, chunksize=_SPLIT_CHUNKSIZE)))
+        else:
+            splits = list(zip(utterances, map(_split_text, texts)))
+        
+        # One urandom read for every id the split creates
+        ids = iter(_uuid4_batch(sum(len(s) for _, s in splits if len(s) > 1)))
         
         atomic_utterances = []
+        append = atomic_utterances.append
         
-        for utterance in utterances:
-            # Split on sentence boundaries
-            sentences = self._split_sentences(utterance.text)
-            
+        for utterance, sentences in splits:
             if len(sentences) <= 1:
-                # Already atomic
-                atomic_utterances.append(utterance)
-            else:
-                # Split into multiple utterances
-                for sentence in sentences:
-                    if sentence.strip():
-                        atomic_utt = Utterance(
-                            id=str(uuid.uuid4()),
-                            episode_id=utterance.episode_id,
-                            speaker=utterance.speaker,
-                            timestamp_start=utterance.timestamp_start,
-                            timestamp_end=utterance.timestamp_end,
-                            text=sentence.strip(),
-                            audio_snippet_uri=utterance.audio_snippet_uri
-                        )
-                        atomic_utterances.append(atomic_utt)
+                # Already atomic (no terminator, or a single sentence)
+                append(utterance)
+                continue
+            
+            # Split into multiple utterances
+            episode_id = utterance.episode_id
+            speaker = utterance.speaker
+            timestamp_start = utterance.timestamp_start
+            timestamp_end = utterance.timestamp_end
+            audio_snippet_uri = utterance.audio_snippet_uri
+            for sentence in sentences:
+                append(Utterance(
+                    id=next(ids),
+                    episode_id=episode_id,
+                    speaker=speaker,
+                    timestamp_start=timestamp_start,
+                    timestamp_end=timestamp_end,
+                    text=sentence,
+                    audio_snippet_uri=audio_snippet_uri
+                ))
         
-        logger.info(f"Split into {len(atomic_utterances)} atomic utterances")
+        logger.opt(lazy=True).info("Split into {} atomic utterances", lambda: len(atomic_utterances))
         
         return atomic_utterances
     
     def _split_sentences(self, text: str) -> List[str]:
-        """Split text into sentences."""
-        # Simple sentence splitting on . ! ?
-        # Could be enhanced with more sophisticated NLP
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s for s in sentences if s.strip()]
-
+        """Split text into stripped, non-empty sentences."""
+        return _split_sentences(text)
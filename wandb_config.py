@@ -1,6 +1,9 @@
 """
 Weights & Biases configuration and initialization for Belief Engine.
 """
+import os
+import stat
+import sys
 import wandb
 from typing import Optional, Dict, Any, List
 from pathlib import Path
@@ -11,6 +14,14 @@ import config
 # INITIALIZATION
 # ============================================================================
 
+# True between a successful initialize_wandb() and finish_wandb(); checked by
+# every helper instead of re-reading config and wandb.run on each call
+_ACTIVE = False
+
+def is_active() -> bool:
+    """Whether a W&B run started by initialize_wandb() is live."""
+    return _ACTIVE
+
 def initialize_wandb(
     episode_id: str,
     config_dict: Optional[Dict[str, Any]] = None,
@@ -31,7 +42,9 @@ def initialize_wandb(
     Returns:
         W&B run object or None if W&B disabled
     """
-    if not config.WANDB_ENABLED:
+    global _ACTIVE
+    
+    if not config.SETTINGS.wandb_enabled:
         logger.info("W&B logging disabled")
         return None
     
@@ -58,6 +71,7 @@ def initialize_wandb(
         logger.info(f"W&B run initialized: {run_name}")
         logger.info(f"W&B dashboard: {run.get_url()}")
         
+        _ACTIVE = run is not None
         return run
         
     except Exception as e:
@@ -85,8 +99,8 @@ def get_default_config() -> Dict[str, Any]:
         
         # Parallelization
         "enable_parallel": config.ENABLE_PARALLEL,
-        "max_workers": config.MAX_WORKERS,
-        "batch_size": config.BATCH_SIZE,
+        "max_workers": config.SETTINGS.max_workers,
+        "batch_size": config.SETTINGS.batch_size,
         "embedding_workers": config.EMBEDDING_WORKERS,
         "api_rate_limit_rpm": config.API_RATE_LIMIT_RPM,
         "api_rate_limit_tpm": config.API_RATE_LIMIT_TPM,
@@ -117,6 +131,7 @@ class MetricNames:
     
     # Pipeline Progress
     UTTERANCES_PARSED = "utterances_parsed"
+    UTTERANCES_SKIPPED = "utterances_skipped"
     BELIEFS_EXTRACTED = "beliefs_extracted"
     CANONICAL_BELIEFS_CREATED = "canonical_beliefs_created"
     CLUSTERS_CREATED = "clusters_created"
@@ -125,6 +140,7 @@ class MetricNames:
     # API Metrics
     API_CALLS_TOTAL = "api_calls_total"
     API_TOKENS_USED = "api_tokens_used"
+    API_CACHED_TOKENS = "api_cached_tokens"
     API_COST_USD = "api_cost_usd"
     API_LATENCY_AVG = "api_latency_avg"
     API_ERRORS = "api_errors"
@@ -156,6 +172,13 @@ class MetricNames:
     DRIFT_WEAKENING = "drift_weakening"
     DRIFT_REVERSAL = "drift_reversal"
 
+# Fixed slot per metric name, for list-backed accumulators
+METRIC_INDEX: Dict[str, int] = {
+    name: index
+    for index, name in enumerate(v for k, v in vars(MetricNames).items() if not k.startswith("_") and isinstance(v, str))
+}
+METRIC_COUNT = len(METRIC_INDEX)
+
 # ============================================================================
 # ARTIFACT TYPES
 # ============================================================================
@@ -170,11 +193,47 @@ class ArtifactTypes:
     REPORT = "report"
     LOG = "log"
     VISUALIZATION = "visualization"
+    BUNDLE = "bundle"
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Values wandb.log takes as-is; a dict of only these skips _make_metrics_safe
+_PLAIN_TYPES = frozenset((int, float, bool, str, type(None)))
+
+def _make_metrics_safe(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Materialize tensor metric values as Python scalars/lists.
+    
+    CUDA tensors are all copied to the host with non_blocking=True and the
+    stream is synchronized once, instead of one implicit sync per .item().
+    torch is never imported here; without it loaded no value can be a tensor.
+    
+    Args:
+        metrics: Metric dictionary
+    
+    Returns:
+        The same dict if every value is plain, else a converted copy
+    """
+    torch = sys.modules.get("torch")
+    if torch is None or all(type(value) in _PLAIN_TYPES for value in metrics.values()):
+        return metrics
+    
+    safe = dict(metrics)
+    copied = False
+    for key, value in safe.items():
+        if torch.is_tensor(value) and value.is_cuda:
+            safe[key] = value.detach().to("cpu", non_blocking=True)
+            copied = True
+    if copied:
+        torch.cuda.current_stream().synchronize()
+    
+    for key, value in safe.items():
+        if torch.is_tensor(value):
+            safe[key] = value.item() if value.numel() == 1 else value.tolist()
+    return safe
+
 def log_metrics(metrics: Dict[str, Any], step: Optional[int] = None):
     """
     Log metrics to W&B.
@@ -183,11 +242,33 @@ def log_metrics(metrics: Dict[str, Any], step: Optional[int] = None):
         metrics: Dictionary of metrics to log
         step: Optional step number
     """
-    if not config.WANDB_ENABLED or not wandb.run:
+    if not _ACTIVE:
+        return
+    
+    try:
+        wandb.log(_make_metrics_safe(metrics), step=step)
+    except Exception as e:
+        logger.error(f"Failed to log metrics to W&B: {e}")
+
+def log_metrics_batch(metrics_list: List[Dict[str, Any]], step: Optional[int] = None):
+    """
+    Merge several metric dicts and log them with a single wandb.log call.
+    
+    Later dicts win on duplicate keys, as with repeated logs within one step.
+    
+    Args:
+        metrics_list: Metric dictionaries, in logging order
+        step: Optional step number
+    """
+    if not metrics_list or not _ACTIVE:
         return
     
+    merged: Dict[str, Any] = {}
+    for metrics in metrics_list:
+        merged.update(metrics)
+    
     try:
-        wandb.log(metrics, step=step)
+        wandb.log(_make_metrics_safe(merged), step=step)
     except Exception as e:
         logger.error(f"Failed to log metrics to W&B: {e}")
 
@@ -200,7 +281,7 @@ def log_table(name: str, columns: List[str], data: List[List[Any]]):
         columns: Column names
         data: List of rows
     """
-    if not config.WANDB_ENABLED or not wandb.run:
+    if not _ACTIVE:
         return
     
     try:
@@ -209,12 +290,40 @@ def log_table(name: str, columns: List[str], data: List[List[Any]]):
     except Exception as e:
         logger.error(f"Failed to log table to W&B: {e}")
 
+def _add_path(
+    artifact: "wandb.Artifact",
+    path: Path,
+    st: os.stat_result,
+    name: Optional[str] = None,
+    by_reference: bool = False
+):
+    """
+    Add a file or directory to an artifact.
+    
+    With by_reference, large files are added as file:// references instead of
+    being copied into staging. Only for immutable outputs: a reference to a
+    file that is later rewritten, appended to or deleted no longer resolves.
+    """
+    if stat.S_ISDIR(st.st_mode):
+        artifact.add_dir(str(path), name=name)
+        return
+    
+    size = st.st_size
+    if by_reference and size >= config.SETTINGS.wandb_reference_artifact_bytes:
+        metadata = dict(artifact.metadata or {})
+        metadata["size_bytes"] = {**metadata.get("size_bytes", {}), name or path.name: size}
+        artifact.metadata = metadata
+        artifact.add_reference(path.resolve().as_uri(), name=name)
+    else:
+        artifact.add_file(str(path), name=name)
+
 def log_artifact(
     name: str,
     artifact_type: str,
     path: Path,
     description: Optional[str] = None,
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None,
+    by_reference: bool = False
 ):
     """
     Log an artifact to W&B.
@@ -222,11 +331,19 @@ def log_artifact(
     Args:
         name: Artifact name
         artifact_type: Artifact type (use ArtifactTypes)
-        path: Path to artifact file or directory
+        path: Path to artifact file or directory (skipped if missing)
         description: Optional description
         metadata: Optional metadata dictionary
+        by_reference: Reference large files instead of copying them (immutable outputs only)
     """
-    if not config.WANDB_ENABLED or not wandb.run:
+    if not _ACTIVE:
+        return
+    
+    # One stat answers both "does it exist" and "file or directory"
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        logger.debug(f"Artifact path does not exist, skipped: {path}")
         return
     
     try:
@@ -237,10 +354,7 @@ def log_artifact(
             metadata=metadata
         )
         
-        if path.is_dir():
-            artifact.add_dir(str(path))
-        else:
-            artifact.add_file(str(path))
+        _add_path(artifact, path, st, by_reference=by_reference)
         
         wandb.log_artifact(artifact)
         logger.info(f"Uploaded artifact: {name} ({artifact_type})")
@@ -248,6 +362,52 @@ def log_artifact(
     except Exception as e:
         logger.error(f"Failed to log artifact to W&B: {e}")
 
+def log_artifact_bundle(
+    name: str,
+    artifact_type: str,
+    paths: Dict[str, Path],
+    description: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None
+):
+    """
+    Log several files or directories as one W&B artifact version.
+    
+    Args:
+        name: Artifact name
+        artifact_type: Artifact type (use ArtifactTypes)
+        paths: Entry name within the artifact → local path (missing paths are skipped)
+        description: Optional description
+        metadata: Optional metadata dictionary
+    """
+    if not _ACTIVE:
+        return
+    
+    entries = []
+    for entry_name, path in paths.items():
+        try:
+            entries.append((entry_name, path, path.stat()))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    if not entries:
+        return
+    
+    try:
+        artifact = wandb.Artifact(
+            name=name,
+            type=artifact_type,
+            description=description,
+            metadata=metadata
+        )
+        
+        for entry_name, path, st in entries:
+            _add_path(artifact, path, st, name=entry_name)
+        
+        wandb.log_artifact(artifact)
+        logger.info(f"Uploaded artifact bundle: {name} ({artifact_type}) | files={len(entries)}")
+        
+    except Exception as e:
+        logger.error(f"Failed to log artifact bundle to W&B: {e}")
+
 def log_alert(title: str, text: str, level: str = "WARN"):
     """
     Log an alert to W&B.
@@ -257,7 +417,7 @@ def log_alert(title: str, text: str, level: str = "WARN"):
         text: Alert message
         level: Alert level (INFO, WARN, ERROR)
     """
-    if not config.WANDB_ENABLED or not wandb.run:
+    if not _ACTIVE:
         return
     
     try:
@@ -272,7 +432,9 @@ def finish_wandb(exit_code: int = 0):
     Args:
         exit_code: Exit code (0 for success, non-zero for failure)
     """
-    if not config.WANDB_ENABLED or not wandb.run:
+    global _ACTIVE
+    
+    if not _ACTIVE:
         return
     
     try:
@@ -280,6 +442,8 @@ def finish_wandb(exit_code: int = 0):
         logger.info("W&B run finished")
     except Exception as e:
         logger.error(f"Failed to finish W&B run: {e}")
+    finally:
+        _ACTIVE = False
 
 # ============================================================================
 # SUMMARY HELPERS
@@ -293,7 +457,7 @@ def update_summary(key: str, value: Any):
         key: Summary key
         value: Summary value
     """
-    if not config.WANDB_ENABLED or not wandb.run:
+    if not _ACTIVE:
         return
     
     try:
@@ -307,12 +471,17 @@ def update_summary(key: str, value: Any):
 
 __all__ = [
     "initialize_wandb",
+    "is_active",
     "get_default_config",
     "MetricNames",
+    "METRIC_INDEX",
+    "METRIC_COUNT",
     "ArtifactTypes",
     "log_metrics",
+    "log_metrics_batch",
     "log_table",
     "log_artifact",
+    "log_artifact_bundle",
     "log_alert",
     "finish_wandb",
     "update_summary"